@@ -12,7 +12,7 @@ source vepeer/bin/activate
 
 # Exécuter l'API
 echo "Démarrage de l'API sur http://localhost:8000..."
-uvicorn peer.interfaces.api.api:app --host 0.0.0.0 --port 8000
+python -c "from peer.interfaces.api.api import start_server; start_server(port=8000)"
 
 # Désactiver l'environnement virtuel à la fin
 deactivate
@@ -53,8 +53,13 @@ class PeerDaemon(CoreAPI):
         self.sessions: Dict[str, Dict[str, Any]] = {}
         self.session_lock = threading.Lock()
         
-        # Command capabilities registry
-        self.capabilities = self._register_capabilities()
+        # Command capabilities registry, filled only through register_capability
+        self.capabilities: Dict[str, CommandCapability] = {}
+        # Incremented on every registry change, so callers can invalidate
+        # anything they derived from it
+        self.capabilities_version = 0
+        for name, capability in self._register_capabilities().items():
+            self.register_capability(name, capability)
         
         # Cluster management (optional)
         self.cluster_manager: Optional[ClusterManager] = None
@@ -205,6 +210,17 @@ class PeerDaemon(CoreAPI):
         
         return capabilities
     
+    def register_capability(self, name: str, capability: CommandCapability):
+        """
+        Register (or replace) a command capability.
+        
+        Args:
+            name: Command name in the registry
+            capability: Capability description
+        """
+        self.capabilities[name] = capability
+        self.capabilities_version += 1
+    
     def execute_command(self, request: CoreRequest) -> CoreResponse:
         """
         Execute a command and return response.
@@ -613,6 +629,11 @@ class PeerDaemon(CoreAPI):
         self.logger.info(f"Created session {session_id} for {interface_type.value}")
         return session_id
     
+    def session_valid(self, session_id: Optional[str]) -> bool:
+        """Check whether a session is still open"""
+        with self.session_lock:
+            return session_id in self.sessions
+    
     def end_session(self, session_id: str) -> bool:
         """End a session"""
         with self.session_lock:
@@ -2,7 +2,8 @@
 Module contenant les services du domaine pour la gestion des messages.
 """
 
-from typing import List, Optional
+from collections import deque
+from typing import Deque, List, Optional
 
 from peer.domain.entities.message_entities import Message, MessageType
 from peer.domain.ports.tts_port import TTSPort
@@ -16,15 +17,17 @@ class MessageService:
     y compris la génération du message de bienvenue et la vocalisation.
     """
     
-    def __init__(self, tts_service: Optional[TTSPort] = None):
+    def __init__(self, tts_service: Optional[TTSPort] = None, max_history: int = 1000):
         """
         Initialise le service de messages.
         
         Args:
             tts_service: Service de synthèse vocale (optionnel)
+            max_history: Nombre maximal de messages conservés dans l'historique
         """
         self.tts_service = tts_service
-        self.messages: List[Message] = []
+        # Historique borné : les messages les plus anciens sont évincés automatiquement
+        self.messages: Deque[Message] = deque(maxlen=max_history)
     
     def get_welcome_message(self) -> Message:
         """
@@ -44,11 +47,14 @@ class MessageService:
         """
         Vocalise un message si le service TTS est disponible.
         
+        La vocalisation est planifiée par le service TTS et ne bloque pas
+        l'appelant pendant la lecture audio.
+        
         Args:
             message: Message à vocaliser
             
         Returns:
-            True si la vocalisation a réussi, False sinon
+            True si la vocalisation a été planifiée, False sinon
         """
         if not message.should_vocalize or self.tts_service is None:
             return False
@@ -71,6 +77,6 @@ class MessageService:
         Récupère tous les messages de l'historique.
         
         Returns:
-            Liste des messages
+            Copie de la liste des messages (instantané de l'historique)
         """
-        return self.messages
+        return list(self.messages)
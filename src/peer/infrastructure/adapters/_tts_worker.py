@@ -0,0 +1,165 @@
+"""
+Processus de vocalisation persistant utilisé par SimpleTTSAdapter.
+
+Lancé avec ``python -m peer.infrastructure.adapters._tts_worker`` afin de
+profiter du bytecode compilé (.pyc) à chaque démarrage.
+
+Le moteur pyttsx3 est initialisé une seule fois, puis chaque ligne JSON reçue
+sur l'entrée standard est traitée :
+
+    {"text": "...", "rate": 150, "volume": 1.0, "out": "/chemin/fichier.wav"}
+
+Sans clé "out", le texte est prononcé directement ; sinon il est synthétisé
+dans le fichier indiqué. Plusieurs textes peuvent être synthétisés en une seule
+session du moteur :
+
+    {"batch": [{"text": "...", "out": "..."}, ...], "rate": 150, "volume": 1.0}
+
+Une ligne "OK" ou "ERR <message>" est renvoyée sur la sortie standard pour
+chaque requête.
+"""
+
+import json
+import os
+import re
+import signal
+import sys
+
+# Voix retenue lors d'une exécution précédente : évite de parcourir la liste
+# des voix installées (lente sur macOS et Windows) à chaque démarrage
+VOICE_CONFIG_PATH = os.path.expanduser("~/.peer/tts_voice.json")
+
+
+# Critères de choix de la voix, par ordre de priorité : (motif, champ examiné).
+# Une voix explicitement française est préférée à un simple identifiant "fr".
+VOICE_PRIORITIES = (
+    (re.compile(r"french|fran[cç]ais|fr[_-]fr", re.IGNORECASE), "name"),
+    (re.compile(r"french|fran[cç]ais|fr[_-]fr", re.IGNORECASE), "id"),
+    (re.compile(r"fr", re.IGNORECASE), "id"),
+)
+
+
+def signal_handler(signum, frame):
+    '''Gestionnaire de signal pour arrêt gracieux'''
+    sys.exit(0)
+
+
+def _load_voice_id():
+    """Lit l'identifiant de voix mémorisé, s'il existe."""
+    try:
+        with open(VOICE_CONFIG_PATH, encoding="utf-8") as f:
+            return json.load(f).get("voice_id")
+    except (OSError, ValueError):
+        return None
+
+
+def _save_voice_id(voice_id):
+    """Mémorise l'identifiant de voix choisi."""
+    try:
+        os.makedirs(os.path.dirname(VOICE_CONFIG_PATH), exist_ok=True)
+        with open(VOICE_CONFIG_PATH, "w", encoding="utf-8") as f:
+            json.dump({"voice_id": voice_id}, f)
+    except OSError:
+        pass
+
+
+def _select_voice(engine):
+    """Sélectionne une voix française si disponible."""
+    voice_id = _load_voice_id()
+    if voice_id:
+        try:
+            engine.setProperty('voice', voice_id)
+            return
+        except Exception:
+            # Voix désinstallée depuis : nouvelle recherche
+            pass
+
+    voices = engine.getProperty('voices')
+    for pattern, field in VOICE_PRIORITIES:
+        for voice in voices:
+            if pattern.search(getattr(voice, field, None) or ""):
+                engine.setProperty('voice', voice.id)
+                _save_voice_id(voice.id)
+                return
+
+
+def speak(engine, text):
+    """Prononce un texte directement."""
+    engine.say(text)
+    engine.runAndWait()
+
+
+def synthesize_to_file(engine, text, out):
+    """Synthétise un texte dans un fichier audio."""
+    engine.save_to_file(text, out)
+    engine.runAndWait()
+
+
+def synthesize_batch(engine, items):
+    """Synthétise plusieurs textes dans leurs fichiers avec un seul runAndWait()."""
+    for item in items:
+        engine.save_to_file(item['text'], item['out'])
+    engine.runAndWait()
+
+
+def serve(engine, reply):
+    """Traite les requêtes JSON reçues sur l'entrée standard jusqu'à sa fermeture."""
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            req = json.loads(line)
+            engine.setProperty('rate', req.get('rate', 150))
+            engine.setProperty('volume', req.get('volume', 1.0))
+            if req.get('batch'):
+                synthesize_batch(engine, req['batch'])
+            elif req.get('out'):
+                synthesize_to_file(engine, req['text'], req['out'])
+            else:
+                speak(engine, req['text'])
+            reply("OK")
+        except Exception as e:
+            reply(f"ERR {e}")
+
+
+def main(argv):
+    """
+    Point d'entrée du processus.
+    
+    Sans argument, sert les requêtes de l'adaptateur sur l'entrée standard.
+    Utilisable aussi ponctuellement :
+        python -m peer.infrastructure.adapters._tts_worker speak <texte>
+        python -m peer.infrastructure.adapters._tts_worker synth <texte> <fichier>
+    """
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+    # La sortie standard est réservée au protocole : tout affichage parasite
+    # (pilotes TTS, bibliothèques) est redirigé vers la sortie d'erreur
+    protocol_out = sys.stdout
+    sys.stdout = sys.stderr
+
+    def reply(status):
+        protocol_out.write(status + "\n")
+        protocol_out.flush()
+
+    try:
+        import pyttsx3
+        engine = pyttsx3.init()
+        _select_voice(engine)
+    except Exception as e:
+        reply(f"ERR {e}")
+        return 1
+
+    if len(argv) >= 2 and argv[0] == "speak":
+        speak(engine, argv[1])
+    elif len(argv) >= 3 and argv[0] == "synth":
+        synthesize_to_file(engine, argv[1], argv[2])
+    else:
+        serve(engine, reply)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
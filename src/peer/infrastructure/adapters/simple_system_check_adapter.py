@@ -12,6 +12,17 @@ from peer.domain.ports.system_check_port import SystemCheckPort
 
 logger = logging.getLogger(__name__)
 
+# Informations système immuables pendant toute la durée de vie du processus :
+# calculées une seule fois à l'import (platform.processor() peut lire /proc/cpuinfo
+# ou lancer un sous-processus selon la plateforme).
+_SYS_INFO: Dict[str, Any] = {
+    "status": True,
+    "platform": platform.system(),
+    "version": platform.version(),
+    "processor": platform.processor(),
+    "message": "Informations système disponibles"
+}
+
 
 class SimpleSystemCheckAdapter(SystemCheckPort):
     """
@@ -88,10 +99,5 @@ class SimpleSystemCheckAdapter(SystemCheckPort):
         Returns:
             Dictionnaire contenant les informations système
         """
-        return {
-            "status": True,
-            "platform": platform.system(),
-            "version": platform.version(),
-            "processor": platform.processor(),
-            "message": "Informations système disponibles"
-        }
+        # Copie pour que les appelants ne puissent pas altérer la constante partagée
+        return _SYS_INFO.copy()
@@ -2,13 +2,27 @@
 Module contenant l'adaptateur TTS simple pour Peer.
 """
 
+import atexit
+import functools
+import hashlib
+import importlib.util
+import json
+import re
+import shutil
 import threading
 import logging
+import queue
 import sys
 import os
 import subprocess
 import tempfile
-from typing import Optional
+import wave
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from peer.domain.ports.tts_port import TTSPort
+from peer.infrastructure.adapters._tts_worker import _load_voice_id
 
 # Configuration du logging
 logging.basicConfig(
@@ -19,112 +33,820 @@ logging.basicConfig(
     ]
 )
 
-class SimpleTTSAdapter:
+# Disponibilité de pyttsx3 vérifiée une seule fois, sans importer le module :
+# le moteur n'est chargé que dans le processus de vocalisation
+_HAS_PYTTSX3 = importlib.util.find_spec("pyttsx3") is not None
+
+# Répertoire persistant des fichiers audio déjà synthétisés
+TTS_CACHE_DIR = os.path.expanduser("~/.peer/tts_cache")
+
+# Lecteurs audio en ligne de commande, par ordre de préférence, avec leurs options
+_AUDIO_PLAYERS = {
+    "afplay": (),
+    "paplay": (),
+    "aplay": ("-q",),
+    "ffplay": ("-nodisp", "-autoexit", "-loglevel", "quiet"),
+}
+
+# Un texte n'est vocalisé que s'il contient au moins un caractère de mot
+_SPEAKABLE_RE = re.compile(r"\w")
+
+# Espaces consécutifs, ramenés à un seul dans les clés de cache
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Longueur maximale d'un texte accepté pour la vocalisation
+_MAX_TEXT_LENGTH = 10000
+
+# Nombre de trames audio copiées à la fois lors de la concaténation de fichiers WAV
+_WAV_BLOCK_FRAMES = 4096
+
+# Processus de vocalisation persistant (voir _tts_worker.py), lancé comme module
+_WORKER_MODULE = "peer.infrastructure.adapters._tts_worker"
+
+# Racine contenant le package peer, transmise au processus pour qu'il puisse
+# importer le module même sans installation du package
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+# Délai maximal accordé au processus pour traiter une requête (messages longs)
+_WORKER_TIMEOUT = 60.0
+
+# Types de demandes de la file TTS
+_MODE_SEQUENCE = "sequence"  # Textes lus l'un après l'autre, synthèse anticipée
+_MODE_BATCH = "batch"        # Textes synthétisés en un seul lot puis lus
+_MODE_PRELOAD = "preload"    # Textes synthétisés dans le cache, sans lecture
+
+
+class _SpeechDone(threading.Event):
+    """Fin d'une demande de vocalisation, avec son issue (succeeded) fixée avant set()."""
+    
+    def __init__(self):
+        super().__init__()
+        self.succeeded = False
+    
+    def finish(self, succeeded: bool):
+        """Enregistre l'issue de la demande puis réveille l'appelant qui l'attend."""
+        self.succeeded = succeeded
+        self.set()
+
+
+class SimpleTTSAdapter(TTSPort):
     """
     Adaptateur TTS simple utilisant pyttsx3 avec isolation de processus.
-    Gère la synthèse vocale en créant un processus séparé pour chaque vocalisation,
-    éliminant complètement le problème 'run loop already started'.
+    Gère la synthèse vocale dans un processus séparé et persistant, ce qui élimine
+    complètement le problème 'run loop already started' sans relancer un
+    interpréteur ni réinitialiser le moteur à chaque vocalisation.
+    
+    Les demandes de vocalisation sont placées dans une file et traitées par un
+    thread d'arrière-plan : l'appelant n'est jamais bloqué par la lecture audio.
     """
     
-    def __init__(self):
-        """Initialise l'adaptateur TTS."""
+    def __init__(self, max_pending: int = 32, cache_size: int = 512):
+        """
+        Initialise l'adaptateur TTS.
+        
+        Args:
+            max_pending: Nombre maximal de vocalisations en attente (0 = illimité).
+                Au-delà, la plus ancienne demande en attente est abandonnée.
+            cache_size: Nombre d'entrées gardées en mémoire dans le cache de synthèse
+        """
         self.logger = logging.getLogger("SimpleTTSAdapter")
-        self.tts_lock = threading.Lock()
         self.speaking = False
+        self.rate = 150
+        self.volume = 1.0
         self._test_tts_availability()
+        
+        # Cache de synthèse à deux niveaux : LRU en mémoire (clé -> chemin) et
+        # fichiers audio sur disque qui survivent aux redémarrages
+        self.audio_player = self._detect_audio_player()
+        # Commande de lecture résolue une fois pour toutes
+        self._play_cmd = [self.audio_player, *_AUDIO_PLAYERS[self.audio_player]] if self.audio_player else None
+        self._current_player: Optional[subprocess.Popen] = None
+        
+        # Sur macOS, la commande native "say" synthétise et joue en un seul processus
+        self.macos_voice = "Thomas"
+        self._say_path = shutil.which("say") if sys.platform == "darwin" else None
+        # Processus "say" lancé à l'avance, en attente du texte sur son entrée
+        # standard : le fork+exec n'est plus sur le chemin de la vocalisation
+        self._say_spare: Optional[subprocess.Popen] = None
+        self._say_spare_cmd: Optional[List[str]] = None
+        self._stopped_player: Optional[subprocess.Popen] = None
+        self._cache_size = cache_size
+        # Voix retenue par le processus de vocalisation (voir _tts_worker._select_voice) :
+        # un changement de voix ne doit pas resservir les fichiers de l'ancienne
+        self._voice_id = _load_voice_id()
+        self._audio_cache: "OrderedDict[str, str]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Processus de vocalisation persistant, démarré une seule fois et relancé
+        # automatiquement s'il se termine
+        self._worker: Optional[subprocess.Popen] = None
+        self._worker_lock = threading.Lock()
+        self.initialize()
+        atexit.register(self._stop_worker)
+        
+        # File de vocalisation consommée par un unique thread dédié : l'ordre FIFO
+        # et l'exclusion mutuelle sont garantis sans verrou côté producteurs
+        self._tts_queue: "queue.Queue[Tuple[Tuple[str, ...], Optional[_SpeechDone], str]]" = queue.Queue(maxsize=max_pending)
+        self._tts_thread = threading.Thread(target=self._tts_loop, name="PeerTTS", daemon=True)
+        self._tts_thread.start()
     
     def _test_tts_availability(self):
         """Teste la disponibilité du TTS."""
-        try:
-            import pyttsx3
+        self.tts_available = _HAS_PYTTSX3
+        if self.tts_available:
             self.logger.info("Module pyttsx3 disponible")
-            self.tts_available = True
-        except ImportError as e:
-            self.logger.error(f"Module pyttsx3 non disponible: {e}")
-            self.tts_available = False
+        else:
+            self.logger.error("Module pyttsx3 non disponible")
+    
+    def initialize(self) -> bool:
+        """
+        Démarre le processus de vocalisation s'il n'est pas déjà actif.
+        
+        Returns:
+            True si le service est prêt, False sinon
+        """
+        if not self.tts_available:
+            return False
+        with self._worker_lock:
+            if self._worker is None or self._worker.poll() is not None:
+                self._start_worker()
+        return True
+    
+    def is_available(self) -> bool:
+        """
+        Vérifie si le service de synthèse vocale est disponible.
+        
+        Returns:
+            True si pyttsx3 est installé, False sinon
+        """
+        return self.tts_available
+    
+    def speak(self, text: str, wait: bool = False, timeout: Optional[float] = None) -> bool:
+        """
+        Planifie la vocalisation d'un texte sans bloquer l'appelant.
+        
+        Args:
+            text: Texte à vocaliser
+            wait: Si True, attend la fin de la vocalisation avant de rendre la main
+            timeout: Délai maximal d'attente en secondes lorsque wait est True
+                (None pour attendre sans limite)
+            
+        Returns:
+            True si le texte a été pris en charge (et effectivement vocalisé dans
+            le délai imparti si wait est True), False sinon
+        """
+        if not self._is_speakable(text):
+            return False
+        return self._submit((text,), _MODE_SEQUENCE, wait, timeout)
+    
+    def _submit(self, texts: Tuple[str, ...], mode: str, wait: bool, timeout: Optional[float]) -> bool:
+        """
+        Place une demande dans la file et, si wait est True, attend son issue.
+        
+        Returns:
+            True si la demande a été prise en charge, et si wait est True, menée à
+            bien dans le délai (ni abandonnée, ni en échec), False sinon
+        """
+        done = _SpeechDone() if wait else None
+        self._enqueue((texts, done, mode))
+        if done is None:
+            return True
+        if not done.wait(timeout):
+            self.logger.error(f"Délai de vocalisation dépassé ({timeout}s): {texts[0][:50]}...")
+            return False
+        return done.succeeded
+    
+    def speak_stream(self, texts: Iterable[str], wait: bool = False, timeout: Optional[float] = None) -> bool:
+        """
+        Planifie la vocalisation d'une suite de textes (phrases d'une même réponse).
+        
+        Lorsque le cache de synthèse est actif, la synthèse du texte suivant est
+        lancée pendant la lecture du texte courant, ce qui supprime le silence
+        entre deux phrases.
+        
+        Args:
+            texts: Textes à vocaliser, dans l'ordre
+            wait: Si True, attend la fin de la vocalisation avant de rendre la main
+            timeout: Délai maximal d'attente en secondes lorsque wait est True
+                (None pour attendre sans limite)
+            
+        Returns:
+            True si au moins un texte a été pris en charge (et tous vocalisés dans
+            le délai imparti si wait est True), False sinon
+        """
+        chunks = tuple(text for text in texts if self._is_speakable(text))
+        if not chunks:
+            return False
+        return self._submit(chunks, _MODE_SEQUENCE, wait, timeout)
+    
+    def speak_many(self, texts: Iterable[str], wait: bool = False, timeout: Optional[float] = None) -> bool:
+        """
+        Planifie la vocalisation d'une liste de textes synthétisés en un seul lot.
+        
+        Lorsque le cache de synthèse est actif, tous les textes absents du cache
+        sont synthétisés dans une même session du moteur, puis lus dans l'ordre.
+        
+        Args:
+            texts: Textes à vocaliser, dans l'ordre
+            wait: Si True, attend la fin de la vocalisation avant de rendre la main
+            timeout: Délai maximal d'attente en secondes lorsque wait est True
+                (None pour attendre sans limite)
+            
+        Returns:
+            True si au moins un texte a été pris en charge (et tous vocalisés dans
+            le délai imparti si wait est True), False sinon
+        """
+        chunks = tuple(text for text in texts if self._is_speakable(text))
+        if not chunks:
+            return False
+        return self._submit(chunks, _MODE_BATCH, wait, timeout)
     
-    def speak(self, text: str):
+    def preload(self, texts: Iterable[str]) -> bool:
+        """
+        Planifie la synthèse dans le cache de phrases qui seront prononcées plus
+        tard (messages récurrents), sans les lire.
+        
+        La synthèse passe par la file TTS, dans l'ordre d'arrivée : une
+        vocalisation déjà en file passe avant elle, mais une vocalisation demandée
+        ensuite attend la fin de la synthèse. À appeler une fois les premières
+        vocalisations planifiées ; les suivantes trouvent les fichiers déjà prêts.
+        
+        Args:
+            texts: Textes à synthétiser
+            
+        Returns:
+            True si la synthèse a été planifiée, False si le cache n'est pas utilisé
+        """
+        chunks = tuple(text for text in texts if self._is_speakable(text))
+        if not chunks or not self.tts_available or not self.audio_player or self._say_path:
+            return False
+        
+        self._enqueue((chunks, None, _MODE_PRELOAD))
+        return True
+    
+    def _preload_audio(self, texts: Tuple[str, ...]):
+        """Synthétise dans le cache les textes qui n'y sont pas encore."""
+        paths = self._get_cached_audio_batch(texts)
+        self.logger.info(f"Phrases préchargées dans le cache: {sum(1 for p in paths if p)}/{len(texts)}")
+    
+    def _is_speakable(self, text: str) -> bool:
+        """
+        Vérifie qu'un texte mérite une vocalisation.
+        
+        Les textes vides, composés uniquement d'espaces ou de ponctuation sont
+        ignorés sans solliciter la file ni le moteur, de même que les textes
+        démesurément longs.
+        """
+        if not text or not _SPEAKABLE_RE.search(text):
+            return False
+        if len(text) > _MAX_TEXT_LENGTH:
+            self.logger.warning(f"Texte trop long pour la vocalisation ({len(text)} caractères), ignoré")
+            return False
+        return True
+    
+    def _enqueue(self, item: Tuple[Tuple[str, ...], Optional[_SpeechDone], str]):
+        """Ajoute une demande à la file en abandonnant la plus ancienne si elle est pleine."""
+        while True:
+            try:
+                self._tts_queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    dropped_texts, dropped_done, _ = self._tts_queue.get_nowait()
+                except queue.Empty:
+                    continue
+                self._tts_queue.task_done()
+                self.logger.warning(f"File TTS pleine, vocalisation abandonnée: {dropped_texts[0][:50]}...")
+                if dropped_done is not None:
+                    dropped_done.finish(False)
+    
+    def _tts_loop(self):
+        """Boucle du thread TTS : vide la file de vocalisation dans l'ordre d'arrivée."""
+        while True:
+            texts, done, mode = self._tts_queue.get()
+            self.speaking = mode != _MODE_PRELOAD
+            succeeded = False
+            try:
+                if mode == _MODE_PRELOAD:
+                    self._preload_audio(texts)
+                    succeeded = True
+                elif mode == _MODE_BATCH:
+                    succeeded = self._speak_batch(texts)
+                else:
+                    succeeded = self._speak_sequence(texts)
+            except Exception as e:
+                self.logger.error(f"Erreur inattendue dans le thread TTS: {e}")
+            finally:
+                self.speaking = False
+                if done is not None:
+                    done.finish(succeeded)
+                self._tts_queue.task_done()
+    
+    def _speak_sequence(self, texts: Tuple[str, ...]) -> bool:
+        """
+        Vocalise une suite de textes en préparant le suivant pendant la lecture.
+        
+        Un seul thread de synthèse est utilisé car pyttsx3 n'est pas réentrant.
+        
+        Args:
+            texts: Textes à vocaliser, dans l'ordre
+            
+        Returns:
+            True si tous les textes ont été vocalisés
+        """
+        if len(texts) == 1 or not self.tts_available or not self.audio_player or self._say_path:
+            return all([self._speak_now(text) for text in texts])
+        
+        succeeded = True
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="PeerTTSPrefetch") as pool:
+            future = pool.submit(self._get_cached_audio, texts[0])
+            for i, text in enumerate(texts):
+                try:
+                    audio_path = future.result()
+                except Exception as e:
+                    self.logger.error(f"Erreur lors de la synthèse anticipée: {e}")
+                    audio_path = None
+                if i + 1 < len(texts):
+                    future = pool.submit(self._get_cached_audio, texts[i + 1])
+                
+                # La lecture précédente se termine pendant que le texte courant était préparé
+                succeeded &= self.wait_playback()
+                succeeded &= self._play_or_speak(text, audio_path, wait=False)
+            succeeded &= self.wait_playback()
+        return succeeded
+    
+    def _speak_batch(self, texts: Tuple[str, ...]) -> bool:
+        """
+        Vocalise une liste de textes après les avoir synthétisés en un seul lot.
+        
+        Args:
+            texts: Textes à vocaliser, dans l'ordre
+            
+        Returns:
+            True si tous les textes ont été vocalisés
+        """
+        if len(texts) == 1 or not self.tts_available or not self.audio_player or self._say_path:
+            return all([self._speak_now(text) for text in texts])
+        
+        audio_paths = self._get_cached_audio_batch(texts)
+        
+        # Lecture en une seule fois si tous les fichiers peuvent être concaténés
+        if all(audio_paths):
+            combined = self._concat_wavs(audio_paths)
+            if combined:
+                try:
+                    if self._play_audio_file(combined):
+                        self.logger.info(f"Textes vocalisés ({len(texts)}): {texts[0][:50]}...")
+                        return True
+                finally:
+                    os.unlink(combined)
+        
+        return all([self._play_or_speak(text, audio_path) for text, audio_path in zip(texts, audio_paths)])
+    
+    def _speak_now(self, text: str) -> bool:
         """
         Vocalise un texte en utilisant un processus séparé pour éviter les conflits.
         
+        Sur macOS, la commande native "say" est utilisée en priorité. Sinon, si un
+        lecteur audio est disponible, la synthèse passe par le cache : une phrase
+        déjà prononcée est relue directement depuis son fichier audio.
+        
         Args:
             text: Texte à vocaliser
+            
+        Returns:
+            True si le texte a été vocalisé
         """
-        if not text:
-            return
+        if self._say_path and self._speak_macos_say(text):
+            self.logger.info(f"Texte vocalisé: {text[:50]}...")
+            return True
         
         if not self.tts_available:
             self.logger.warning("TTS non disponible")
             print(f"TTS (non disponible): {text}")
+            return False
+        
+        try:
+            audio_path = self._get_cached_audio(text) if self.audio_player else None
+            return self._play_or_speak(text, audio_path)
+        except Exception as e:
+            self.logger.error(f"Erreur lors de la vocalisation: {e}")
+            print(f"TTS (erreur): {text}")
+            return False
+    
+    def _speak_macos_say(self, text: str) -> bool:
+        """
+        Vocalise un texte avec la commande native macOS "say", sans fichier
+        intermédiaire ni processus de lecture séparé.
+        
+        Le texte est écrit sur l'entrée standard d'un processus "say" démarré à
+        l'avance ; le processus suivant est lancé pendant la vocalisation.
+        
+        Args:
+            text: Texte à vocaliser
+            
+        Returns:
+            True si la vocalisation a réussi, False sinon
+        """
+        cmd = [self._say_path, "-v", self.macos_voice, "-r", str(self.rate)]
+        proc, self._say_spare = self._say_spare, None
+        if proc is not None and (proc.poll() is not None or self._say_spare_cmd != cmd):
+            # Processus terminé entre-temps, ou voix/débit modifiés depuis son lancement
+            self._discard_say(proc)
+            proc = None
+        
+        try:
+            if proc is None:
+                proc = self._spawn_say(cmd)
+            proc.stdin.write(text)
+            proc.stdin.close()
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Erreur lors de l'exécution de say: {e}")
+            if proc is not None:
+                self._discard_say(proc)
+            return False
+        
+        self._current_player = proc
+        try:
+            self._say_spare = self._spawn_say(cmd)
+            self._say_spare_cmd = cmd
+        except OSError:
+            self._say_spare = None
+        return self.wait_playback()
+    
+    @staticmethod
+    def _spawn_say(cmd: List[str]) -> subprocess.Popen:
+        """Lance un processus "say" qui lira son texte sur l'entrée standard."""
+        return subprocess.Popen(cmd, stdin=subprocess.PIPE, text=True, encoding="utf-8")
+    
+    @staticmethod
+    def _discard_say(proc: subprocess.Popen):
+        """Arrête un processus "say" inutilisé."""
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+    
+    def _play_or_speak(self, text: str, audio_path: Optional[str], wait: bool = True) -> bool:
+        """
+        Joue le fichier audio d'un texte, ou le fait prononcer directement par le
+        processus persistant si aucun fichier n'est disponible.
+        
+        Args:
+            text: Texte à vocaliser
+            audio_path: Fichier audio déjà synthétisé (None si absent)
+            wait: Si False, ne pas attendre la fin de la lecture du fichier
+            
+        Returns:
+            True si le texte a été joué (ou lancé, si wait est False) ou prononcé
+        """
+        if audio_path and self._play_audio_file(audio_path, wait=wait):
+            self.logger.info(f"Texte vocalisé: {text[:50]}...")
+            return True
+        if self._worker_request(text):
+            self.logger.info(f"Texte vocalisé: {text[:50]}...")
+            return True
+        print(f"TTS (erreur): {text}")
+        return False
+    
+    def shutdown(self) -> bool:
+        """
+        Libère le processus de vocalisation.
+        
+        Le moteur reste initialisé entre deux vocalisations : c'est le seul point
+        où il est arrêté, en dehors de la sortie du programme.
+        
+        Returns:
+            True si l'arrêt a réussi
+        """
+        with self._worker_lock:
+            self._stop_worker()
+        spare, self._say_spare = self._say_spare, None
+        if spare is not None:
+            self._discard_say(spare)
+        self.logger.info("Adaptateur TTS arrêté")
+        return True
+    
+    def _start_worker(self):
+        """Démarre le processus de vocalisation persistant."""
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (_PACKAGE_ROOT, env.get("PYTHONPATH")) if p
+        )
+        # Utiliser le même interpréteur Python que celui en cours d'exécution
+        self._worker = subprocess.Popen(
+            [sys.executable, "-u", "-m", _WORKER_MODULE],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            env=env
+        )
+        self.logger.info(f"Processus TTS démarré (pid {self._worker.pid})")
+    
+    def _stop_worker(self):
+        """Arrête le processus de vocalisation persistant."""
+        worker, self._worker = self._worker, None
+        if worker is None or worker.poll() is not None:
             return
+        try:
+            worker.stdin.close()
+            worker.wait(timeout=2)
+        except Exception:
+            worker.kill()
+    
+    def _worker_request(self, text: str, out: Optional[str] = None) -> bool:
+        """
+        Demande au processus persistant de vocaliser un texte.
         
-        # Acquérir le verrou pour éviter les vocalisations simultanées
-        with self.tts_lock:
-            try:
-                self.speaking = True
+        Args:
+            text: Texte à vocaliser
+            out: Fichier audio de sortie (None pour une lecture directe)
+            
+        Returns:
+            True si la requête a abouti, False sinon
+        """
+        request: Dict[str, Any] = {"text": text}
+        if out:
+            request["out"] = out
+        return self._worker_call(request)
+    
+    def _worker_call(self, request: Dict[str, Any], timeout: float = _WORKER_TIMEOUT) -> bool:
+        """
+        Envoie une requête au processus persistant et attend sa réponse.
+        
+        Le processus est relancé s'il s'est terminé, et tué s'il ne répond pas
+        dans le délai imparti. La requête n'est renvoyée qu'une fois, et
+        seulement si le processus était déjà mort avant de la recevoir : une
+        requête commencée (peut-être déjà à moitié prononcée) n'est jamais rejouée.
+        
+        Args:
+            request: Requête du protocole (voir _tts_worker.py)
+            timeout: Délai maximal de traitement, en secondes
+            
+        Returns:
+            True si la requête a abouti, False sinon
+        """
+        request = dict(request, rate=self.rate, volume=self.volume)
+        
+        with self._worker_lock:
+            for attempt in range(2):
+                if self._worker is None or self._worker.poll() is not None:
+                    self._start_worker()
+                worker = self._worker
                 
-                # Créer un script Python temporaire pour la vocalisation
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                    script_path = f.name
-                    f.write("""
-import sys
-import signal
-import pyttsx3
-
-def signal_handler(signum, frame):
-    '''Gestionnaire de signal pour arrêt gracieux'''
-    print("TTS subprocess interrupted gracefully")
-    sys.exit(0)
-
-def speak(text):
-    # Installer le gestionnaire de signal pour KeyboardInterrupt
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
-    try:
-        engine = pyttsx3.init()
-        engine.setProperty('rate', 150)
-        engine.setProperty('volume', 1.0)
-        
-        # Sélectionner une voix française si disponible
-        voices = engine.getProperty('voices')
-        for voice in voices:
-            if 'french' in voice.name.lower() or 'fr' in voice.id.lower():
-                engine.setProperty('voice', voice.id)
-                break
-        
-        engine.say(text)
-        engine.runAndWait()
-        engine.stop()
-    except Exception as e:
-        print(f"TTS Error: {e}")
-        sys.exit(1)
-
-if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        speak(sys.argv[1])
-""")
+                try:
+                    worker.stdin.write(json.dumps(request) + "\n")
+                    worker.stdin.flush()
+                except (BrokenPipeError, OSError, ValueError):
+                    # Processus mort avant la requête : relancé une fois
+                    self.logger.warning("Processus TTS interrompu, redémarrage")
+                    worker.kill()
+                    self._worker = None
+                    continue
+                
+                expired = threading.Event()
+                watchdog = threading.Timer(timeout, lambda: (expired.set(), worker.kill()))
+                watchdog.start()
+                try:
+                    reply = worker.stdout.readline().strip()
+                except (OSError, ValueError):
+                    reply = ""
+                finally:
+                    watchdog.cancel()
                 
-                # Exécuter le script dans un processus séparé
+                if reply == "OK":
+                    return True
+                if reply:
+                    self.logger.error(f"Erreur du processus TTS: {reply}")
+                    return False
+                
+                # Fin de flux pendant la requête : processus tué par le délai ou
+                # mort en cours de route. Il sera relancé à la prochaine requête.
+                worker.kill()
+                self._worker = None
+                if expired.is_set():
+                    self.logger.error(f"Le processus TTS n'a pas répondu en {timeout:.0f}s, requête abandonnée")
+                else:
+                    self.logger.error("Processus TTS interrompu pendant la requête, requête abandonnée")
+                return False
+        
+        self.logger.error("Le processus TTS ne répond pas")
+        return False
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _detect_players(cls) -> Tuple[str, ...]:
+        """
+        Recherche les lecteurs audio en ligne de commande présents dans le PATH.
+        
+        Le résultat est mémorisé au niveau de la classe : la recherche n'est faite
+        qu'une fois par processus, quel que soit le nombre d'adaptateurs créés.
+        """
+        return tuple(player for player in _AUDIO_PLAYERS if shutil.which(player))
+    
+    def _detect_audio_player(self) -> Optional[str]:
+        """Sélectionne le lecteur audio préféré parmi ceux disponibles."""
+        players = self._detect_players()
+        if players:
+            self.logger.info(f"Lecteur audio détecté: {players[0]}")
+            return players[0]
+        self.logger.info("Aucun lecteur audio détecté, synthèse sans cache")
+        return None
+    
+    def _cache_key(self, text: str) -> str:
+        """Calcule la clé de cache d'un texte pour les paramètres de voix courants."""
+        normalized = _WHITESPACE_RE.sub(' ', text.strip().lower())
+        raw = f"pyttsx3|{self._voice_id}|{self.rate}|{self.volume}|{normalized}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def _lookup_cached_audio(self, key: str) -> Optional[str]:
+        """Cherche un fichier audio en cache, en mémoire puis sur disque."""
+        # Niveau mémoire
+        path = self._audio_cache.get(key)
+        if path is not None and os.path.exists(path):
+            self._audio_cache.move_to_end(key)
+            self.cache_hits += 1
+            return path
+        
+        # Niveau disque
+        path = os.path.join(TTS_CACHE_DIR, f"{key}.wav")
+        if os.path.exists(path):
+            self.cache_hits += 1
+            self._remember_audio(key, path)
+            return path
+        
+        self.cache_misses += 1
+        return None
+    
+    def _remember_audio(self, key: str, path: str):
+        """Enregistre un fichier audio dans le niveau mémoire du cache."""
+        self._audio_cache[key] = path
+        self._audio_cache.move_to_end(key)
+        if len(self._audio_cache) > self._cache_size:
+            self._audio_cache.popitem(last=False)
+    
+    def _get_cached_audio(self, text: str) -> Optional[str]:
+        """
+        Retourne le fichier audio correspondant au texte, en le synthétisant si besoin.
+        
+        Args:
+            text: Texte à synthétiser
+            
+        Returns:
+            Chemin du fichier audio, ou None si la synthèse a échoué
+        """
+        return self._get_cached_audio_batch((text,))[0]
+    
+    def _get_cached_audio_batch(self, texts: Tuple[str, ...]) -> List[Optional[str]]:
+        """
+        Retourne les fichiers audio de plusieurs textes, en synthétisant en un seul
+        lot ceux qui ne sont pas encore en cache.
+        
+        Args:
+            texts: Textes à synthétiser
+            
+        Returns:
+            Chemins des fichiers audio (None pour un texte dont la synthèse a échoué)
+        """
+        keys = [self._cache_key(text) for text in texts]
+        paths: Dict[str, Optional[str]] = {}
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key in paths or key in missing:
+                continue
+            path = self._lookup_cached_audio(key)
+            if path is not None:
+                paths[key] = path
+            else:
+                missing[key] = text
+        
+        if missing:
+            os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+            # Écriture dans des fichiers temporaires puis renommage atomique, pour ne
+            # jamais laisser un fichier partiel dans le cache
+            targets = {key: os.path.join(TTS_CACHE_DIR, f"{key}.wav") for key in missing}
+            tmp_paths = {key: f"{path}.{os.getpid()}.tmp.wav" for key, path in targets.items()}
+            batch = [{"text": missing[key], "out": tmp_paths[key]} for key in missing]
+            ok = self._worker_call({"batch": batch}, timeout=_WORKER_TIMEOUT * len(batch))
+            for key, tmp_path in tmp_paths.items():
                 try:
-                    # Utiliser le même interpréteur Python que celui en cours d'exécution
-                    python_executable = sys.executable
-                    subprocess.run([python_executable, script_path, text], 
-                                  check=True, 
-                                  timeout=60)  # Timeout de 60 secondes pour les messages longs
-                    self.logger.info(f"Texte vocalisé: {text[:50]}...")
-                except subprocess.SubprocessError as e:
-                    self.logger.error(f"Erreur lors de l'exécution du processus TTS: {e}")
-                    print(f"TTS (erreur): {text}")
+                    if ok and os.path.exists(tmp_path) and os.path.getsize(tmp_path) > 0:
+                        os.replace(tmp_path, targets[key])
+                        self._remember_audio(key, targets[key])
+                        paths[key] = targets[key]
+                    else:
+                        paths[key] = None
+                except OSError as e:
+                    self.logger.error(f"Erreur lors de la synthèse vers fichier: {e}")
+                    paths[key] = None
                 finally:
-                    # Supprimer le fichier temporaire
-                    try:
-                        os.unlink(script_path)
-                    except Exception as e:
-                        self.logger.warning(f"Impossible de supprimer le fichier temporaire: {e}")
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+        
+        return [paths[key] for key in keys]
+    
+    def _concat_wavs(self, paths: List[str]) -> Optional[str]:
+        """
+        Concatène des fichiers WAV de même format dans un fichier temporaire.
+        
+        Args:
+            paths: Fichiers WAV à concaténer, dans l'ordre
             
-            except Exception as e:
-                self.logger.error(f"Erreur lors de la vocalisation: {e}")
-                print(f"TTS (erreur): {text}")
-            finally:
-                self.speaking = False
+        Returns:
+            Chemin du fichier concaténé (à supprimer par l'appelant), ou None si
+            les fichiers ne sont pas des WAV compatibles
+        """
+        fd, out_path = tempfile.mkstemp(suffix=".wav", prefix="peer_tts_", dir=TTS_CACHE_DIR)
+        os.close(fd)
+        try:
+            with wave.open(out_path, "wb") as out:
+                params = None
+                for path in paths:
+                    with wave.open(path, "rb") as src:
+                        src_params = src.getparams()
+                        if params is None:
+                            params = src_params
+                            out.setparams(params)
+                        elif src_params[:3] != params[:3] or src_params.comptype != params.comptype:
+                            raise wave.Error("formats audio différents")
+                        # Copie par blocs : la mémoire reste bornée même pour de longs monologues
+                        while True:
+                            frames = src.readframes(_WAV_BLOCK_FRAMES)
+                            if not frames:
+                                break
+                            out.writeframes(frames)
+            return out_path
+        except (wave.Error, EOFError, OSError) as e:
+            # Formats non WAV (AIFF sur macOS par exemple) : lecture fichier par fichier
+            self.logger.debug(f"Concaténation audio impossible: {e}")
+            os.unlink(out_path)
+            return None
+    
+    def _play_audio_file(self, path: str, wait: bool = True) -> bool:
+        """
+        Joue un fichier audio avec le lecteur détecté.
+        
+        Args:
+            path: Chemin du fichier audio
+            wait: Si False, lance la lecture et rend la main immédiatement
+                (voir wait_playback et stop_playback)
+            
+        Returns:
+            True si la lecture a réussi (ou a été lancée), False sinon
+        """
+        if self._play_cmd is None:
+            return False
+        
+        try:
+            self._current_player = subprocess.Popen(self._play_cmd + [path])
+        except OSError as e:
+            self.logger.error(f"Erreur lors de la lecture audio: {e}")
+            return False
+        
+        return self.wait_playback() if wait else True
+    
+    def wait_playback(self, timeout: float = 60) -> bool:
+        """
+        Attend la fin de la lecture audio en cours.
+        
+        Args:
+            timeout: Délai maximal d'attente, en secondes
+            
+        Returns:
+            True si la lecture s'est terminée normalement (ou s'il n'y en a pas)
+        """
+        player = self._current_player
+        if player is None:
+            return True
+        try:
+            returncode = player.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.logger.error("Délai de lecture audio dépassé")
+            player.kill()
+            return False
+        finally:
+            if self._current_player is player:
+                self._current_player = None
+        if returncode != 0 and player is not self._stopped_player:
+            self.logger.error(f"Erreur lors de la lecture audio (code {returncode})")
+            return False
+        return True
+    
+    def stop_playback(self):
+        """Interrompt la lecture audio en cours, s'il y en a une."""
+        player = self._current_player
+        if player is not None and player.poll() is None:
+            # Interruption volontaire : ne pas la traiter comme un échec de lecture
+            self._stopped_player = player
+            player.kill()
+    
+    def clear_cache(self):
+        """Vide le cache de synthèse, en mémoire et sur disque."""
+        self._audio_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        if os.path.isdir(TTS_CACHE_DIR):
+            shutil.rmtree(TTS_CACHE_DIR, ignore_errors=True)
+        self.logger.info("Cache de synthèse vidé")
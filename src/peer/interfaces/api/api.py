@@ -4,10 +4,14 @@ Module contenant l'interface API de Peer.
 Refactorisé pour utiliser le daemon central et l'adaptateur API.
 """
 
+import os
 import sys
+import json
+import time
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import importlib.util
+from typing import Dict, Any, Hashable, Optional, List, Tuple
+from datetime import datetime, timezone
 
 # Configuration du logging
 logging.basicConfig(
@@ -20,18 +24,29 @@ logging.basicConfig(
 
 # Importation des dépendances
 try:
-    from fastapi import FastAPI, HTTPException, Depends
+    from anyio import to_thread
+    from fastapi import FastAPI, HTTPException, Depends, Request
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.middleware.gzip import GZipMiddleware
+    from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
     from pydantic import BaseModel
-    import uvicorn
 except ImportError as e:
     print(f"Erreur lors du chargement des dépendances: {e}")
     print("Veuillez installer les dépendances requises:")
-    print("  pip install fastapi uvicorn")
+    print("  pip install fastapi 'uvicorn[standard]'")
     sys.exit(1)
 
+logger = logging.getLogger("API")
+
+# Sérialisation JSON rapide (optionnelle)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Importation du core centralisé
 from peer.core import get_daemon, APIAdapter, CoreRequest, CoreResponse, InterfaceType, CommandType
-from peer.domain.services.message_service import MessageService
 
 # Modèles de données pour l'API REST
 class CommandRequest(BaseModel):
@@ -53,6 +68,12 @@ class CommandResponse(BaseModel):
     response_id: str
     timestamp: str
 
+# Champs exposés par /command (ceux de CommandResponse)
+_COMMAND_RESPONSE_FIELDS = (
+    "type", "status", "message", "data", "session_id",
+    "instance_id", "request_id", "response_id", "timestamp"
+)
+
 class SessionRequest(BaseModel):
     """Modèle pour les requêtes de session."""
     interface_type: str = "api"
@@ -63,32 +84,88 @@ class SessionResponse(BaseModel):
     interface_type: str
     created_at: str
 
-# Instance globale du daemon et de l'adaptateur
-_daemon = None
-_adapter = None
+# Nombre de threads du pool d'anyio, dans lequel FastAPI exécute les endpoints
+# synchrones (ceux qui appellent le daemon, bloquant)
+_THREAD_LIMIT = 64
+
+def json_response(content: Any) -> JSONResponse:
+    """
+    Construit une réponse JSON sans repasser par la validation Pydantic.
+    
+    Utilise orjson lorsqu'il est disponible, sinon l'encodeur de FastAPI.
+    """
+    if ORJSON_AVAILABLE:
+        return ORJSONResponse(content)
+    return JSONResponse(jsonable_encoder(content))
+
+# Cache des réponses d'aide et de statut, déjà sérialisées
+_RESPONSE_CACHE_TTL = 60.0
+# Le statut évolue (sessions actives, cluster) : il n'est mutualisé que sur une
+# courte fenêtre, pour absorber les sondes de supervision rapprochées
+_STATUS_CACHE_TTL = 1.0
+_RESPONSE_CACHE_MAX_ENTRIES = 256
+_response_cache: Dict[Hashable, Tuple[float, bytes]] = {}
+
+def _dumps(content: Any) -> bytes:
+    """Sérialise un contenu en JSON (orjson si disponible)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content)
+    return json.dumps(jsonable_encoder(content)).encode("utf-8")
+
+# Au-delà de cette taille, un contenu déjà sérialisé est envoyé par morceaux
+_STREAM_THRESHOLD = 16 * 1024
 
-def get_api_daemon():
-    """Obtenir l'instance du daemon pour l'API"""
-    global _daemon, _adapter
-    if _daemon is None:
-        _daemon = get_daemon()
-        _adapter = APIAdapter()
-    return _daemon, _adapter
+def _iter_chunks(payload: bytes):
+    """Découpe un contenu en morceaux de _STREAM_THRESHOLD octets sans le copier."""
+    view = memoryview(payload)
+    for start in range(0, len(view), _STREAM_THRESHOLD):
+        yield view[start:start + _STREAM_THRESHOLD]
+
+def bytes_response(payload: bytes) -> Response:
+    """Construit une réponse JSON à partir d'un contenu déjà sérialisé."""
+    if len(payload) > _STREAM_THRESHOLD:
+        return StreamingResponse(_iter_chunks(payload), media_type="application/json")
+    return Response(content=payload, media_type="application/json")
+
+def get_cached_response(key: Hashable) -> Optional[Response]:
+    """Retourne la réponse en cache pour la clé si elle n'a pas expiré."""
+    entry = _response_cache.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return bytes_response(entry[1])
+
+def cache_response(key: Hashable, content: Any, ttl: float = _RESPONSE_CACHE_TTL) -> Response:
+    """Sérialise un contenu, le met en cache pour ttl secondes et retourne la réponse."""
+    if len(_response_cache) >= _RESPONSE_CACHE_MAX_ENTRIES:
+        _response_cache.clear()
+    payload = _dumps(content)
+    _response_cache[key] = (time.monotonic() + ttl, payload)
+    return bytes_response(payload)
 
 # Création de l'application FastAPI
 app = FastAPI(
     title="Peer API",
     description="API REST pour Peer - Interface standardisée avec le daemon central",
-    version="0.3.0"
+    version="0.3.0",
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
-@app.get("/")
-async def root():
-    """Point d'entrée racine de l'API"""
-    daemon, _ = get_api_daemon()
-    return {
+# Compression des réponses volumineuses (le JSON se compresse très bien)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+@app.on_event("startup")
+async def _init_daemon():
+    """Initialise une fois pour toutes le daemon et l'adaptateur de l'application."""
+    app.state.daemon = get_daemon()
+    app.state.adapter = APIAdapter()
+    to_thread.current_default_thread_limiter().total_tokens = _THREAD_LIMIT
+    app.state.capabilities_payload = _build_capabilities_payload(
+        app.state.daemon, app.state.adapter
+    )
+    # La version du daemon ne change pas pendant la vie du processus
+    app.state.root_payload = _dumps({
         "message": "Peer API - Interface REST pour le daemon central",
-        "version": daemon.get_version(),
+        "version": app.state.daemon.get_version(),
         "endpoints": {
             "commands": "/command",
             "sessions": "/session",
@@ -96,14 +173,33 @@ async def root():
             "capabilities": "/capabilities",
             "help": "/help"
         }
-    }
+    })
 
-@app.post("/command", response_model=CommandResponse)
-async def execute_command(request: CommandRequest):
+def _build_capabilities_payload(daemon, adapter) -> Tuple[int, bytes]:
+    """
+    Interroge le daemon et sérialise la liste des capacités.
+    
+    Returns:
+        Tuple (version du registre des capacités, contenu JSON)
+    """
+    version = daemon.capabilities_version
+    core_response = daemon.execute_command(
+        CoreRequest(command=CommandType.CAPABILITIES, interface_type=InterfaceType.API)
+    )
+    return version, _dumps(adapter.translate_from_core(core_response))
+
+@app.get("/")
+async def root(http_request: Request):
+    """Point d'entrée racine de l'API"""
+    return Response(content=http_request.app.state.root_payload, media_type="application/json")
+
+@app.post("/command", responses={200: {"model": CommandResponse}})
+def execute_command(request: CommandRequest, http_request: Request):
     """
     Exécuter une commande via l'API REST.
     """
-    daemon, adapter = get_api_daemon()
+    daemon = http_request.app.state.daemon
+    adapter = http_request.app.state.adapter
     
     try:
         # Convertir la requête API en format interface
@@ -113,11 +209,10 @@ async def execute_command(request: CommandRequest):
             'context': request.context
         }
         
-        # Traduire via l'adaptateur API
-        if request.session_id:
-            adapter.set_session_id(request.session_id)
-        
+        # Traduire via l'adaptateur API. L'adaptateur est partagé par les requêtes
+        # concurrentes : la session est portée par la requête core, jamais par lui
         core_request = adapter.translate_to_core(interface_input)
+        core_request.session_id = request.session_id
         
         # Exécuter via le daemon
         core_response = daemon.execute_command(core_request)
@@ -125,18 +220,22 @@ async def execute_command(request: CommandRequest):
         # Traduire la réponse
         api_response_dict = adapter.translate_from_core(core_response)
         
-        return CommandResponse(**api_response_dict)
+        # Le modèle CommandResponse ne sert plus qu'à la documentation OpenAPI :
+        # la réponse est sérialisée directement, restreinte aux mêmes champs
+        return json_response({
+            field: api_response_dict.get(field) for field in _COMMAND_RESPONSE_FIELDS
+        })
         
     except Exception as e:
-        logging.error(f"Erreur lors de l'exécution de la commande API: {e}")
+        logger.exception("Erreur lors de l'exécution de la commande API: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/session", response_model=SessionResponse)
-async def create_session(request: SessionRequest):
+@app.post("/session")
+def create_session(request: SessionRequest, http_request: Request) -> SessionResponse:
     """
     Créer une nouvelle session.
     """
-    daemon, _ = get_api_daemon()
+    daemon = http_request.app.state.daemon
     
     try:
         session_id = daemon.create_session(InterfaceType.API)
@@ -144,19 +243,19 @@ async def create_session(request: SessionRequest):
         return SessionResponse(
             session_id=session_id,
             interface_type="api",
-            created_at=datetime.now().isoformat()
+            created_at=datetime.now(timezone.utc).isoformat()
         )
         
     except Exception as e:
-        logging.error(f"Erreur lors de la création de session: {e}")
+        logger.exception("Erreur lors de la création de session: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/session/{session_id}")
-async def end_session(session_id: str):
+def end_session(session_id: str, http_request: Request):
     """
     Terminer une session.
     """
-    daemon, _ = get_api_daemon()
+    daemon = http_request.app.state.daemon
     
     try:
         success = daemon.end_session(session_id)
@@ -169,61 +268,71 @@ async def end_session(session_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Erreur lors de la suppression de session: {e}")
+        logger.exception("Erreur lors de la suppression de session: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/status")
-async def get_status():
+def get_status(http_request: Request):
     """
     Obtenir le statut du système.
     """
-    daemon, adapter = get_api_daemon()
+    cached = get_cached_response("status")
+    if cached is not None:
+        return cached
+    
+    daemon = http_request.app.state.daemon
+    adapter = http_request.app.state.adapter
     
     try:
-        # Créer une requête de statut
-        core_request = CoreRequest(
-            command=CommandType.STATUS,
-            interface_type=InterfaceType.API
+        core_response = daemon.execute_command(
+            CoreRequest(command=CommandType.STATUS, interface_type=InterfaceType.API)
         )
-        
-        core_response = daemon.execute_command(core_request)
         api_response = adapter.translate_from_core(core_response)
         
-        return api_response
+        return cache_response("status", api_response, ttl=_STATUS_CACHE_TTL)
         
     except Exception as e:
-        logging.error(f"Erreur lors de la récupération du statut: {e}")
+        logger.exception("Erreur lors de la récupération du statut: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/capabilities")
-async def get_capabilities():
+def get_capabilities(http_request: Request):
     """
     Obtenir les capacités disponibles.
     """
-    daemon, adapter = get_api_daemon()
+    daemon = http_request.app.state.daemon
     
     try:
-        # Créer une requête de capacités
-        core_request = CoreRequest(
-            command=CommandType.CAPABILITIES,
-            interface_type=InterfaceType.API
-        )
-        
-        core_response = daemon.execute_command(core_request)
-        api_response = adapter.translate_from_core(core_response)
+        # Contenu précalculé au démarrage, recalculé seulement si le registre
+        # des capacités du daemon a changé depuis
+        version, payload = http_request.app.state.capabilities_payload
+        if version != daemon.capabilities_version:
+            version, payload = _build_capabilities_payload(
+                daemon, http_request.app.state.adapter
+            )
+            http_request.app.state.capabilities_payload = (version, payload)
         
-        return api_response
+        return bytes_response(payload)
         
     except Exception as e:
-        logging.error(f"Erreur lors de la récupération des capacités: {e}")
+        logger.exception("Erreur lors de la récupération des capacités: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/help")
-async def get_help(command: Optional[str] = None):
+def get_help(http_request: Request, command: Optional[str] = None):
     """
     Obtenir l'aide.
     """
-    daemon, adapter = get_api_daemon()
+    daemon = http_request.app.state.daemon
+    
+    # L'aide est dérivée du registre des capacités : sa version fait partie de
+    # la clé pour qu'un enregistrement de commande invalide les entrées en cache
+    cache_key = ("help", command, daemon.capabilities_version)
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
+    adapter = http_request.app.state.adapter
     
     try:
         # Créer une requête d'aide
@@ -240,28 +349,51 @@ async def get_help(command: Optional[str] = None):
         core_response = daemon.execute_command(core_request)
         api_response = adapter.translate_from_core(core_response)
         
-        return api_response
+        return cache_response(cache_key, api_response)
         
     except Exception as e:
-        logging.error(f"Erreur lors de la récupération de l'aide: {e}")
+        logger.exception("Erreur lors de la récupération de l'aide: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+# Boucle d'événements et analyseur HTTP compilés (fournis par uvicorn[standard]),
+# utilisés lorsqu'ils sont installés
+_UVICORN_LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+_UVICORN_HTTP = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
 # Fonction pour démarrer le serveur
 def start_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False):
     """
     Démarre le serveur API.
     
+    Le nombre de processus workers est lu dans la variable d'environnement
+    PEER_WORKERS (1 par défaut, 2 x CPU + 1 recommandé en production). Il est
+    ignoré en mode rechargement automatique.
+    
     Args:
         host: Adresse d'écoute
         port: Port d'écoute  
         reload: Mode rechargement automatique
     """
+    # Importé uniquement au démarrage du serveur : inutile pour les modules qui
+    # ne font qu'importer l'application
+    try:
+        import uvicorn
+    except ImportError as e:
+        print(f"Erreur lors du chargement des dépendances: {e}")
+        print("Veuillez installer les dépendances requises:")
+        print("  pip install fastapi 'uvicorn[standard]'")
+        sys.exit(1)
+    
+    workers = 1 if reload else int(os.environ.get("PEER_WORKERS", 1))
     uvicorn.run(
         "peer.interfaces.api.api:app",
         host=host,
         port=port,
         reload=reload,
-        log_level="info"
+        log_level="info",
+        loop=_UVICORN_LOOP,
+        http=_UVICORN_HTTP,
+        workers=workers
     )
 
 if __name__ == "__main__":
@@ -7,7 +7,7 @@ Refactorisé pour utiliser le daemon central et l'adaptateur CLI.
 import sys
 import argparse
 import logging
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 # Configuration du logging
 logging.basicConfig(
@@ -18,8 +18,35 @@ logging.basicConfig(
     ]
 )
 
-# Importation du core centralisé
-from peer.core import get_daemon, CLIAdapter, CoreRequest, CoreResponse, InterfaceType
+# Le core centralisé (daemon, adaptateurs, cluster) est importé à la création
+# de l'interface et non au chargement du module
+if TYPE_CHECKING:
+    from peer.core import CLIAdapter
+
+# Noms du core historiquement exposés par ce module, résolus à la demande
+_LAZY_CORE_EXPORTS = frozenset({"get_daemon", "CLIAdapter", "CoreRequest", "CoreResponse", "InterfaceType"})
+
+def __getattr__(name: str):
+    """Réexporte paresseusement les noms du core (ex. ``from peer.interfaces.cli.cli import CLIAdapter``)."""
+    if name in _LAZY_CORE_EXPORTS:
+        import peer.core
+        return getattr(peer.core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Adaptateur partagé par les instances sans session : il ne porte aucun état
+_shared_adapter: Optional["CLIAdapter"] = None
+
+# Session réutilisée par les instances avec état : ouverte au premier besoin
+# et conservée d'une exécution à l'autre tant que le daemon la connaît
+_pooled_session_id: Optional[str] = None
+
+def _get_shared_adapter() -> "CLIAdapter":
+    """Retourne l'adaptateur CLI commun au processus, créé au premier appel."""
+    global _shared_adapter
+    if _shared_adapter is None:
+        from peer.core import CLIAdapter
+        _shared_adapter = CLIAdapter()
+    return _shared_adapter
 
 class CLI:
     """
@@ -28,21 +55,85 @@ class CLI:
     Refactorisée pour utiliser le daemon central via l'adaptateur CLI.
     """
     
-    def __init__(self):
-        """Initialise l'interface CLI."""
+    def __init__(self, stateless: bool = True):
+        """
+        Initialise l'interface CLI.
+        
+        Args:
+            stateless: Si True (usage ponctuel), aucune session n'est créée auprès
+                du daemon et les requêtes sont traitées comme éphémères. Si False,
+                une session est ouverte une fois la commande analysée, puis
+                réutilisée par les exécutions suivantes du processus.
+        """
         self.logger = logging.getLogger("CLI")
+        self.stateless = stateless
+        self.session_id: Optional[str] = None
+        
+        from peer.core import get_daemon, CLIAdapter
         
         # Obtenir l'instance du daemon central
         self.daemon = get_daemon()
         
-        # Créer l'adaptateur CLI pour la traduction des commandes
-        self.adapter = CLIAdapter()
+        # Créer l'adaptateur CLI pour la traduction des commandes ; il n'est
+        # partagé que s'il ne porte pas d'identifiant de session
+        self.adapter = _get_shared_adapter() if stateless else CLIAdapter()
         
-        # Créer une session pour cette interface CLI
-        self.session_id = self.daemon.create_session(InterfaceType.CLI)
-        self.adapter.set_session_id(self.session_id)
+        self.logger.debug(f"CLI initialized (stateless={stateless})")
+    
+    def _ensure_session(self):
+        """
+        Associe une session à cette interface CLI.
         
-        self.logger.info(f"CLI initialized with session {self.session_id}")
+        La session du processus est réutilisée si le daemon la connaît encore ;
+        sinon une nouvelle session est créée et devient la session partagée.
+        """
+        global _pooled_session_id
+        if self.session_id is not None:
+            return
+        if self.daemon.session_valid(_pooled_session_id):
+            self.session_id = _pooled_session_id
+        else:
+            from peer.core import InterfaceType
+            self.session_id = self.daemon.create_session(InterfaceType.CLI)
+            _pooled_session_id = self.session_id
+            self.logger.info(f"CLI session {self.session_id} created")
+        self.adapter.set_session_id(self.session_id)
+    
+    def _end_session(self):
+        """Termine la session de cette interface CLI et la retire de la réserve."""
+        global _pooled_session_id
+        if self.session_id:
+            self.daemon.end_session(self.session_id)
+            if _pooled_session_id == self.session_id:
+                _pooled_session_id = None
+            self.session_id = None
+            self.adapter.set_session_id(None)
+    
+    # Analyseur d'arguments construit au premier appel puis réutilisé
+    _parser: Optional[argparse.ArgumentParser] = None
+    
+    @classmethod
+    def _get_parser(cls) -> argparse.ArgumentParser:
+        """Retourne l'analyseur d'arguments partagé, construit une seule fois."""
+        if cls._parser is None:
+            parser = argparse.ArgumentParser(description="Peer CLI - Interface en ligne de commande pour Peer")
+            
+            # Commandes principales
+            parser.add_argument('command', nargs='?', default='help',
+                                help='Commande à exécuter (help, version, etc.)')
+            
+            # Arguments supplémentaires
+            parser.add_argument('args', nargs='*',
+                                help='Arguments pour la commande')
+            
+            # Options
+            parser.add_argument('-v', '--verbose', action='store_true',
+                                help='Mode verbeux')
+            parser.add_argument('--end-session', action='store_true',
+                                help='Termine la session CLI après la commande')
+            
+            cls._parser = parser
+        return cls._parser
     
     def parse_args(self, args: List[str]) -> argparse.Namespace:
         """
@@ -54,21 +145,7 @@ class CLI:
         Returns:
             argparse.Namespace: Arguments parsés
         """
-        parser = argparse.ArgumentParser(description="Peer CLI - Interface en ligne de commande pour Peer")
-        
-        # Commandes principales
-        parser.add_argument('command', nargs='?', default='help',
-                            help='Commande à exécuter (help, version, etc.)')
-        
-        # Arguments supplémentaires
-        parser.add_argument('args', nargs='*',
-                            help='Arguments pour la commande')
-        
-        # Options
-        parser.add_argument('-v', '--verbose', action='store_true',
-                            help='Mode verbeux')
-        
-        return parser.parse_args(args)
+        return self._get_parser().parse_args(args)
     
     def run(self, args: Optional[List[str]] = None):
         """
@@ -80,14 +157,21 @@ class CLI:
         if args is None:
             args = sys.argv[1:]
         
+        end_session = False
         try:
             parsed_args = self.parse_args(args)
+            end_session = parsed_args.end_session
             
             # Configurer le niveau de log
             if parsed_args.verbose:
                 logging.getLogger().setLevel(logging.DEBUG)
                 self.logger.debug("Mode verbeux activé")
             
+            # La session n'est créée qu'une fois la commande connue, et seulement
+            # si l'état doit être conservé d'un appel à l'autre
+            if not self.stateless:
+                self._ensure_session()
+            
             # Traduire les arguments CLI en requête core via l'adaptateur
             interface_input = {
                 'command': parsed_args.command,
@@ -113,9 +197,10 @@ class CLI:
             print(f"Erreur: {e}")
             return 1
         finally:
-            # Nettoyer la session si nécessaire
-            if hasattr(self, 'session_id') and self.session_id:
-                self.daemon.end_session(self.session_id)
+            # La session reste ouverte pour les commandes suivantes, sauf demande
+            # explicite (--end-session)
+            if end_session:
+                self._end_session()
 
 def main():
     """Point d'entrée principal de l'interface CLI."""
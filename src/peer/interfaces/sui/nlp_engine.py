@@ -14,15 +14,18 @@ Architecture:
 """
 
 import os
-import sys
-import json
+import copy
+import hashlib
+import importlib.util
 import time
 import logging
 import re
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple, Union
-from dataclasses import dataclass
-from collections import defaultdict, deque
+from typing import Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass, replace
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 # Configuration des variables d'environnement pour éviter les warnings
@@ -32,6 +35,7 @@ os.environ["TOKENIZERS_PARALLELISM"] = "false"
 # Patch de compatibilité PyTorch AVANT toute importation
 try:
     import torch
+    TORCH_AVAILABLE = True
     # Patch pour PyTorch 2.2.2 - ajouter get_default_device manquant
     if not hasattr(torch, 'get_default_device'):
         def get_default_device():
@@ -39,6 +43,7 @@ try:
         torch.get_default_device = get_default_device
         logging.info("✅ Patch PyTorch get_default_device appliqué")
 except ImportError:
+    TORCH_AVAILABLE = False
     logging.warning("PyTorch non disponible")
 
 # Importations avec gestion d'erreurs
@@ -49,19 +54,15 @@ except ImportError:
     SPACY_AVAILABLE = False
     logging.warning("spaCy non disponible - fallback vers méthodes alternatives")
 
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+# sentence-transformers n'est importé qu'au chargement effectif d'un modèle PyTorch
+# (voir HybridNLPEngine._load_sentence_model) : la voie ONNX s'en passe entièrement
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+if not SENTENCE_TRANSFORMERS_AVAILABLE:
     logging.warning("sentence-transformers non disponible - utilisation d'alternatives")
-except Exception as e:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
-    logging.warning(f"sentence-transformers non compatible: {e}")
 
 try:
-    from transformers import AutoTokenizer, AutoModel, pipeline
-    import torch.nn.functional as F
+    from transformers import AutoTokenizer, AutoModel, PreTrainedTokenizerFast
+    from transformers import __version__ as TRANSFORMERS_VERSION
     TRANSFORMERS_AVAILABLE = True
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
@@ -70,8 +71,115 @@ except Exception as e:
     TRANSFORMERS_AVAILABLE = False
     logging.warning(f"transformers non compatibles: {e}")
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import onnxruntime as ort
+    from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+    logging.info("onnxruntime/optimum non disponibles - inférence PyTorch")
+except Exception as e:
+    ONNXRUNTIME_AVAILABLE = False
+    logging.warning(f"onnxruntime/optimum non compatibles: {e}")
+
 from peer.core import CommandType
 
+# Normalisation du texte : espaces et corrections phonétiques sur mots entiers
+_WHITESPACE_RE = re.compile(r'\s+')
+_PHONETIC_CORRECTIONS: Dict[str, str] = {
+    "pire": "peer", "père": "peer", "pair": "peer", "per": "peer",
+    "c l i": "cli", "t u i": "tui", "s u i": "sui", "a p i": "api"
+}
+_PHONETIC_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, _PHONETIC_CORRECTIONS)) + r")\b")
+
+# Commandes d'arrêt, traitées à part lors de la consolidation
+_QUIT_COMMAND_TYPES = frozenset({CommandType.DIRECT_QUIT, CommandType.SOFT_QUIT, CommandType.QUIT})
+
+# Mots-clés d'arrêt, recherchés en sous-chaîne (« arrêtez », « quitter »...)
+_QUIT_KEYWORD_RE = re.compile("|".join(map(re.escape, [
+    "arrête", "stop", "quitte", "ferme", "exit", "quit", "bye", "au revoir"
+])))
+
+# Préchargement : énoncés mémorisés par commande précédente (les plus fréquents sont gardés)
+_PREFETCH_HISTORY_MAX = 50
+
+# Composants spaCy inutiles à l'analyse (seuls les POS et les entités sont lus)
+_SPACY_DISABLED_PIPES = ["parser", "lemmatizer"]
+
+# Voie rapide regex : énoncés courts reconnus avec une confiance suffisante
+_FAST_PATH_MAX_WORDS = 5
+_FAST_PATH_MIN_CONFIDENCE = 0.9
+
+# Précision minimale de BERT sur les exemples tenus à l'écart (voir _check_bert_heldout) :
+# en dessous, les prototypes BERT ne proposent plus aucune intention
+_BERT_MIN_HELDOUT_PRECISION = 0.8
+
+# Modèles exportés au format ONNX, réutilisés d'un lancement à l'autre
+ONNX_CACHE_DIR = Path.home() / '.cache' / 'peer' / 'onnx'
+
+# Matrices d'exemples sémantiques pré-encodés, réutilisées d'un lancement à l'autre
+_EXAMPLE_MATRIX_CACHE_DIR = ONNX_CACHE_DIR.parent / 'embeddings'
+
+# Marqueurs des encodeurs BERT déjà validés par une passe de test
+_BERT_VALIDATION_DIR = ONNX_CACHE_DIR.parent / 'bert_ok'
+
+# Sentence Transformers dont le pipeline se réduit à transformer -> pooling moyen
+# (sans couche dense) : encodables directement par _OnnxSentenceEncoder
+_MEAN_POOLING_SENTENCE_MODELS = frozenset({
+    "all-MiniLM-L6-v2",
+    "paraphrase-multilingual-MiniLM-L12-v2",
+})
+
+
+class _OnnxSentenceEncoder:
+    """
+    Encodeur de phrases minimal : session ONNX Runtime et pooling moyen masqué en NumPy.
+    
+    Reproduit SentenceTransformer.encode pour les modèles à pooling moyen, sans
+    importer sentence-transformers ni créer de tenseurs PyTorch.
+    """
+    
+    def __init__(self, tokenizer, session: "ort.InferenceSession", max_length: int = 256):
+        self.tokenizer = tokenizer
+        self.session = session
+        self.max_length = max_length
+        self._input_names = tuple(node.name for node in session.get_inputs())
+    
+    def encode(self, sentences, batch_size: int = 32, convert_to_numpy: bool = True,
+               normalize_embeddings: bool = False, show_progress_bar: bool = False) -> np.ndarray:
+        """Encode une phrase ou une liste de phrases (mêmes arguments que SentenceTransformer.encode)."""
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+        
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            tokens = self.tokenizer(
+                sentences[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np"
+            )
+            feeds = {name: tokens[name].astype(np.int64, copy=False) for name in self._input_names}
+            hidden = self.session.run(None, feeds)[0]  # (lot, tokens, dimension)
+            
+            # Moyenne des embeddings des seuls tokens réels
+            mask = tokens["attention_mask"].astype(np.float32)[..., None]
+            batches.append((hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9))
+        
+        embeddings = np.concatenate(batches).astype(np.float32, copy=False)
+        if normalize_embeddings:
+            embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+        return embeddings[0] if single else embeddings
+
 
 @dataclass
 class IntentResult:
@@ -95,15 +203,40 @@ class HybridNLPEngine:
     - Classification par règles intelligentes
     """
     
-    def __init__(self):
+    def __init__(self, background_loading: bool = True):
+        """
+        Args:
+            background_loading: Si True, les modèles (spaCy, Sentence Transformers,
+                BERT) sont chargés sur un thread dédié et le moteur répond tout de
+                suite avec les patterns et mots-clés, puis avec chaque modèle dès
+                qu'il est prêt (voir wait_until_ready).
+        """
         self.logger = logging.getLogger("HybridNLPEngine")
         self.logger.info("🧠 Initialisation du moteur NLP hybride...")
         
         # Métriques et cache
         self.processing_times = deque(maxlen=100)
         self.success_rates = defaultdict(list)
-        self.embedding_cache = {}
-        self.pattern_cache = {}
+        # Résultats déjà calculés, indexés par texte normalisé (LRU, max_cache_size entrées) :
+        # les phrases répétées à la voix ne repassent pas par les modèles
+        self._intent_result_cache: "OrderedDict[str, IntentResult]" = OrderedDict()
+        self._intent_cache_lock = threading.Lock()
+        # Incrémenté à chaque vidage du cache : une analyse commencée avant n'y est pas stockée
+        self._intent_cache_generation = 0
+        self._intent_cache_hits = 0
+        self._intent_cache_misses = 0
+        self._fastpath_hits = 0  # Énoncés résolus par la voie rapide regex
+        self._early_exits: Counter = Counter()  # Analyses arrêtées avant un modèle coûteux, par étage
+        
+        # Préchargement : énoncés ayant suivi chaque type de commande, analysés
+        # d'avance sur un thread unique pendant que l'utilisateur parle
+        self._transition_texts: Dict[CommandType, Counter] = defaultdict(Counter)
+        self._last_command_type: Optional[CommandType] = None
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="NLPPrefetch")
+        self._prefetch_slot = threading.Semaphore(1)  # Un seul lot à la fois, jamais en file
+        # Les tokenizers rapides ne supportent pas les appels concurrents : une analyse à la fois
+        self._analysis_lock = threading.Lock()
+        self._prefetched = 0
         
         # Configuration
         self.config = {
@@ -111,16 +244,93 @@ class HybridNLPEngine:
             "semantic_threshold": 0.75,
             "max_cache_size": 500,
             "enable_learning": True,
-            "fallback_enabled": True
+            "fallback_enabled": True,
+            "enable_onnx": True,  # Inférence ONNX Runtime si disponible
+            "onnx_intra_op_threads": 4,
+            "enable_int8": True,  # Quantification dynamique INT8 de l'export ONNX BERT
+            "bert_similarity_threshold": 0.85,  # Cosinus minimal avec le prototype BERT retenu
+            "bert_margin": 0.03,  # Avance minimale sur le deuxième prototype BERT (voir _check_bert_heldout)
+            "early_exit_confidence": 0.9,  # Confiance au-delà de laquelle les modèles suivants sont sautés
+            "enable_prefetch": True,
+            "prefetch_candidates": 3,
+            "spacy_batch_size": 32,
+            "spacy_n_process": 1  # Plusieurs processus ne paient que sur de gros lots
         }
         
-        # Initialiser les modèles par ordre de priorité
-        self._init_lightweight_models()
-        self._init_sentence_transformers()
-        self._init_bert_model()
+        # Aucun modèle n'est utilisable tant que son chargement n'est pas terminé
+        self.spacy_model = None
+        self.spacy_enabled = False
+        self.sentence_model = None
+        self.sentence_model_name: Optional[str] = None
+        self.sentence_transformers_enabled = False
+        self.bert_model = None
+        self.bert_tokenizer = None
+        self.bert_enabled = False
+        self._bert_prototypes = None  # Voir _build_bert_prototypes
+        self._bert_prototype_types: Tuple[CommandType, ...] = ()
+        self._bert_examples: Optional[Tuple[np.ndarray, np.ndarray]] = None  # Embeddings et intention de chaque exemple
+        self._bert_heldout: Dict[str, Any] = {}  # Dernier contrôle des seuils BERT
+        self._models_ready = threading.Event()
+        
+        # Patterns et mots-clés : disponibles immédiatement
         self._build_intent_patterns()
         
-        self.logger.info("✅ Moteur NLP hybride initialisé avec succès")
+        if background_loading:
+            threading.Thread(target=self._load_models, name="NLPModelLoader", daemon=True).start()
+            self.logger.info("✅ Moteur NLP hybride prêt (modèles en cours de chargement en arrière-plan)")
+        else:
+            self._load_models()
+            self.logger.info("✅ Moteur NLP hybride initialisé avec succès")
+    
+    def _load_models(self):
+        """Charge les modèles par ordre de priorité, chacun devenant actif dès qu'il est prêt."""
+        try:
+            self._configure_torch_threads()
+            self._init_lightweight_models()
+            self._init_sentence_transformers()
+            self._build_semantic_index()
+            self._init_bert_model()
+            self._build_bert_prototypes()
+        except Exception as e:
+            self.logger.error(f"❌ Erreur lors du chargement des modèles NLP: {e}")
+        finally:
+            # Les résultats mis en cache sans les modèles ne sont plus représentatifs
+            self._clear_intent_cache()
+            self._models_ready.set()
+            available = [name for name, enabled in (
+                ("spacy", self.spacy_enabled),
+                ("sentence_transformers", self.sentence_transformers_enabled),
+                ("bert", self.bert_enabled)
+            ) if enabled]
+            self.logger.info("📊 Modèles NLP chargés: %s", ", ".join(available) if available else "aucun")
+    
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attend la fin du chargement des modèles.
+        
+        Returns:
+            True si le chargement est terminé, False si le délai a expiré
+        """
+        return self._models_ready.wait(timeout)
+    
+    def _configure_torch_threads(self):
+        """
+        Fixe le nombre de threads PyTorch pour l'inférence (PEER_TORCH_THREADS, 4 par défaut).
+        
+        Un seul énoncé est encodé à la fois : le parallélisme utile est à
+        l'intérieur des opérateurs, d'où un seul thread inter-opérateurs.
+        """
+        if not TORCH_AVAILABLE:
+            return
+        try:
+            torch.set_num_threads(int(os.environ.get("PEER_TORCH_THREADS", "4")))
+        except (ValueError, RuntimeError) as e:
+            self.logger.warning(f"⚠️ Nombre de threads PyTorch non modifié: {e}")
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Déjà fixé (possible une seule fois par processus, avant tout calcul parallèle)
+            pass
     
     def _init_lightweight_models(self):
         """Initialise les modèles légers (spaCy)."""
@@ -131,12 +341,12 @@ class HybridNLPEngine:
             try:
                 # Tenter de charger le modèle français
                 try:
-                    self.spacy_model = spacy.load("fr_core_news_sm")
+                    self.spacy_model = spacy.load("fr_core_news_sm", disable=_SPACY_DISABLED_PIPES)
                     self.logger.info("✅ Modèle spaCy français chargé")
                 except OSError:
                     # Fallback vers le modèle anglais
                     try:
-                        self.spacy_model = spacy.load("en_core_web_sm")
+                        self.spacy_model = spacy.load("en_core_web_sm", disable=_SPACY_DISABLED_PIPES)
                         self.logger.info("✅ Modèle spaCy anglais chargé (fallback)")
                     except OSError:
                         self.logger.warning("⚠️ Aucun modèle spaCy disponible")
@@ -152,7 +362,7 @@ class HybridNLPEngine:
         self.sentence_model = None
         self.sentence_transformers_enabled = False
         
-        if SENTENCE_TRANSFORMERS_AVAILABLE:
+        if SENTENCE_TRANSFORMERS_AVAILABLE or self._onnx_enabled():
             try:
                 # Modèles par ordre de préférence (du plus léger au plus lourd)
                 models_to_try = [
@@ -175,11 +385,10 @@ class HybridNLPEngine:
                                 return 'cpu'
                             torch.get_default_device = get_default_device
                         
-                        self.sentence_model = SentenceTransformer(
-                            model_name,
-                            device='cpu',  # Forcer CPU pour éviter les problèmes de compatibilité
-                            cache_folder=os.environ["SENTENCE_TRANSFORMERS_HOME"]
+                        self.sentence_model = self._load_sentence_model(
+                            model_name, os.environ["SENTENCE_TRANSFORMERS_HOME"]
                         )
+                        self.sentence_model_name = model_name
                         self.sentence_transformers_enabled = True
                         self.logger.info(f"✅ Sentence Transformer chargé: {model_name}")
                         break
@@ -219,23 +428,14 @@ class HybridNLPEngine:
                         self.bert_tokenizer = AutoTokenizer.from_pretrained(
                             model_name,
                             use_fast=True,  # Utiliser les tokenizers rapides
-                            clean_up_tokenization_spaces=True
-                        )
-                        
-                        self.bert_model = AutoModel.from_pretrained(
-                            model_name,
-                            output_hidden_states=True,
-                            output_attentions=False,
-                            return_dict=True
+                            clean_up_tokenization_spaces=False  # Aucun décodage : post-traitement inutile
                         )
+                        if not isinstance(self.bert_tokenizer, PreTrainedTokenizerFast):
+                            self.logger.warning(f"⚠️ Tokenizer rapide (Rust) indisponible pour {model_name} - tokenisation Python plus lente")
                         
-                        # Configuration pour l'inférence
-                        self.bert_model.eval()
+                        self.bert_model = self._load_bert_encoder(model_name)
                         
-                        # Test rapide pour vérifier la compatibilité (CPU seulement)
-                        test_input = self.bert_tokenizer("test", return_tensors="pt", padding=True)
-                        with torch.no_grad():
-                            _ = self.bert_model(**test_input)
+                        self._validate_bert_model(model_name)
                         
                         self.bert_enabled = True
                         self.logger.info(f"✅ BERT chargé avec succès: {model_name}")
@@ -251,6 +451,276 @@ class HybridNLPEngine:
         if not self.bert_enabled:
             self.logger.info("🔄 Fonctionnement sans BERT - modèles alternatifs activés")
     
+    def _validate_bert_model(self, model_name: str):
+        """
+        Vérifie la compatibilité de l'encodeur BERT par une passe de test (CPU seulement).
+        
+        La passe ne tourne qu'une fois par modèle, backend et versions installées :
+        un marqueur sous _BERT_VALIDATION_DIR la rend inutile aux démarrages suivants.
+        """
+        backend = type(self.bert_model).__name__
+        flag_name = f"{model_name}-{backend}-{TRANSFORMERS_VERSION}-{torch.__version__}".replace('/', '--')
+        flag = _BERT_VALIDATION_DIR / flag_name
+        if flag.exists():
+            return
+        
+        test_input = self.bert_tokenizer("test", return_tensors="pt", padding=True)
+        with torch.inference_mode():
+            _ = self.bert_model(**test_input)
+        
+        try:
+            flag.parent.mkdir(parents=True, exist_ok=True)
+            flag.touch()
+        except OSError as e:
+            self.logger.debug(f"Marqueur de validation BERT non écrit: {e}")
+    
+    def _bert_encode(self, texts: List[str]) -> np.ndarray:
+        """Encode des textes en une passe BERT : pooling moyen masqué, vecteurs de norme 1 (float32)."""
+        inputs = self.bert_tokenizer(texts, return_tensors="pt", max_length=512, truncation=True, padding=True)
+        with torch.inference_mode():
+            hidden = self.bert_model(**inputs).last_hidden_state
+            mask = inputs["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+            pooled = ((hidden * mask).sum(dim=1) / mask.sum(dim=1)).float().numpy()
+        pooled /= np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+        return pooled
+    
+    def _build_bert_prototypes(self):
+        """
+        Calcule un prototype BERT par intention : moyenne normalisée de ses exemples sémantiques.
+        
+        Tous les exemples passent dans un seul lot ; à l'analyse, l'énoncé est encodé
+        une fois et comparé à tous les prototypes par un produit matriciel.
+        """
+        self._bert_prototypes = None
+        self._bert_prototype_types = ()
+        self._bert_examples = None
+        self._bert_heldout = {}
+        if not self.bert_enabled:
+            return
+        
+        command_types = []
+        texts = []
+        slices = []
+        for command_type, patterns in self.intent_patterns.items():
+            examples = patterns.get("semantic_examples", [])
+            if examples:
+                command_types.append(command_type)
+                slices.append((len(texts), len(texts) + len(examples)))
+                texts.extend(examples)
+        if not texts:
+            return
+        
+        try:
+            embeddings = self._bert_encode(texts)
+            prototypes = np.stack([embeddings[start:end].mean(axis=0) for start, end in slices])
+            prototypes /= np.maximum(np.linalg.norm(prototypes, axis=1, keepdims=True), 1e-12)
+            labels = np.concatenate([np.full(end - start, index) for index, (start, end) in enumerate(slices)])
+            self._bert_prototypes = np.ascontiguousarray(prototypes, dtype=np.float32)
+            self._bert_prototype_types = tuple(command_types)
+            self._bert_examples = (np.ascontiguousarray(embeddings, dtype=np.float32), labels)
+            self.logger.info("✅ %d prototypes d'intention BERT calculés", len(command_types))
+            self._check_bert_heldout()
+        except Exception as e:
+            self.logger.warning(f"⚠️ Échec du calcul des prototypes BERT: {e}")
+    
+    def _select_bert_prototype(self, scores: np.ndarray) -> Optional[int]:
+        """
+        Retourne l'indice du prototype retenu pour ces cosinus, ou None.
+        
+        Les cosinus BERT bruts se concentrent entre 0.8 et 0.95 : le seuil absolu
+        ne suffit pas, le meilleur prototype doit aussi devancer le deuxième
+        d'au moins bert_margin.
+        """
+        if len(scores) == 0:
+            return None
+        best = int(scores.argmax())
+        if scores[best] < self.config["bert_similarity_threshold"]:
+            return None
+        if len(scores) > 1 and scores[best] - np.partition(scores, -2)[-2] < self.config["bert_margin"]:
+            return None
+        return best
+    
+    def _check_bert_heldout(self) -> Dict[str, Any]:
+        """
+        Contrôle bert_similarity_threshold et bert_margin sur des exemples tenus à l'écart.
+        
+        Chaque exemple sémantique est retiré de son propre prototype (leave-one-out)
+        puis classé comme un énoncé réel. Si la précision des intentions proposées
+        est inférieure à _BERT_MIN_HELDOUT_PRECISION, BERT ne propose plus rien.
+        """
+        if self._bert_examples is None or self._bert_prototypes is None:
+            return {}
+        embeddings, labels = self._bert_examples
+        counts = np.bincount(labels, minlength=len(self._bert_prototype_types))
+        sums = np.zeros_like(self._bert_prototypes)
+        np.add.at(sums, labels, embeddings)
+        
+        evaluated = proposed = correct = 0
+        for embedding, label in zip(embeddings, labels):
+            if counts[label] < 2:
+                continue  # Aucun prototype ne resterait pour cette intention
+            scores = self._bert_prototypes @ embedding
+            held_out = sums[label] - embedding
+            scores[label] = float(held_out @ embedding) / max(float(np.linalg.norm(held_out)), 1e-12)
+            evaluated += 1
+            selected = self._select_bert_prototype(scores)
+            # Les intentions d'arrêt ne sont jamais proposées par BERT seul
+            if selected is None or self._bert_prototype_types[selected] in _QUIT_COMMAND_TYPES:
+                continue
+            proposed += 1
+            correct += int(selected == label)
+        
+        precision = correct / proposed if proposed else None
+        self._bert_heldout = {
+            "evaluated": evaluated,
+            "proposed": proposed,
+            "precision": precision,
+            "coverage": proposed / evaluated if evaluated else 0.0,
+            "enabled": precision is None or precision >= _BERT_MIN_HELDOUT_PRECISION
+        }
+        if self._bert_heldout["enabled"]:
+            self.logger.info(
+                "📏 Seuils BERT sur %d exemples tenus à l'écart: précision %s, couverture %.0f%%",
+                evaluated, "n/a" if precision is None else f"{precision:.0%}",
+                100 * self._bert_heldout["coverage"]
+            )
+        else:
+            self.logger.warning(
+                "⚠️ Précision BERT de %.0f%% sur les exemples tenus à l'écart (seuil %.2f, marge %.2f) - "
+                "détection BERT désactivée", 100 * precision,
+                self.config["bert_similarity_threshold"], self.config["bert_margin"]
+            )
+        return self._bert_heldout
+    
+    def _onnx_enabled(self) -> bool:
+        """Indique si les encodeurs doivent tourner sous ONNX Runtime."""
+        return ONNXRUNTIME_AVAILABLE and self.config["enable_onnx"]
+    
+    def _onnx_session_options(self) -> "ort.SessionOptions":
+        """Options de session ONNX Runtime : toutes les optimisations de graphe (fusion d'opérateurs, constantes)."""
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = self.config["onnx_intra_op_threads"]
+        return options
+    
+    def _load_sentence_model(self, model_name: str, cache_folder: str):
+        """
+        Charge un encodeur de phrases, par ordre de préférence :
+        
+        1. export ONNX + pooling NumPy (_OnnxSentenceEncoder) pour les modèles à pooling moyen ;
+        2. Sentence Transformer avec le backend ONNX ;
+        3. Sentence Transformer PyTorch.
+        """
+        if self._onnx_enabled() and model_name in _MEAN_POOLING_SENTENCE_MODELS:
+            try:
+                model = self._load_onnx_sentence_encoder(model_name)
+                self.logger.info(f"⚡ Encodeur de phrases {model_name} sous ONNX Runtime (pooling NumPy)")
+                return model
+            except Exception as e:
+                self.logger.warning(f"⚠️ Encodeur ONNX direct indisponible pour {model_name}: {e}")
+        
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise ImportError("sentence-transformers non disponible")
+        from sentence_transformers import SentenceTransformer
+        
+        if self._onnx_enabled():
+            try:
+                model = SentenceTransformer(
+                    model_name,
+                    device='cpu',
+                    cache_folder=cache_folder,
+                    backend="onnx",
+                    model_kwargs={"provider": "CPUExecutionProvider", "session_options": self._onnx_session_options()}
+                )
+                self.logger.info(f"⚡ Sentence Transformer {model_name} sous ONNX Runtime")
+                return model
+            except Exception as e:
+                self.logger.warning(f"⚠️ Backend ONNX indisponible pour {model_name}, retour à PyTorch: {e}")
+        
+        return SentenceTransformer(
+            model_name,
+            device='cpu',  # Forcer CPU pour éviter les problèmes de compatibilité
+            cache_folder=cache_folder
+        )
+    
+    def _load_onnx_sentence_encoder(self, model_name: str) -> _OnnxSentenceEncoder:
+        """Construit un _OnnxSentenceEncoder sur l'export ONNX (non quantifié) du modèle."""
+        hub_name = f"sentence-transformers/{model_name}"
+        tokenizer = AutoTokenizer.from_pretrained(hub_name, use_fast=True, clean_up_tokenization_spaces=False)
+        onnx_model = self._load_onnx_encoder(hub_name, quantize=False)
+        encoder = _OnnxSentenceEncoder(tokenizer, onnx_model.model)
+        # Vérifier que la session accepte bien les entrées produites par le tokenizer
+        encoder.encode(["test"])
+        return encoder
+    
+    def _load_bert_encoder(self, model_name: str):
+        """
+        Charge l'encodeur BERT, exporté en ONNX si ONNX Runtime est disponible.
+        
+        L'export est fait une seule fois puis conservé sous ONNX_CACHE_DIR. Le
+        modèle ONNX accepte les mêmes entrées et renvoie le même
+        last_hidden_state que le modèle PyTorch.
+        """
+        if self._onnx_enabled():
+            try:
+                model = self._load_onnx_encoder(model_name)
+                self.logger.info(f"⚡ BERT {model_name} sous ONNX Runtime")
+                return model
+            except Exception as e:
+                self.logger.warning(f"⚠️ Export ONNX impossible pour {model_name}, retour à PyTorch: {e}")
+        
+        model = AutoModel.from_pretrained(
+            model_name,
+            output_hidden_states=True,
+            output_attentions=False,
+            return_dict=True
+        )
+        
+        # Configuration pour l'inférence
+        model.eval()
+        return model
+    
+    def _load_onnx_encoder(self, model_name: str, quantize: Optional[bool] = None) -> "ORTModelForFeatureExtraction":
+        """
+        Charge l'export ONNX de model_name depuis le cache, en le créant au besoin.
+        
+        Si quantize est vrai (par défaut : enable_int8), c'est la version quantifiée
+        dynamiquement en INT8 (poids 4x plus petits, produits scalaires entiers VNNI)
+        qui est chargée ; elle est produite une seule fois à côté de l'export.
+        """
+        if quantize is None:
+            quantize = self.config["enable_int8"]
+        export_dir = ONNX_CACHE_DIR / model_name.replace('/', '--')
+        options = {"provider": "CPUExecutionProvider", "session_options": self._onnx_session_options()}
+        
+        if quantize and (export_dir / "model_quantized.onnx").exists():
+            return ORTModelForFeatureExtraction.from_pretrained(
+                export_dir, file_name="model_quantized.onnx", **options
+            )
+        
+        if (export_dir / "model.onnx").exists():
+            model = ORTModelForFeatureExtraction.from_pretrained(export_dir, **options)
+        else:
+            self.logger.info(f"📦 Export ONNX de {model_name}...")
+            model = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True, **options)
+            model.save_pretrained(export_dir)
+        
+        if not quantize:
+            return model
+        
+        try:
+            self.logger.info(f"📦 Quantification INT8 de {model_name}...")
+            quantization_config = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            ORTQuantizer.from_pretrained(model).quantize(
+                save_dir=export_dir, quantization_config=quantization_config
+            )
+            return ORTModelForFeatureExtraction.from_pretrained(
+                export_dir, file_name="model_quantized.onnx", **options
+            )
+        except Exception as e:
+            self.logger.warning(f"⚠️ Quantification INT8 impossible pour {model_name}, modèle FP32 conservé: {e}")
+            return model
+    
     def _build_intent_patterns(self):
         """Construit les patterns d'intention optimisés."""
         self.intent_patterns = {
@@ -451,6 +921,191 @@ class HybridNLPEngine:
                 ]
             }
         }
+        
+        self._compile_intent_patterns()
+        self._example_matrix = None  # Construit après le chargement du modèle (voir _build_semantic_index)
+    
+    def _compile_intent_patterns(self):
+        """
+        Compile une seule fois les patterns regex de chaque intention, dans leur ordre.
+        
+        Le texte analysé est déjà en minuscules (voir _normalize_text) : les
+        patterns sont compilés sans IGNORECASE. Un pattern invalide est signalé
+        ici, une fois, puis ignoré.
+        
+        Les patterns d'une intention sont aussi fusionnés en une alternation :
+        une seule recherche suffit à écarter une intention absente du texte.
+        """
+        self._compiled_patterns: List[Tuple[CommandType, Optional["re.Pattern[str]"], Tuple["re.Pattern[str]", ...]]] = []
+        for command_type, patterns_config in self.intent_patterns.items():
+            compiled = []
+            for pattern in patterns_config.get("patterns", []):
+                try:
+                    compiled.append(re.compile(pattern))
+                except re.error as e:
+                    self.logger.warning(f"⚠️ Erreur pattern regex '{pattern}': {e}")
+            if not compiled:
+                continue
+            
+            fused = None
+            if len(compiled) > 1:
+                try:
+                    fused = re.compile("|".join(f"(?:{pattern.pattern})" for pattern in compiled))
+                except re.error:
+                    # Patterns non fusionnables (groupes nommés en double...) : recherche un par un
+                    fused = None
+            self._compiled_patterns.append((command_type, fused, tuple(compiled)))
+        
+        self._build_keyword_index()
+    
+    def _build_keyword_index(self):
+        """
+        Aplatit les mots-clés de toutes les intentions en tableaux parallèles.
+        
+        Chaque mot-clé distinct n'apparaît qu'une fois dans _keyword_texts. Les
+        entrées (intention, mot-clé), dans l'ordre des intentions puis de
+        déclaration, forment deux tableaux NumPy alignés : _keyword_entry_intent
+        et _keyword_entry_keyword. Avec pyahocorasick, un automate unique trouve
+        tous les mots-clés en une passe sur le texte.
+        """
+        self._keyword_intents: Tuple[CommandType, ...] = tuple(self.intent_patterns)
+        keyword_ids: Dict[str, int] = {}
+        entry_intents: List[int] = []
+        entry_keywords: List[int] = []
+        for intent_index, command_type in enumerate(self._keyword_intents):
+            for keyword in self.intent_patterns[command_type].get("keywords", []):
+                entry_intents.append(intent_index)
+                entry_keywords.append(keyword_ids.setdefault(keyword, len(keyword_ids)))
+        self._keyword_texts: Tuple[str, ...] = tuple(keyword_ids)
+        self._keyword_entry_intent = np.array(entry_intents, dtype=np.intp)
+        self._keyword_entry_keyword = np.array(entry_keywords, dtype=np.intp)
+        
+        self._keyword_automaton = None
+        if AHOCORASICK_AVAILABLE and self._keyword_texts:
+            automaton = ahocorasick.Automaton()
+            for keyword, keyword_id in keyword_ids.items():
+                automaton.add_word(keyword, keyword_id)
+            automaton.make_automaton()
+            self._keyword_automaton = automaton
+    
+    def _find_keyword_ids(self, text: str) -> set:
+        """Retourne les indices des mots-clés présents (en sous-chaîne) dans le texte."""
+        if self._keyword_automaton is not None:
+            return {keyword_id for _, keyword_id in self._keyword_automaton.iter(text)}
+        return {keyword_id for keyword_id, keyword in enumerate(self._keyword_texts) if keyword in text}
+    
+    def _keyword_hit_entries(self, found_ids: set) -> np.ndarray:
+        """Indices (croissants) des entrées (intention, mot-clé) dont le mot-clé a été trouvé."""
+        found = np.zeros(len(self._keyword_texts), dtype=bool)
+        found[list(found_ids)] = True
+        return np.flatnonzero(found[self._keyword_entry_keyword])
+    
+    def _group_keyword_entries(self, entries: np.ndarray) -> Dict[int, List[str]]:
+        """Regroupe des entrées par indice d'intention, mots-clés dans leur ordre de déclaration."""
+        matches: Dict[int, List[str]] = defaultdict(list)
+        for intent_index, keyword_id in zip(self._keyword_entry_intent[entries].tolist(),
+                                            self._keyword_entry_keyword[entries].tolist()):
+            matches[intent_index].append(self._keyword_texts[keyword_id])
+        return matches
+    
+    def _match_keywords(self, text: str) -> Dict[int, List[str]]:
+        """
+        Mots-clés présents dans le texte (en minuscules), regroupés par indice
+        d'intention (voir _keyword_intents) et dans leur ordre de déclaration.
+        """
+        found_ids = self._find_keyword_ids(text)
+        if not found_ids:
+            return {}
+        return self._group_keyword_entries(self._keyword_hit_entries(found_ids))
+    
+    def _build_semantic_index(self):
+        """
+        Encode une seule fois tous les exemples sémantiques en une matrice normalisée.
+        
+        Chaque intention occupe une tranche contiguë de lignes : à l'analyse, seul
+        le texte de l'utilisateur est encodé, puis un unique produit matriciel
+        donne sa similarité cosinus avec tous les exemples.
+        """
+        self._example_matrix = None
+        self._example_texts: List[str] = []
+        self._example_slices: List[Tuple[CommandType, int, int, float]] = []
+        self._example_starts = None
+        self._example_thresholds = None
+        
+        if not self.sentence_model:
+            return
+        
+        for command_type, patterns in self.intent_patterns.items():
+            examples = patterns.get("semantic_examples", [])
+            if not examples:
+                continue
+            
+            # Seuil adaptatif selon le type de commande
+            threshold = 0.6  # Seuil de base plus permissif
+            if command_type in (CommandType.DIRECT_QUIT, CommandType.SOFT_QUIT):
+                threshold = 0.55  # Plus sensible pour les arrêts
+            elif command_type in (CommandType.HELP, CommandType.ANALYZE):
+                threshold = 0.65  # Plus strict pour les commandes importantes
+            
+            start = len(self._example_texts)
+            self._example_texts.extend(examples)
+            self._example_slices.append((command_type, start, len(self._example_texts), threshold))
+        
+        # Débuts de tranche et seuils en tableaux : maximum par intention en un seul reduceat
+        self._example_starts = np.array([start for _, start, _, _ in self._example_slices], dtype=np.intp)
+        self._example_thresholds = np.array([threshold for *_, threshold in self._example_slices])
+        
+        # Le fichier en cache ne vaut que pour ce modèle, ce backend et ces exemples
+        cache_key = hashlib.sha1("\n".join([
+            str(self.sentence_model_name), type(self.sentence_model).__name__, *self._example_texts
+        ]).encode("utf-8")).hexdigest()[:16]
+        cache_path = _EXAMPLE_MATRIX_CACHE_DIR / f"{cache_key}.npy"
+        
+        self._example_matrix = self._load_example_matrix(cache_path)
+        if self._example_matrix is not None:
+            self.logger.info("✅ %d exemples sémantiques chargés depuis le cache disque", len(self._example_texts))
+            return
+        
+        try:
+            # Stockage en float16 : la moitié de la mémoire, sans effet sur l'intention retenue
+            self._example_matrix = np.ascontiguousarray(self.sentence_model.encode(
+                self._example_texts,
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            ), dtype=np.float16)
+            self.logger.info("✅ %d exemples sémantiques pré-encodés", len(self._example_texts))
+        except Exception as e:
+            self.logger.warning(f"⚠️ Échec du pré-encodage des exemples sémantiques: {e}")
+            self._example_matrix = None
+            return
+        
+        self._save_example_matrix(cache_path, self._example_matrix)
+    
+    def _load_example_matrix(self, cache_path: Path) -> Optional[np.ndarray]:
+        """Projette en mémoire (memmap, lecture seule) une matrice d'exemples déjà encodée."""
+        if not cache_path.exists():
+            return None
+        try:
+            matrix = np.load(cache_path, mmap_mode="r")
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"⚠️ Cache d'exemples sémantiques illisible ({cache_path.name}): {e}")
+            return None
+        if matrix.dtype != np.float16 or matrix.ndim != 2 or matrix.shape[0] != len(self._example_texts):
+            return None
+        return matrix
+    
+    def _save_example_matrix(self, cache_path: Path, matrix: np.ndarray):
+        """Écrit la matrice d'exemples de façon atomique (fichier temporaire puis renommage)."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, matrix)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.debug(f"Matrice d'exemples sémantiques non mise en cache: {e}")
     
     def extract_intent(self, text: str, context: Dict[str, Any] = None) -> IntentResult:
         """
@@ -465,33 +1120,183 @@ class HybridNLPEngine:
         start_time = time.time()
         context = context or {}
         
-        normalized_text = self._normalize_text(text)
+        # Le texte reçu de la SUI est déjà normalisé : on tente d'abord la clé brute
+        # pour éviter les deux passes regex de normalisation sur un succès de cache.
+        # Le hash d'un str est mis en cache par CPython, chaque clé n'est hachée qu'une fois.
+        cached = self._lookup_cached_intent(text)
+        normalized_text = text
+        if cached is None:
+            normalized_text = self._normalize_text(text)
+            if normalized_text != text:
+                cached = self._lookup_cached_intent(normalized_text)
+        if cached is not None:
+            result = replace(
+                cached,
+                parameters=copy.deepcopy(cached.parameters),
+                processing_time=time.time() - start_time
+            )
+        else:
+            self._intent_cache_misses += 1
+            generation = self._intent_cache_generation
+            with self._analysis_lock:
+                result = self._extract_intent_uncached(text, normalized_text, context, start_time)
+            self._store_cached_intent(normalized_text, result, generation)
         
-        # Analyser avec tous les modèles disponibles pour détecter plusieurs intentions
-        all_detections = []
+        self.processing_times.append(result.processing_time)
         
-        # MÉTHODE 1: Sentence Transformers (priorité pour la précision sémantique)
-        if self.sentence_transformers_enabled:
-            st_results = self._analyze_with_sentence_transformers_multi(normalized_text, context)
-            if st_results:
-                all_detections.extend(st_results)
+        if self.config["enable_prefetch"]:
+            self._record_transition(normalized_text, result.command_type)
+        return result
+    
+    def _store_cached_intent(self, key: str, result: IntentResult, generation: int):
+        """
+        Met en cache une copie du résultat, en évinçant les entrées les moins récentes.
+        
+        generation est la valeur de _intent_cache_generation lue avant l'analyse :
+        si le cache a été vidé entre-temps (modèles chargés, configuration modifiée),
+        le résultat est obsolète et n'est pas stocké.
+        """
+        entry = replace(result, parameters=copy.deepcopy(result.parameters))
+        with self._intent_cache_lock:
+            if generation != self._intent_cache_generation:
+                return
+            self._intent_result_cache[key] = entry
+            while len(self._intent_result_cache) > self.config["max_cache_size"]:
+                self._intent_result_cache.popitem(last=False)
+    
+    def _record_transition(self, normalized_text: str, command_type: CommandType):
+        """
+        Mémorise l'énoncé comme successeur de la commande précédente, puis lance
+        le préchargement des successeurs habituels de la commande courante.
+        """
+        previous = self._last_command_type
+        self._last_command_type = command_type
+        if previous is not None:
+            followers = self._transition_texts[previous]
+            followers[normalized_text] += 1
+            if len(followers) > 2 * _PREFETCH_HISTORY_MAX:
+                self._transition_texts[previous] = Counter(dict(followers.most_common(_PREFETCH_HISTORY_MAX)))
+        
+        candidates = [
+            text for text, _ in self._transition_texts[command_type].most_common(self.config["prefetch_candidates"])
+        ]
+        if not candidates:
+            return
+        # Les successeurs déjà analysés sont presque toujours encore en cache : le thread
+        # n'est sollicité qu'après une éviction ou un vidage (modèles chargés, configuration)
+        with self._intent_cache_lock:
+            missing = [text for text in candidates if text not in self._intent_result_cache]
+        # Lot précédent encore en cours : on n'empile pas de travail derrière lui
+        if missing and self._prefetch_slot.acquire(blocking=False):
+            self._prefetch_executor.submit(self._prefetch_intents, missing)
+    
+    def _prefetch_intents(self, candidates: List[str]):
+        """
+        Analyse d'avance les énoncés probables absents du cache (thread de préchargement).
+        
+        Les énoncés du lot sont encodés ensemble par Sentence Transformers et
+        analysés ensemble par spaCy : un appel par modèle au lieu d'un par énoncé.
+        """
+        try:
+            with self._intent_cache_lock:
+                generation = self._intent_cache_generation
+                missing = [text for text in candidates if text not in self._intent_result_cache]
+            if not missing:
+                return
+            
+            batch = [{} for _ in missing]
+            with self._analysis_lock:
+                if self.sentence_transformers_enabled and self._example_matrix is not None:
+                    for features, embedding in zip(batch, self._encode_queries(missing)):
+                        features["embedding"] = embedding
+                if self.spacy_enabled:
+                    for features, doc in zip(batch, self._spacy_docs(missing)):
+                        features["spacy_doc"] = doc
+            
+            for normalized_text, features in zip(missing, batch):
+                with self._analysis_lock:
+                    result = self._extract_intent_uncached(
+                        normalized_text, normalized_text, {}, time.time(), features, background=True
+                    )
+                self._store_cached_intent(normalized_text, result, generation)
+                self._prefetched += 1
+        except Exception as e:
+            self.logger.debug(f"Préchargement interrompu: {e}")
+        finally:
+            self._prefetch_slot.release()
+    
+    def _clear_intent_cache(self):
+        """Vide le cache d'intentions et invalide les analyses en cours."""
+        with self._intent_cache_lock:
+            self._intent_result_cache.clear()
+            self._intent_cache_generation += 1
+    
+    def _lookup_cached_intent(self, key: str) -> Optional[IntentResult]:
+        """Retourne le résultat mis en cache pour une clé et le marque comme récent."""
+        with self._intent_cache_lock:
+            cached = self._intent_result_cache.get(key)
+            if cached is not None:
+                self._intent_cache_hits += 1
+                self._intent_result_cache.move_to_end(key)
+        return cached
+    
+    def _extract_intent_uncached(self, text: str, normalized_text: str, context: Dict[str, Any],
+                                 start_time: float, precomputed: Optional[Dict[str, Any]] = None,
+                                 background: bool = False) -> IntentResult:
+        """
+        Analyse complète d'un texte normalisé par tous les modèles disponibles.
         
-        # MÉTHODE 2: spaCy NLP (bon pour la structure grammaticale)
+        precomputed, s'il est fourni, contient les sorties déjà calculées pour ce
+        texte dans un lot : "embedding" (voir _encode_queries) et "spacy_doc"
+        (voir _spacy_docs). background indique une analyse de préchargement, qui
+        ne compte ni dans _fastpath_hits ni dans _early_exits.
+        """
+        precomputed = precomputed or {}
+        # Les patterns regex sont évalués d'abord : quelques microsecondes
+        pattern_results = self._analyze_with_patterns_multi(normalized_text, context)
+        
+        # Voie rapide : énoncé court reconnu sans ambiguïté par un pattern, inutile
+        # de solliciter les modèles (plusieurs dizaines de ms par passe)
+        if (pattern_results
+                and len(normalized_text.split()) <= _FAST_PATH_MAX_WORDS
+                and max(confidence for _, confidence, _ in pattern_results) >= _FAST_PATH_MIN_CONFIDENCE):
+            final_result = self._consolidate_multi_detections(pattern_results, normalized_text, context)
+            if final_result:
+                if not background:
+                    self._fastpath_hits += 1
+                return self._create_result(final_result, "regex_fast_path", start_time)
+        
+        # Analyser avec les modèles disponibles pour détecter plusieurs intentions, du
+        # moins coûteux au plus coûteux : dès qu'une détection non ambiguë atteint
+        # early_exit_confidence, les modèles suivants sont sautés
+        st_results: List[Tuple[CommandType, float, Dict[str, Any]]] = []
+        spacy_results: List[Tuple[CommandType, float, Dict[str, Any]]] = []
+        bert_results: List[Tuple[CommandType, float, Dict[str, Any]]] = []
+        
+        # MÉTHODE 1: spaCy NLP (bon pour la structure grammaticale, quelques ms)
         if self.spacy_enabled:
-            spacy_results = self._analyze_with_spacy_multi(normalized_text, context)
-            if spacy_results:
-                all_detections.extend(spacy_results)
+            spacy_results = self._analyze_with_spacy_multi(normalized_text, context, precomputed.get("spacy_doc"))
+        
+        # MÉTHODE 2: Sentence Transformers (précision sémantique)
+        if self.sentence_transformers_enabled:
+            if self._is_conclusive(pattern_results + spacy_results):
+                if not background:
+                    self._early_exits["before_sentence_transformers"] += 1
+            else:
+                st_results = self._analyze_with_sentence_transformers_multi(
+                    normalized_text, context, precomputed.get("embedding")
+                )
         
         # MÉTHODE 3: BERT (si disponible, excellente compréhension contextuelle)
         if self.bert_enabled:
-            bert_results = self._analyze_with_bert_multi(normalized_text, context)
-            if bert_results:
-                all_detections.extend(bert_results)
+            if self._is_conclusive(pattern_results + spacy_results + st_results):
+                if not background:
+                    self._early_exits["before_bert"] += 1
+            else:
+                bert_results = self._analyze_with_bert_multi(normalized_text, context)
         
         # MÉTHODE 4: Patterns regex (fallback mais toujours utile)
-        pattern_results = self._analyze_with_patterns_multi(normalized_text, context)
-        if pattern_results:
-            all_detections.extend(pattern_results)
+        all_detections = st_results + spacy_results + bert_results + pattern_results
         
         # MÉTHODE 5: Classification par mots-clés (dernier recours)
         if not all_detections:
@@ -514,22 +1319,24 @@ class HybridNLPEngine:
             "fallback_to_ai", start_time
         )
     
+    def _is_conclusive(self, detections: List[Tuple[CommandType, float, Dict[str, Any]]]) -> bool:
+        """
+        Indique si les détections suffisent sans modèle plus coûteux : une confiance
+        d'au moins early_exit_confidence et aucun SOFT_QUIT, qui demande confirmation.
+        """
+        if not detections:
+            return False
+        if any(command_type == CommandType.SOFT_QUIT for command_type, _, _ in detections):
+            return False
+        return max(confidence for _, confidence, _ in detections) >= self.config["early_exit_confidence"]
+    
     def _normalize_text(self, text: str) -> str:
         """Normalise le texte pour l'analyse."""
         # Conversion basique
-        normalized = text.lower().strip()
-        normalized = re.sub(r'\s+', ' ', normalized)
-        
-        # Corrections phonétiques
-        phonetic_corrections = {
-            "pire": "peer", "père": "peer", "pair": "peer", "per": "peer",
-            "c l i": "cli", "t u i": "tui", "s u i": "sui", "a p i": "api"
-        }
-        
-        for incorrect, correct in phonetic_corrections.items():
-            normalized = normalized.replace(incorrect, correct)
+        normalized = _WHITESPACE_RE.sub(' ', text.lower().strip())
         
-        return normalized
+        # Corrections phonétiques, en une seule passe sur des mots entiers
+        return _PHONETIC_RE.sub(lambda m: _PHONETIC_CORRECTIONS[m.group(0)], normalized)
     
     def _consolidate_multi_detections(self, all_detections: List[Tuple[CommandType, float, Dict[str, Any]]], 
                                      text: str, context: Dict[str, Any]) -> Optional[Tuple[CommandType, float, Dict[str, Any]]]:
@@ -544,16 +1351,17 @@ class HybridNLPEngine:
         if not all_detections:
             return None
         
-        # Grouper par type de commande
-        command_groups = defaultdict(list)
+        # Meilleure détection par type de commande, en une passe (la première à égalité)
+        best_by_command: Dict[CommandType, Tuple[float, Dict[str, Any]]] = {}
         for cmd_type, confidence, params in all_detections:
-            command_groups[cmd_type].append((confidence, params))
+            current = best_by_command.get(cmd_type)
+            if current is None or confidence > current[0]:
+                best_by_command[cmd_type] = (confidence, params)
         
         # Rechercher les commandes d'arrêt
-        direct_quit = command_groups.get(CommandType.DIRECT_QUIT)
-        soft_quit = command_groups.get(CommandType.SOFT_QUIT)
-        other_commands = {k: v for k, v in command_groups.items() 
-                         if k not in [CommandType.DIRECT_QUIT, CommandType.SOFT_QUIT, CommandType.QUIT]}
+        direct_quit = best_by_command.get(CommandType.DIRECT_QUIT)
+        soft_quit = best_by_command.get(CommandType.SOFT_QUIT)
+        other_commands = {k: v for k, v in best_by_command.items() if k not in _QUIT_COMMAND_TYPES}
         
         # Analyser la position des commandes d'arrêt dans le texte
         quit_position = self._analyze_quit_position(text, direct_quit, soft_quit)
@@ -561,7 +1369,7 @@ class HybridNLPEngine:
         # RÈGLE 1 PRIORITAIRE: DIRECT_QUIT détecté -> TOUJOURS EXÉCUTION IMMÉDIATE
         # Cette règle a la priorité absolue car les commandes explicites doivent toujours être respectées
         if direct_quit:
-            best_confidence, best_params = max(direct_quit, key=lambda x: x[0])
+            best_confidence, best_params = direct_quit
             return CommandType.DIRECT_QUIT, best_confidence, {
                 **best_params,
                 "immediate_quit": True,
@@ -574,7 +1382,7 @@ class HybridNLPEngine:
         
         # RÈGLE 2: SOFT_QUIT détecté -> DEMANDER CONFIRMATION
         if soft_quit:
-            best_confidence, best_params = max(soft_quit, key=lambda x: x[0])
+            best_confidence, best_params = soft_quit
             confirmation_msg = self._generate_intelligent_confirmation(
                 text, "soft_quit_detected", soft_quit, other_commands, context
             )
@@ -593,26 +1401,25 @@ class HybridNLPEngine:
         
         return None
     
-    def _analyze_quit_position(self, text: str, direct_quit: List, soft_quit: List) -> str:
+    def _analyze_quit_position(self, text: str, direct_quit: Optional[Tuple], soft_quit: Optional[Tuple]) -> str:
         """Analyse la position des commandes d'arrêt dans le texte."""
         if not (direct_quit or soft_quit):
             return "none"
         
-        words = text.lower().split()
-        total_words = len(words)
+        lowered = text.lower()
         
-        # Mots-clés d'arrêt à rechercher
-        quit_keywords = ["arrête", "stop", "quitte", "ferme", "exit", "quit", "bye", "au revoir"]
+        # Dernier mot-clé d'arrêt, trouvé en une passe du moteur regex
+        last_match = None
+        for last_match in _QUIT_KEYWORD_RE.finditer(lowered):
+            pass
         
-        # Trouver la position du dernier mot-clé d'arrêt
-        last_quit_position = -1
-        for i, word in enumerate(words):
-            if any(keyword in word for keyword in quit_keywords):
-                last_quit_position = i
-        
-        if last_quit_position == -1:
+        if last_match is None:
             return "none"
         
+        # Rang du mot contenant le début de la correspondance
+        total_words = len(lowered.split())
+        last_quit_position = len(lowered[:last_match.start() + 1].split()) - 1
+        
         # Considérer comme "fin" si dans les 20% derniers mots
         if last_quit_position >= total_words * 0.8:
             return "end"
@@ -631,10 +1438,10 @@ class HybridNLPEngine:
         # Trouver la position du mot d'arrêt
         quit_word_index = -1
         quit_word = ""
-        for i, word in enumerate(words):
-            if any(keyword in word.lower() for keyword in quit_keywords):
+        for i, lowered_word in enumerate(text.lower().split()):
+            if any(keyword in lowered_word for keyword in quit_keywords):
                 quit_word_index = i
-                quit_word = word
+                quit_word = words[i]
                 break
         
         if quit_word_index == -1:
@@ -681,13 +1488,10 @@ class HybridNLPEngine:
         return sequence
 
     def _generate_intelligent_confirmation(self, original_text: str, scenario: str, 
-                                         quit_commands: List, other_commands: Dict, 
+                                         quit_commands: Optional[Tuple], other_commands: Dict, 
                                          context: Dict[str, Any]) -> str:
         """Génère une demande de confirmation intelligente basée sur le contexte."""
         
-        # Extraire des éléments contextuels du texte original
-        context_elements = self._extract_context_elements(original_text)
-        
         # Identifier la partie de phrase remise en question
         quit_position = self._analyze_quit_position(original_text, quit_commands, [])
         questioned_part = self._extract_questioned_part(original_text, quit_position)
@@ -716,26 +1520,27 @@ class HybridNLPEngine:
     
     def _extract_context_elements(self, text: str) -> Dict[str, Any]:
         """Extrait des éléments de contexte du texte original."""
+        lowered = text.lower()
         elements = {
-            "has_gratitude": any(word in text.lower() for word in ["merci", "thank", "thanks"]),
-            "has_politeness": any(word in text.lower() for word in ["s'il vous plaît", "please", "stp"]),
-            "has_urgency": any(word in text.lower() for word in ["maintenant", "now", "immédiatement"]),
-            "has_uncertainty": any(word in text.lower() for word in ["peut-être", "maybe", "je pense"]),
+            "has_gratitude": any(word in lowered for word in ["merci", "thank", "thanks"]),
+            "has_politeness": any(word in lowered for word in ["s'il vous plaît", "please", "stp"]),
+            "has_urgency": any(word in lowered for word in ["maintenant", "now", "immédiatement"]),
+            "has_uncertainty": any(word in lowered for word in ["peut-être", "maybe", "je pense"]),
             "word_count": len(text.split()),
             "has_question": "?" in text
         }
         return elements
     
-    def _create_command_sequence(self, text: str, soft_quit: List, other_commands: Dict, 
+    def _create_command_sequence(self, text: str, soft_quit: Optional[Tuple[float, Dict[str, Any]]],
+                               other_commands: Dict[CommandType, Tuple[float, Dict[str, Any]]],
                                context: Dict[str, Any]) -> Tuple[CommandType, float, Dict[str, Any]]:
         """Crée une séquence de commandes avec contexte approprié."""
         
-        # Trier les commandes par confiance
-        sorted_commands = []
-        for cmd_type, detections in other_commands.items():
-            best_conf, best_params = max(detections, key=lambda x: x[0])
-            sorted_commands.append((cmd_type, best_conf, best_params))
-        
+        # Trier les commandes par confiance (meilleure détection de chaque type)
+        sorted_commands = [
+            (cmd_type, best_conf, best_params)
+            for cmd_type, (best_conf, best_params) in other_commands.items()
+        ]
         sorted_commands.sort(key=lambda x: x[1], reverse=True)
         
         # Commande principale = celle avec la plus haute confiance
@@ -754,7 +1559,7 @@ class HybridNLPEngine:
         
         # Ajouter SOFT_QUIT à la fin si présent
         if soft_quit:
-            best_soft_conf, best_soft_params = max(soft_quit, key=lambda x: x[0])
+            best_soft_conf, best_soft_params = soft_quit
             command_sequence.append({
                 "command": CommandType.SOFT_QUIT,
                 "confidence": best_soft_conf,
@@ -793,55 +1598,40 @@ class HybridNLPEngine:
             "reason": "multiple_commands_detected_as_sequence"
         }
 
-    def _analyze_with_sentence_transformers_multi(self, text: str, context: Dict[str, Any]) -> List[Tuple[CommandType, float, Dict[str, Any]]]:
+    def _encode_queries(self, texts: List[str]) -> np.ndarray:
+        """Encode des énoncés en un seul appel au modèle (embeddings float32 normalisés)."""
+        return self.sentence_model.encode(
+            texts, batch_size=32, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False
+        ).astype(np.float32, copy=False)
+    
+    def _analyze_with_sentence_transformers_multi(self, text: str, context: Dict[str, Any],
+                                                  text_embedding: Optional[np.ndarray] = None) -> List[Tuple[CommandType, float, Dict[str, Any]]]:
         """Analyse avec Sentence Transformers pour détecter plusieurs intentions."""
         try:
-            if not self.sentence_model:
+            if not self.sentence_model or self._example_matrix is None:
                 return []
             
-            # Générer l'embedding du texte
-            text_embedding = self.sentence_model.encode([text])[0]
+            # Encoder uniquement le texte : les exemples sont pré-encodés (voir _build_semantic_index)
+            if text_embedding is None:
+                text_embedding = self._encode_queries([text])[0]
+            # Calcul en float32 : NumPy n'a pas de BLAS demi-précision sur CPU
+            similarities = np.matmul(self._example_matrix, text_embedding, dtype=np.float32)
             
             detections = []
             
-            # Comparer avec les exemples sémantiques de TOUS les types de commandes
-            for command_type, patterns in self.intent_patterns.items():
-                examples = patterns.get("semantic_examples", [])
+            # Similarité maximale par type de commande (tranches contiguës), puis
+            # recherche de l'exemple le plus proche pour les seules intentions retenues
+            slice_max = np.maximum.reduceat(similarities, self._example_starts)
+            for index in np.flatnonzero(slice_max >= self._example_thresholds):
+                command_type, start, end, _ = self._example_slices[index]
+                best = start + int(similarities[start:end].argmax())
+                max_similarity = float(similarities[best])
                 
-                if examples:
-                    # Générer les embeddings des exemples (avec cache)
-                    example_embeddings = []
-                    for example in examples:
-                        if example in self.embedding_cache:
-                            example_embeddings.append(self.embedding_cache[example])
-                        else:
-                            emb = self.sentence_model.encode([example])[0]
-                            if len(self.embedding_cache) < self.config["max_cache_size"]:
-                                self.embedding_cache[example] = emb
-                            example_embeddings.append(emb)
-                    
-                    # Calculer la similarité maximale
-                    similarities = [
-                        self._cosine_similarity(text_embedding, example_emb)
-                        for example_emb in example_embeddings
-                    ]
-                    
-                    max_similarity = max(similarities) if similarities else 0
-                    
-                    # Seuil adaptatif selon le type de commande
-                    threshold = 0.6  # Seuil de base plus permissif
-                    if command_type in [CommandType.DIRECT_QUIT, CommandType.SOFT_QUIT]:
-                        threshold = 0.55  # Plus sensible pour les arrêts
-                    elif command_type in [CommandType.HELP, CommandType.ANALYZE]:
-                        threshold = 0.65  # Plus strict pour les commandes importantes
-                    
-                    if max_similarity >= threshold:
-                        best_example = examples[similarities.index(max_similarity)]
-                        detections.append((command_type, max_similarity, {
-                            "best_example": best_example,
-                            "semantic_score": max_similarity,
-                            "method": "sentence_transformers"
-                        }))
+                detections.append((command_type, max_similarity, {
+                    "best_example": self._example_texts[best],
+                    "semantic_score": max_similarity,
+                    "method": "sentence_transformers"
+                }))
             
             return detections
             
@@ -849,39 +1639,44 @@ class HybridNLPEngine:
             self.logger.warning(f"⚠️ Erreur Sentence Transformers: {e}")
             return []
     
-    def _analyze_with_spacy_multi(self, text: str, context: Dict[str, Any]) -> List[Tuple[CommandType, float, Dict[str, Any]]]:
+    def _spacy_docs(self, texts: List[str]) -> List[Any]:
+        """Analyse des énoncés en lot avec nlp.pipe (minibatchs internes de spaCy)."""
+        return list(self.spacy_model.pipe(
+            texts,
+            batch_size=self.config["spacy_batch_size"],
+            n_process=self.config["spacy_n_process"]
+        ))
+    
+    def _analyze_with_spacy_multi(self, text: str, context: Dict[str, Any],
+                                  doc: Optional[Any] = None) -> List[Tuple[CommandType, float, Dict[str, Any]]]:
         """Analyse avec spaCy pour détecter plusieurs intentions."""
         try:
             if not self.spacy_model:
                 return []
             
-            doc = self.spacy_model(text)
+            if doc is None:
+                doc = self._spacy_docs([text])[0]
             detections = []
             
             # Analyse des entités nommées et POS tags
             entities = [(ent.text, ent.label_) for ent in doc.ents]
-            pos_tags = [(token.text, token.pos_) for token in doc]
             
-            # Analyse des mots-clés pour chaque type de commande
-            for command_type, patterns in self.intent_patterns.items():
-                keywords = patterns.get("keywords", [])
-                confidence = 0.0
-                found_keywords = []
-                
-                # Compter les mots-clés trouvés
-                for keyword in keywords:
-                    if keyword in text.lower():
-                        found_keywords.append(keyword)
-                        confidence += 0.3
-                
-                # Analyser la structure grammaticale
-                verb_count = sum(1 for _, pos in pos_tags if pos == "VERB")
-                noun_count = sum(1 for _, pos in pos_tags if pos == "NOUN")
+            # Structure grammaticale : identique pour toutes les intentions
+            verb_count = sum(1 for token in doc if token.pos_ == "VERB")
+            noun_count = sum(1 for token in doc if token.pos_ == "NOUN")
+            has_gratitude = any(token.lower_ in ("merci", "parfait") for token in doc)
+            lowered = text.lower()
+            
+            # Analyse des mots-clés : seules les intentions dont un mot-clé est
+            # présent peuvent être retenues (un seul parcours du texte pour toutes)
+            for intent_index, found_keywords in self._match_keywords(lowered).items():
+                command_type = self._keyword_intents[intent_index]
+                confidence = 0.3 * len(found_keywords)
                 
                 # Bonus basé sur le type de commande et la structure
-                if command_type == CommandType.DIRECT_QUIT and any(token.pos_ == "VERB" for token in doc):
+                if command_type == CommandType.DIRECT_QUIT and verb_count > 0:
                     confidence += 0.2
-                elif command_type == CommandType.SOFT_QUIT and any(token.text.lower() in ["merci", "parfait"] for token in doc):
+                elif command_type == CommandType.SOFT_QUIT and has_gratitude:
                     confidence += 0.3
                 elif command_type == CommandType.HELP and "?" in text:
                     confidence += 0.2
@@ -908,33 +1703,31 @@ class HybridNLPEngine:
     def _analyze_with_bert_multi(self, text: str, context: Dict[str, Any]) -> List[Tuple[CommandType, float, Dict[str, Any]]]:
         """Analyse avec BERT pour détecter plusieurs intentions."""
         try:
-            if not self.bert_enabled or not hasattr(self, 'bert_model'):
+            if not self.bert_enabled or self._bert_prototypes is None:
+                return []
+            if not self._bert_heldout.get("enabled", True):
                 return []
             
-            detections = []
+            # Une seule passe BERT sur l'énoncé, comparé à tous les prototypes d'intention
+            # (voir _build_bert_prototypes). Les embeddings BERT bruts étant peu
+            # discriminants, seule l'intention la plus proche est proposée, et
+            # seulement avec une avance nette sur la deuxième.
+            scores = self._bert_prototypes @ self._bert_encode([text])[0]
+            best = self._select_bert_prototype(scores)
+            if best is None:
+                return []
             
-            # Pour chaque type de commande, calculer la probabilité avec BERT
-            for command_type in CommandType:
-                # Créer un prompt de classification pour BERT
-                prompt = f"L'intention de '{text}' est-elle '{command_type.value}'?"
-                
-                # Utiliser BERT pour la classification (implémentation simplifiée)
-                # Dans une vraie implémentation, on utiliserait un modèle fine-tuné
-                inputs = self.bert_tokenizer(prompt, return_tensors="pt", max_length=512, truncation=True)
-                outputs = self.bert_model(**inputs)
-                
-                # Extraire une probabilité (méthode simplifiée)
-                # En réalité, il faudrait un modèle de classification fine-tuné
-                logits = outputs.last_hidden_state.mean(dim=1).mean(dim=1)  # Moyenne sur toutes les dimensions
-                confidence = torch.sigmoid(logits).item()
-                
-                if confidence >= 0.6:
-                    detections.append((command_type, confidence, {
-                        "bert_confidence": confidence,
-                        "method": "bert_classification"
-                    }))
+            # Une détection d'arrêt l'emporte sur tout à la consolidation : elle doit
+            # venir des patterns, des mots-clés ou des autres modèles, jamais de BERT seul
+            command_type = self._bert_prototype_types[best]
+            if command_type in _QUIT_COMMAND_TYPES:
+                return []
             
-            return detections
+            confidence = float(scores[best])
+            return [(command_type, confidence, {
+                "bert_confidence": confidence,
+                "method": "bert_classification"
+            })]
             
         except Exception as e:
             self.logger.warning(f"⚠️ Erreur BERT: {e}")
@@ -944,54 +1737,63 @@ class HybridNLPEngine:
         """Analyse avec patterns regex pour détecter plusieurs intentions."""
         detections = []
         
-        for command_type, patterns_config in self.intent_patterns.items():
-            patterns = patterns_config.get("patterns", [])
+        text_length = len(text.strip())
+        
+        for command_type, fused, patterns in self._compiled_patterns:
+            # Aucun pattern de l'intention ne correspond : une seule recherche l'établit
+            if fused is not None and not fused.search(text):
+                continue
             
+            # Sinon, premier pattern dans l'ordre déclaré (le match retenu en dépend)
             for pattern in patterns:
-                try:
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        # Calculer la confiance basée sur la qualité du match
-                        match_length = len(match.group(0))
-                        text_length = len(text.strip())
-                        coverage = match_length / text_length if text_length > 0 else 0
-                        
-                        # Confiance basée sur la couverture et le type de pattern
-                        confidence = 0.7 + (coverage * 0.3)
-                        confidence = min(confidence, 0.95)  # Cap à 95%
-                        
-                        detections.append((command_type, confidence, {
-                            "matched_pattern": pattern,
-                            "matched_text": match.group(0),
-                            "coverage": coverage,
-                            "method": "regex_pattern"
-                        }))
-                        break  # Un seul match par type de commande
-                        
-                except re.error as e:
-                    self.logger.warning(f"⚠️ Erreur pattern regex '{pattern}': {e}")
+                match = pattern.search(text)
+                if match:
+                    # Calculer la confiance basée sur la qualité du match
+                    match_length = len(match.group(0))
+                    coverage = match_length / text_length if text_length > 0 else 0
+                    
+                    # Confiance basée sur la couverture et le type de pattern
+                    confidence = 0.7 + (coverage * 0.3)
+                    confidence = min(confidence, 0.95)  # Cap à 95%
+                    
+                    detections.append((command_type, confidence, {
+                        "matched_pattern": pattern.pattern,
+                        "matched_text": match.group(0),
+                        "coverage": coverage,
+                        "method": "regex_pattern"
+                    }))
+                    break  # Un seul match par type de commande
         
         return detections
     
     def _analyze_with_keywords_multi(self, text: str, context: Dict[str, Any]) -> List[Tuple[CommandType, float, Dict[str, Any]]]:
         """Analyse basée sur les mots-clés pour détecter plusieurs intentions (fallback)."""
         detections = []
-        words = text.lower().split()
+        text = text.lower()
         
-        for command_type, patterns_config in self.intent_patterns.items():
-            keywords = patterns_config.get("keywords", [])
-            
-            found_keywords = []
-            total_score = 0
-            
-            for keyword in keywords:
-                if keyword in text.lower():
-                    found_keywords.append(keyword)
-                    # Bonus si le mot-clé est en début ou fin de phrase
-                    if text.lower().startswith(keyword) or text.lower().endswith(keyword):
-                        total_score += 0.4
-                    else:
-                        total_score += 0.3
+        found_ids = self._find_keyword_ids(text)
+        if not found_ids:
+            return detections
+        
+        # Score de chaque mot-clé trouvé : bonus si en début ou fin de phrase
+        keyword_scores = np.zeros(len(self._keyword_texts))
+        for keyword_id in found_ids:
+            keyword = self._keyword_texts[keyword_id]
+            keyword_scores[keyword_id] = 0.4 if text.startswith(keyword) or text.endswith(keyword) else 0.3
+        
+        # Somme par intention en un seul bincount sur les entrées touchées
+        entries = self._keyword_hit_entries(found_ids)
+        intent_scores = np.bincount(
+            self._keyword_entry_intent[entries],
+            weights=keyword_scores[self._keyword_entry_keyword[entries]],
+            minlength=len(self._keyword_intents)
+        )
+        matches = self._group_keyword_entries(entries)
+        
+        for intent_index in np.flatnonzero(intent_scores).tolist():
+            command_type = self._keyword_intents[intent_index]
+            found_keywords = matches[intent_index]
+            total_score = float(intent_scores[intent_index])
             
             if found_keywords:
                 # Calculer la confiance basée sur le nombre et la qualité des matches
@@ -1005,19 +1807,6 @@ class HybridNLPEngine:
         
         return detections
 
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Calcule la similarité cosinus entre deux vecteurs."""
-        try:
-            # Normaliser les vecteurs
-            norm_vec1 = vec1 / np.linalg.norm(vec1)
-            norm_vec2 = vec2 / np.linalg.norm(vec2)
-            
-            # Calculer la similarité cosinus
-            similarity = np.dot(norm_vec1, norm_vec2)
-            return float(similarity)
-        except:
-            return 0.0
-
     def _create_result(self, detection_result: Any, method_used: str, start_time: float) -> 'IntentResult':
         """Crée un objet IntentResult à partir du résultat de détection."""
         processing_time = time.time() - start_time
@@ -1083,6 +1872,16 @@ class HybridNLPEngine:
             "min_processing_time": min_time,
             "total_processed": len(self.processing_times),
             "method_statistics": method_stats,
+            "fastpath_hits": self._fastpath_hits,
+            "early_exits": dict(self._early_exits),
+            "prefetched": self._prefetched,
+            "bert_heldout": dict(self._bert_heldout),
+            "intent_cache": {
+                "size": len(self._intent_result_cache),
+                "max_size": self.config["max_cache_size"],
+                "hits": self._intent_cache_hits,
+                "misses": self._intent_cache_misses
+            },
             "models_available": {
                 "spacy": self.spacy_enabled,
                 "sentence_transformers": self.sentence_transformers_enabled,
@@ -1093,3 +1892,7 @@ class HybridNLPEngine:
     def update_config(self, new_config: Dict[str, Any]):
         """Met à jour la configuration."""
         self.config.update(new_config)
+        if "bert_similarity_threshold" in new_config or "bert_margin" in new_config:
+            self._check_bert_heldout()
+        # Les résultats en cache dépendent des seuils : repartir d'un cache vide
+        self._clear_intent_cache()
@@ -8,46 +8,80 @@ analyse contextuelle, assistance proactive et apprentissage adaptatif.
 
 import os
 import sys
+import atexit
+import copy
 import time
 import threading
 import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import re
 import json
-import math
 import datetime
 import psutil
 import numpy as np
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple, Union
-from dataclasses import dataclass, asdict
-from collections import deque, defaultdict
+from typing import Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass
+from collections import OrderedDict, deque, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Fix OMP warning: "Forking a process while a parallel region is active is potentially unsafe."
 os.environ["OMP_NUM_THREADS"] = "1"
 
-# Configuration du logging avancée
+# Répertoires utilisateur, résolus une seule fois à l'import
+_HOME = Path.home()
+_PEER_HOME = _HOME / '.peer'
+_PREFERENCES_PATH = _PEER_HOME / 'sui_preferences.json'
+_WHISPER_CACHE_DIR = str(_HOME / '.cache' / 'whisper')
+
+# Configuration du logging avancée. Le journal fichier n'est ouvert qu'à la
+# création de l'interface (voir _enable_file_logging), pas à l'import.
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(os.path.expanduser('~/.peer/sui.log'), mode='a')
-    ]
+    format=_LOG_FORMAT,
+    handlers=[logging.StreamHandler(sys.stdout)]
 )
 
-# Importation des dépendances
+_file_log_listener: Optional[QueueListener] = None
+_file_log_lock = threading.Lock()
+
+
+def _enable_file_logging():
+    """
+    Attache le journal ~/.peer/sui.log (rotatif, 10 Mo x 3) au logger racine.
+    
+    Les enregistrements passent par une file vidée par un thread dédié : les
+    appels de log des boucles vocales n'attendent jamais l'écriture disque.
+    Sans effet si le journal est déjà actif.
+    """
+    global _file_log_listener
+    with _file_log_lock:
+        if _file_log_listener is not None:
+            return
+        try:
+            _PEER_HOME.mkdir(exist_ok=True)
+            file_handler = RotatingFileHandler(
+                _PEER_HOME / 'sui.log', maxBytes=10 * 1024 * 1024, backupCount=3, encoding='utf-8'
+            )
+        except OSError as e:
+            logging.getLogger("OmniscientSUI").warning("Journal fichier indisponible: %s", e)
+            return
+        file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        _file_log_listener = QueueListener(log_queue, file_handler)
+        _file_log_listener.start()
+        logging.getLogger().addHandler(QueueHandler(log_queue))
+        # Vider la file et fermer le fichier à la sortie du processus
+        atexit.register(_file_log_listener.stop)
+
+# Importation des dépendances légères. Les modèles lourds (whisper, transformers,
+# torch, moteur NLP hybride) sont importés par les méthodes qui les initialisent.
 try:
     import pyaudio
     import numpy as np
-    import whisper
-    import pyttsx3
-    from pydantic import BaseModel
     import webrtcvad  # Pour une meilleure détection d'activité vocale
-    # Dépendances pour l'IA intelligente avec BERT
-    from transformers import AutoTokenizer, AutoModel, pipeline
-    import torch
-    import torch.nn.functional as F
 except ImportError as e:
     print(f"Erreur lors du chargement des dépendances: {e}")
     print("Veuillez installer les dépendances requises:")
@@ -56,16 +90,205 @@ except ImportError as e:
 
 # Importation des modules Peer refactorisés
 from peer.core import PeerDaemon, CoreRequest, CoreResponse, CommandType, ResponseType, InterfaceType
-from peer.core.protocol import InterfaceAdapter
+from peer.core.protocol import InterfaceAdapter, CoreProtocol
 from peer.infrastructure.adapters.simple_tts_adapter import SimpleTTSAdapter
 
-# Import du nouveau moteur NLP hybride
-try:
-    from .nlp_engine import HybridNLPEngine
-    NLP_ENGINE_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ Moteur NLP hybride non disponible: {e}")
-    NLP_ENGINE_AVAILABLE = False
+
+# Cache des fichiers de configuration JSON déjà lus, indexé par chemin absolu et
+# invalidé dès que la date de modification ou la taille du fichier change
+_JSON_CACHE_MAX_ENTRIES = 100
+_json_cache: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+_json_cache_lock = threading.Lock()
+
+def _load_json_cached(path: Path) -> Any:
+    """
+    Charge un fichier JSON en réutilisant le résultat d'une lecture précédente
+    tant que le fichier n'a pas changé.
+    
+    Une copie est retournée : l'appelant peut modifier le contenu sans altérer
+    le cache.
+    """
+    key = str(Path(path).resolve())
+    stat = os.stat(key)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    
+    with _json_cache_lock:
+        entry = _json_cache.get(key)
+        if entry is not None and entry[:2] == signature:
+            _json_cache.move_to_end(key)
+            return copy.deepcopy(entry[2])
+    
+    with open(key, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    with _json_cache_lock:
+        _json_cache[key] = (signature[0], signature[1], data)
+        _json_cache.move_to_end(key)
+        if len(_json_cache) > _JSON_CACHE_MAX_ENTRIES:
+            _json_cache.popitem(last=False)
+    return copy.deepcopy(data)
+
+
+# Tables de correspondance statiques, construites une seule fois à l'import.
+# Les paires sont appliquées dans l'ordre : l'ordre compte pour les
+# remplacements et les recherches de sous-chaînes.
+# Corrections phonétiques, appliquées en une seule passe et sur des mots entiers
+# (« super » ne devient pas « supeer »)
+_PHONETIC_CORRECTIONS: Dict[str, str] = {
+    "pire": "peer",
+    "père": "peer",
+    "pair": "peer",
+    "per": "peer",
+    "c l i": "cli",
+    "t u i": "tui",
+    "s u i": "sui",
+    "a p i": "api",
+}
+_PHONETIC_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, _PHONETIC_CORRECTIONS)) + r")\b")
+
+# Expressions régulières de l'analyse des commandes, compilées une seule fois.
+# Les motifs de chaque famille sont réunis en une seule alternative : une
+# recherche par énoncé au lieu d'une par motif.
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Exclusions strictes de la détection d'arrêt poli
+_QUIT_EXCLUSION_PATTERNS: Tuple[str, ...] = (
+    # Demandes d'aide explicites
+    r"(?:aide|help|aidez?[-\s]moi|assiste[-\s]moi)",
+    r"(?:explique|expliquer|comment|pourquoi|que fait|comment faire)",
+    r"(?:analyse|analyser|examine|examiner|regarde|vérifie)",
+    r"(?:optimise|optimiser|améliore|améliorer|suggère|suggérer)",
+    r"(?:peux[-\s]tu|pourrais[-\s]tu|tu peux).+(?:aide|expliquer|analyser|optimiser|faire)",
+    r"(?:dis[-\s]moi|montre[-\s]moi|raconte[-\s]moi)",
+    # Actions spécifiques demandées
+    r"(?:code|fichier|fonction|classe|variable|méthode|projet)",
+    r"(?:débug|debug|erreur|problème|bug)",
+    r"(?:créer|créé|modifier|modifie|ajouter|ajoute)",
+    # Phrases mixtes avec remerciement + demande
+    r"merci.+(?:aide|analyse|explique|optimise|montre|dis|fait|peux)",
+)
+_QUIT_EXCLUSION_RE = re.compile("|".join(f"(?:{p})" for p in _QUIT_EXCLUSION_PATTERNS), re.IGNORECASE)
+
+# Formules d'arrêt poli très spécifiques
+_STRICT_QUIT_PATTERNS: Tuple[str, ...] = (
+    # Remerciements de fin SANS demande d'action
+    r"^merci\s+(?:beaucoup|bien|pour\s+tout|c'est\s+parfait|c'est\s+bon)$",
+    r"^(?:c'est\s+parfait|c'est\s+bon|parfait|excellent)\s*(?:merci)?$",
+    r"^merci\s+(?:tu\s+peux\s+t'arrêter|pour\s+ton\s+aide)$",
+    
+    # Formules d'au revoir claires
+    r"^(?:au\s+revoir|à\s+bientôt|bye|goodbye|bonne\s+journée|bonne\s+soirée)$",
+    
+    # Demandes d'arrêt explicites
+    r"^(?:arrête|stop|tu\s+peux\s+arrêter|arrête[-\s]toi)(?:\s+maintenant|\s+stp|\s+merci)?$",
+    r"^(?:ça\s+suffit|c'est\s+tout|j'ai\s+fini)(?:\s+merci)?$",
+    
+    # Combinaisons très spécifiques de politesse + arrêt
+    r"merci\s+(?:tu\s+peux\s+(?:partir|te\s+reposer|t'en\s+aller)|pour\s+tout\s+au\s+revoir)",
+    r"(?:très\s+bien|excellent)\s+merci\s+(?:arrête|tu\s+peux\s+arrêter)",
+)
+_STRICT_QUIT_RE = re.compile("|".join(f"(?:{p})" for p in _STRICT_QUIT_PATTERNS), re.IGNORECASE)
+
+# Mots qui indiquent une satisfaction/fin après un "merci"
+_SATISFACTION_WORDS = ("exactement", "ce qu'il me fallait", "c'est tout", "pour tout", "beaucoup")
+# Mots qui indiquent clairement une demande continue
+_CONTINUATION_WORDS = ("pour", "de", "explique", "analyse", "optimise", "comment", "peux-tu", "aide")
+
+# Mots seuls reconnus par l'analyse sémantique sélective
+_ULTRA_SIMPLE_COMMANDS: Dict[str, CommandType] = {
+    "aide": CommandType.HELP,
+    "help": CommandType.HELP,
+    "statut": CommandType.STATUS,
+    "état": CommandType.STATUS,
+    "status": CommandType.STATUS,
+    "heure": CommandType.TIME,
+    "time": CommandType.TIME,
+}
+
+# Adaptations de base pour la synthèse vocale
+_SPEECH_ADAPTATIONS: Tuple[Tuple[str, str], ...] = (
+    ("Peer", "Pire"),
+    ("CLI", "C L I"),
+    ("TUI", "T U I"),
+    ("SUI", "S U I"),
+    ("API", "A P I"),
+    ("0.2.0", "version zéro point deux point zéro"),
+    ("ERROR", "Erreur"),
+    ("WARNING", "Attention"),
+    ("INFO", "Information"),
+    ("SUCCESS", "Succès"),
+    ("OK", "D'accord"),
+    ("NOK", "Pas bon"),
+)
+
+# Mots déclenchant directement une intention de commande
+_DIRECT_COMMAND_INTENTS: Tuple[Tuple[str, str], ...] = (
+    ('aide', 'HELP'),
+    ('help', 'HELP'),
+    ('version', 'VERSION'),
+    ('statut', 'STATUS'),
+    ('status', 'STATUS'),
+    ('temps', 'TIME'),
+    ('time', 'TIME'),
+    ('heure', 'TIME'),
+    ('date', 'DATE'),
+    ('arrêt', 'STOP'),
+    ('stop', 'STOP'),
+    ('pause', 'PAUSE'),
+    ('continuer', 'CONTINUE'),
+    ('continue', 'CONTINUE'),
+)
+
+
+# Nombre maximal d'embeddings BERT conservés (les moins récemment utilisés sont évincés)
+_EMBEDDING_CACHE_MAX_ENTRIES = 1000
+
+# Préférences utilisateur par défaut (valeurs scalaires : une copie superficielle suffit)
+_DEFAULT_PREFERENCES: Dict[str, Any] = {
+    "response_style": "balanced",  # concise, balanced, detailed
+    "voice_speed": 1.0,
+    "voice_volume": 0.8,
+    "language_preference": "fr",
+    "proactive_assistance": True,
+    "context_awareness": True,
+    "learning_mode": True,
+    "notification_level": "normal"  # minimal, normal, verbose
+}
+
+# Messages courts prononcés régulièrement par l'interface, synthétisés dans le
+# cache TTS dès le démarrage pour être lus sans délai
+_COMMON_PHRASES: Tuple[str, ...] = (
+    "Je reprends.",
+    "Mise en pause. Dites 'continue' pour reprendre.",
+    "Au revoir !",
+    "D'accord, j'arrête.",
+    "D'accord, au revoir !",
+    "D'accord, j'exécute les commandes.",
+    "D'accord, je continue.",
+    "Je n'ai pas bien compris. Pouvez-vous dire 'oui' ou 'non' ?",
+    "Timeout de confirmation. Action annulée.",
+)
+
+# Messages d'accueil et d'adieu complets, indexés par heure (0-23) : le texte
+# est choisi par simple indexation au lieu d'être reconstruit à chaque appel
+_GREETING_BY_HOUR: Tuple[str, ...] = tuple(
+    ("Bonjour" if hour < 12 else "Bon après-midi" if hour < 18 else "Bonsoir")
+    + " ! Peer activée et prête. Je suis à votre service pour toute tâche ou question."
+    for hour in range(24)
+)
+_FAREWELL_BY_HOUR: Tuple[str, ...] = tuple(
+    "Interface vocale Peer omnisciente en cours d'arrêt. "
+    + ("Bonne journée" if 6 <= hour < 18 else "Bonne soirée" if 18 <= hour < 22 else "Bonne nuit")
+    + "."
+    for hour in range(24)
+)
+
+# Attente maximale des réponses encore en file avant l'au revoir (commande QUIT)
+_VOCALIZE_DRAIN_TIMEOUT = 30.0
+
+# Compléments ajoutés par le style de réponse détaillé
+_DETAILED_SUCCESS_SUFFIX = " Tout fonctionne parfaitement."
+_DETAILED_ERROR_SUFFIX = " Je peux vous aider à résoudre ce problème si vous le souhaitez."
 
 
 @dataclass
@@ -94,7 +317,7 @@ class VoiceActivityMetrics:
 @dataclass
 class ContextualInfo:
     """Informations contextuelles pour l'assistance intelligente."""
-    current_time: datetime.datetime
+    current_time: float  # Horodatage time.time() ; voir current_datetime
     session_duration: float
     commands_count: int
     last_commands: List[str]
@@ -103,6 +326,11 @@ class ContextualInfo:
     recent_errors: List[str]
     working_directory: str
     active_files: List[str]
+    
+    @property
+    def current_datetime(self) -> datetime.datetime:
+        """Date et heure locales correspondant à current_time, construites à la demande."""
+        return datetime.datetime.fromtimestamp(self.current_time)
 
 
 class IntelligentSUISpeechAdapter(InterfaceAdapter):
@@ -222,21 +450,23 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
     def _init_hybrid_nlp_engine(self):
         """Initialise le moteur NLP hybride robuste."""
         try:
-            if NLP_ENGINE_AVAILABLE:
+            try:
+                from .nlp_engine import HybridNLPEngine
+                nlp_engine_available = True
+            except ImportError as e:
+                self.logger.warning(f"⚠️ Moteur NLP hybride non disponible: {e}")
+                nlp_engine_available = False
+            
+            if nlp_engine_available:
                 self.logger.info("🧠 Initialisation du moteur NLP hybride...")
                 self.nlp_engine = HybridNLPEngine()
                 self.hybrid_nlp_enabled = True
                 
-                # Compatibilité avec l'ancien système BERT
-                stats = self.nlp_engine.get_performance_stats()
-                models = stats.get("models_available", {})
-                self.bert_enabled = models.get("bert", False)
-                
-                self.logger.info("✅ Moteur NLP hybride initialisé avec succès")
+                # L'agent BERT legacy n'est pas chargé quand le moteur hybride est actif :
+                # le moteur gère lui-même BERT, chargé en arrière-plan avec ses autres modèles
+                self.bert_enabled = False
                 
-                # Afficher les modèles disponibles
-                available_models = [name for name, available in models.items() if available]
-                self.logger.info(f"📊 Modèles NLP disponibles: {', '.join(available_models) if available_models else 'Aucun'}")
+                self.logger.info("✅ Moteur NLP hybride initialisé (modèles en cours de chargement en arrière-plan)")
                 
             else:
                 self.logger.warning("⚠️ Moteur NLP hybride non disponible")
@@ -254,6 +484,7 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
         """Initialise l'intelligence BERT pour l'interprétation des commandes vocales."""
         try:
             self.logger.info("🧠 Initialisation de l'agent IA BERT pour SUI...")
+            from transformers import AutoTokenizer, AutoModel, PreTrainedTokenizerFast, pipeline
             
             # Liste des modèles par ordre de préférence
             models_to_try = [
@@ -268,7 +499,11 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
                     self.logger.info(f"📥 Tentative de chargement: {model_name}")
                     
                     # Tokenizer et modèle BERT avec configuration compatible
-                    self.bert_tokenizer = AutoTokenizer.from_pretrained(model_name)
+                    self.bert_tokenizer = AutoTokenizer.from_pretrained(
+                        model_name, use_fast=True, clean_up_tokenization_spaces=False
+                    )
+                    if not isinstance(self.bert_tokenizer, PreTrainedTokenizerFast):
+                        self.logger.warning(f"⚠️ Tokenizer rapide (Rust) indisponible pour {model_name} - tokenisation Python plus lente")
                     
                     # Configuration du modèle pour éviter les problèmes de compatibilité
                     try:
@@ -319,9 +554,12 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
                 "semantic_similarity_threshold": 0.8
             }
             
-            # Cache pour les embeddings fréquents
-            self.embedding_cache = {}
+            # Cache LRU des embeddings fréquents (voir _get_bert_embedding)
+            self.embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
             self.frequent_patterns = {}
+            # Embeddings normalisés des patterns d'entraînement (voir _get_intention_matrix)
+            self._intention_matrix: Optional[np.ndarray] = None
+            self._intention_labels: List[str] = []
             
             # Intelligence adaptative
             self.adaptive_learning = True
@@ -394,29 +632,19 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
     def _load_user_preferences(self) -> Dict[str, Any]:
         """Charge les préférences utilisateur depuis le fichier de configuration."""
         try:
-            preferences_path = Path.home() / '.peer' / 'sui_preferences.json'
+            preferences_path = _PREFERENCES_PATH
             if preferences_path.exists():
-                with open(preferences_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _load_json_cached(preferences_path)
         except Exception as e:
             self.logger.warning(f"Impossible de charger les préférences: {e}")
         
         # Préférences par défaut
-        return {
-            "response_style": "balanced",  # concise, balanced, detailed
-            "voice_speed": 1.0,
-            "voice_volume": 0.8,
-            "language_preference": "fr",
-            "proactive_assistance": True,
-            "context_awareness": True,
-            "learning_mode": True,
-            "notification_level": "normal"  # minimal, normal, verbose
-        }
+        return dict(_DEFAULT_PREFERENCES)
     
     def _save_user_preferences(self):
         """Sauvegarde les préférences utilisateur."""
         try:
-            preferences_path = Path.home() / '.peer' / 'sui_preferences.json'
+            preferences_path = _PREFERENCES_PATH
             preferences_path.parent.mkdir(exist_ok=True)
             with open(preferences_path, 'w', encoding='utf-8') as f:
                 json.dump(self.user_preferences, f, indent=2, ensure_ascii=False)
@@ -438,18 +666,18 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
             command = CommandType.QUIT
             parameters["original_command_type"] = "DIRECT_QUIT"
             parameters["immediate_quit"] = True
-            self.logger.info(f"🔄 Conversion: DIRECT_QUIT → QUIT (immédiat)")
+            self.logger.info("🔄 Conversion: DIRECT_QUIT → QUIT (immédiat)")
         elif command == CommandType.SOFT_QUIT:
             command = CommandType.QUIT  
             parameters["original_command_type"] = "SOFT_QUIT"
             parameters["confirmation_needed"] = True
-            self.logger.info(f"🔄 Conversion: SOFT_QUIT → QUIT (avec confirmation)")
+            self.logger.info("🔄 Conversion: SOFT_QUIT → QUIT (avec confirmation)")
         
         # Enrichir avec des informations contextuelles
         enriched_context = {
             "original_speech": speech_input,
             "normalized": normalized_input,
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": time.time(),
             "user_preferences": self.user_preferences,
             "command_history": list(self.command_history)[-5:],  # Les 5 dernières commandes
             "session_context": context or {}
@@ -525,25 +753,10 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
     def _normalize_speech_input(self, speech_input: str) -> str:
         """Normalisation avancée de l'entrée vocale."""
         # Convertir en minuscules et supprimer espaces excessifs
-        normalized = speech_input.lower().strip()
-        normalized = re.sub(r'\s+', ' ', normalized)
+        normalized = _WHITESPACE_RE.sub(' ', speech_input.lower().strip())
         
         # Corrections phonétiques courantes
-        phonetic_corrections = {
-            "pire": "peer",
-            "père": "peer", 
-            "pair": "peer",
-            "per": "peer",
-            "c l i": "cli",
-            "t u i": "tui",
-            "s u i": "sui",
-            "a p i": "api"
-        }
-        
-        for incorrect, correct in phonetic_corrections.items():
-            normalized = normalized.replace(incorrect, correct)
-        
-        return normalized
+        return _PHONETIC_RE.sub(lambda m: _PHONETIC_CORRECTIONS[m.group(0)], normalized)
     
     def _parse_intelligent_speech_command(self, normalized_input: str, context: Dict[str, Any]) -> Tuple[CommandType, Dict[str, Any]]:
         """
@@ -563,7 +776,7 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
         
         # PRIORITÉ 1: Détection des intentions d'arrêt polies (toujours en priorité absolue)
         if self._detect_polite_quit_intent(normalized_input):
-            self.logger.info(f"🛑 Intention d'arrêt polie détectée: '{normalized_input}'")
+            self.logger.info("🛑 Intention d'arrêt polie détectée: '%s'", normalized_input)
             return CommandType.QUIT, {"intent": "polite_quit", "full_text": normalized_input}
         
         # PRIORITÉ 2: Moteur NLP hybride (nouveau système efficace)
@@ -579,10 +792,10 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
                         "fallback_used": nlp_result.fallback_used,
                         **nlp_result.parameters
                     }
-                    self.logger.info(f"🧠 NLP Hybride: {nlp_result.command_type.value} (confiance: {nlp_result.confidence:.2f}, méthode: {nlp_result.method_used})")
+                    self.logger.info("🧠 NLP Hybride: %s (confiance: %.2f, méthode: %s)", nlp_result.command_type.value, nlp_result.confidence, nlp_result.method_used)
                     return nlp_result.command_type, parameters
                 else:
-                    self.logger.debug(f"🔍 NLP hybride: confiance insuffisante ({nlp_result.confidence:.2f})")
+                    self.logger.debug("🔍 NLP hybride: confiance insuffisante (%.2f)", nlp_result.confidence)
             except Exception as e:
                 self.logger.warning(f"⚠️ Erreur moteur NLP hybride: {e}")
         
@@ -591,7 +804,7 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
             bert_result = self._analyze_with_bert_intelligence(normalized_input, context)
             if bert_result:
                 command_type, parameters = bert_result
-                self.logger.info(f"🧠 BERT legacy: {command_type.value} (confiance: {parameters.get('bert_confidence', 0):.2f})")
+                self.logger.info("🧠 BERT legacy: %s (confiance: %.2f)", command_type.value, parameters.get('bert_confidence', 0))
                 return command_type, parameters
         
         # PRIORITÉ 4: Rétrocompatibilité - Recherche de correspondance directe
@@ -606,7 +819,7 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
                 parameters = self._extract_parameters(normalized_input, trigger, context)
                 parameters["fallback_method"] = "direct_mapping"
                 self.command_patterns[command.value] += 1
-                self.logger.debug(f"🔄 Correspondance directe trouvée: {trigger} -> {command.value}")
+                self.logger.debug("🔄 Correspondance directe trouvée: %s -> %s", trigger, command.value)
                 return command, parameters
         
         # PRIORITÉ 5: Analyse contextuelle avancée (fallback)
@@ -615,7 +828,7 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
             if contextual_command:
                 command_type, parameters = contextual_command
                 parameters["fallback_method"] = "contextual_analysis"
-                self.logger.debug(f"🎯 Analyse contextuelle: {command_type.value}")
+                self.logger.debug("🎯 Analyse contextuelle: %s", command_type.value)
                 return command_type, parameters
         
         # PRIORITÉ 6: Analyse par mots-clés sémantiques (fallback)
@@ -623,11 +836,11 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
         if semantic_command:
             command_type, parameters = semantic_command
             parameters["fallback_method"] = "semantic_keywords"
-            self.logger.debug(f"🔍 Analyse sémantique: {command_type.value}")
+            self.logger.debug("🔍 Analyse sémantique: %s", command_type.value)
             return command_type, parameters
         
         # PRIORITÉ 7: Transmission à l'agent IA central (commande par défaut)
-        self.logger.info(f"🤖 Transmission à l'agent IA central: '{normalized_input}'")
+        self.logger.info("🤖 Transmission à l'agent IA central: '%s'", normalized_input)
         return CommandType.PROMPT, {
             "args": normalized_input.split(), 
             "full_text": normalized_input, 
@@ -644,7 +857,7 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
         permettant aux méthodes fallback de prendre le relais.
         """
         try:
-            self.logger.debug(f"🧠 Analyse BERT de: '{normalized_input}'")
+            self.logger.debug("🧠 Analyse BERT de: '%s'", normalized_input)
             
             # Préparer le contexte enrichi pour BERT
             enriched_input = self._prepare_bert_context(normalized_input, context)
@@ -660,13 +873,13 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
             
             # Vérifier le seuil de confiance
             if confidence < self.bert_config["confidence_threshold"]:
-                self.logger.debug(f"🔽 Confiance BERT trop faible: {confidence:.2f} < {self.bert_config['confidence_threshold']}")
+                self.logger.debug("🔽 Confiance BERT trop faible: %.2f < %s", confidence, self.bert_config['confidence_threshold'])
                 return None
             
             # Mapper l'intention vers CommandType
             command_type = self.bert_config["intent_mapping"].get(intent)
             if not command_type:
-                self.logger.debug(f"❓ Intention BERT non mappée: {intent}")
+                self.logger.debug("❓ Intention BERT non mappée: %s", intent)
                 return None
             
             # Extraire les paramètres avec BERT
@@ -739,26 +952,22 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
             if input_embedding is None:
                 return None
             
-            # Comparer avec les patterns d'intention connus
-            best_intent = None
-            best_score = 0.0
-            
-            # Patterns d'intention basés sur des exemples d'entraînement
-            intention_patterns = self._get_intention_training_patterns()
+            # Comparer avec tous les patterns d'intention connus en un seul produit matriciel
+            intention_matrix = self._get_intention_matrix()
+            input_norm = np.linalg.norm(input_embedding)
+            if intention_matrix is None or input_norm == 0:
+                return None
             
-            for intent, patterns in intention_patterns.items():
-                for pattern in patterns:
-                    pattern_embedding = self._get_bert_embedding(pattern)
-                    if pattern_embedding is not None:
-                        # Calculer la similarité cosine
-                        similarity = self._cosine_similarity(input_embedding, pattern_embedding)
-                        if similarity > best_score:
-                            best_score = similarity
-                            best_intent = intent
+            # Matrice stockée en float16, produit accumulé en float32
+            similarities = np.matmul(
+                intention_matrix, (input_embedding / input_norm).astype(np.float32), dtype=np.float32
+            )
+            best = int(similarities.argmax())
+            best_score = float(similarities[best])
             
             # Retourner le meilleur match si la similarité est suffisante
             if best_score >= self.bert_config["semantic_similarity_threshold"]:
-                return best_intent, best_score
+                return self._intention_labels[best], best_score
             
             return None
             
@@ -766,148 +975,98 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
             self.logger.error(f"❌ Erreur lors de la classification BERT: {e}")
             return None
     
+    def _get_intention_matrix(self) -> Optional[np.ndarray]:
+        """
+        Retourne la matrice (float16, lignes de norme 1) des embeddings des patterns
+        d'entraînement, calculée au premier appel.
+        
+        _intention_labels donne l'intention de chaque ligne.
+        """
+        if self._intention_matrix is not None:
+            return self._intention_matrix
+        
+        # Tous les patterns encodés en un seul lot BERT, normalisés d'un coup
+        texts = []
+        labels = []
+        for intent, patterns in self._get_intention_training_patterns().items():
+            texts.extend(patterns)
+            labels.extend([intent] * len(patterns))
+        
+        embeddings = self._get_bert_embeddings(texts)
+        if not embeddings:
+            return None
+        
+        matrix = np.stack(embeddings).astype(np.float32)
+        norms = np.linalg.norm(matrix, axis=1)
+        keep = norms > 0
+        if not keep.any():
+            return None
+        
+        self._intention_matrix = np.ascontiguousarray(matrix[keep] / norms[keep, None], dtype=np.float16)
+        self._intention_labels = [label for label, kept in zip(labels, keep) if kept]
+        return self._intention_matrix
+    
     def _get_bert_embedding(self, text: str) -> Optional[np.ndarray]:
         """Obtient l'embedding BERT pour un texte."""
+        embeddings = self._get_bert_embeddings([text])
+        return embeddings[0] if embeddings else None
+    
+    def _get_bert_embeddings(self, texts: List[str]) -> Optional[List[np.ndarray]]:
+        """
+        Obtient les embeddings BERT de plusieurs textes.
+        
+        Les textes absents du cache passent ensemble dans une seule passe BERT ;
+        la moyenne est masquée pour que le remplissage du lot ne l'altère pas.
+        """
         try:
             # Vérifier le cache d'abord
-            if text in self.embedding_cache:
-                return self.embedding_cache[text]
-            
-            # Vérifier que le modèle est disponible
-            if not self.bert_model or not self.bert_tokenizer:
-                return None
-            
-            # Tokeniser et obtenir l'embedding
-            inputs = self.bert_tokenizer(
-                text, 
-                return_tensors="pt", 
-                padding=True, 
-                truncation=True, 
-                max_length=512
-            )
-            
-            with torch.no_grad():
-                outputs = self.bert_model(**inputs)
-                # Utiliser la moyenne des dernières couches cachées
-                if hasattr(outputs, 'last_hidden_state'):
-                    embedding = outputs.last_hidden_state.mean(dim=1).squeeze()
-                else:
-                    # Fallback pour d'autres types de sorties
-                    embedding = outputs[0].mean(dim=1).squeeze()
-                
-                # Convertir en numpy
-                if hasattr(embedding, 'numpy'):
-                    embedding_np = embedding.numpy()
+            results: List[Optional[np.ndarray]] = []
+            missing = []
+            for text in texts:
+                cached = self.embedding_cache.get(text)
+                if cached is not None:
+                    self.embedding_cache.move_to_end(text)
                 else:
-                    embedding_np = np.array(embedding)
+                    missing.append(text)
+                results.append(cached)
             
-            # Mettre en cache (limiter la taille du cache)
-            if len(self.embedding_cache) < 1000:
-                self.embedding_cache[text] = embedding_np
+            if missing:
+                # Vérifier que le modèle est disponible
+                if not self.bert_model or not self.bert_tokenizer:
+                    return None
+                
+                # Tokeniser et obtenir les embeddings
+                unique_missing = list(dict.fromkeys(missing))
+                inputs = self.bert_tokenizer(
+                    unique_missing, 
+                    return_tensors="pt", 
+                    padding=True, 
+                    truncation=True, 
+                    max_length=512
+                )
+                
+                import torch
+                with torch.inference_mode():
+                    outputs = self.bert_model(**inputs)
+                    # Utiliser la moyenne des dernières couches cachées, sur les seuls tokens réels
+                    hidden = outputs.last_hidden_state if hasattr(outputs, 'last_hidden_state') else outputs[0]
+                    mask = inputs["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+                    embeddings_np = ((hidden * mask).sum(dim=1) / mask.sum(dim=1)).numpy()
+                
+                # Mettre en cache (limiter la taille du cache)
+                computed = dict(zip(unique_missing, embeddings_np))
+                for text, embedding_np in computed.items():
+                    self.embedding_cache[text] = embedding_np
+                    if len(self.embedding_cache) > _EMBEDDING_CACHE_MAX_ENTRIES:
+                        self.embedding_cache.popitem(last=False)
+                results = [computed[text] if embedding is None else embedding
+                           for text, embedding in zip(texts, results)]
             
-            return embedding_np
+            return results
             
         except Exception as e:
             self.logger.error(f"❌ Erreur lors de la génération d'embedding BERT: {e}")
             return None
-            
-        except Exception as e:
-            self.logger.error(f"❌ Erreur lors de la génération d'embedding BERT: {e}")
-            return None
-    
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Calcule la similarité cosine entre deux vecteurs."""
-        try:
-            # Normaliser les vecteurs
-            vec1_norm = vec1 / np.linalg.norm(vec1)
-            vec2_norm = vec2 / np.linalg.norm(vec2)
-            
-            # Calculer le produit scalaire (similarité cosine)
-            similarity = np.dot(vec1_norm, vec2_norm)
-            return float(similarity)
-            
-        except Exception as e:
-            self.logger.error(f"❌ Erreur lors du calcul de similarité: {e}")
-            return 0.0
-    
-    def _get_intention_training_patterns(self) -> Dict[str, List[str]]:
-        """Retourne les patterns d'entraînement pour chaque intention."""
-        return {
-            "help_request": [
-                "aide-moi s'il te plaît",
-                "j'ai besoin d'aide",
-                "comment faire",
-                "peux-tu m'aider",
-                "je ne sais pas comment"
-            ],
-            "analysis_request": [
-                "analyse ce code",
-                "examine ce fichier",
-                "vérifie cette fonction",
-                "regarde ça",
-                "peux-tu analyser"
-            ],
-            "optimization_request": [
-                "optimise ce code",
-                "améliore la performance",
-                "rends ça plus efficace",
-                "comment optimiser",
-                "suggestions d'amélioration"
-            ],
-            "explanation_request": [
-                "explique-moi comment ça marche",
-                "que fait cette fonction",
-                "comment ça fonctionne",
-                "peux-tu expliquer",
-                "décris-moi"
-            ],
-            "status_check": [
-                "quel est le statut",
-                "comment ça va",
-                "état du système",
-                "tout va bien",
-                "vérification du statut"
-            ],
-            "termination_request": [
-                "merci pour ton aide tu peux t'arrêter",
-                "c'est bon merci",
-                "tu peux arrêter maintenant",
-                "merci beaucoup c'est parfait",
-                "arrête-toi maintenant"
-            ],
-            "time_inquiry": [
-                "quelle heure est-il",
-                "donne-moi l'heure",
-                "il est quelle heure",
-                "l'heure actuelle",
-                "temps maintenant"
-            ],
-            "general_query": [
-                "dis-moi quelque chose",
-                "raconte-moi",
-                "information sur",
-                "parle-moi de",
-                "qu'est-ce que tu penses"
-            ]
-        }
-    
-    def _cosine_similarity(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
-        """Calcule la similarité cosine entre deux embeddings."""
-        try:
-            # Normaliser les vecteurs
-            norm1 = np.linalg.norm(embedding1)
-            norm2 = np.linalg.norm(embedding2)
-            
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-            
-            # Calculer la similarité cosine
-            similarity = np.dot(embedding1, embedding2) / (norm1 * norm2)
-            return float(similarity)
-            
-        except Exception as e:
-            self.logger.error(f"❌ Erreur lors du calcul de similarité: {e}")
-            return 0.0
     
     def _get_intention_training_patterns(self) -> Dict[str, List[str]]:
         """Retourne les patterns d'entraînement pour chaque intention."""
@@ -1039,81 +1198,28 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
         if len(normalized_input.split()) > 3:
             return None  # Trop complexe, laisser à l'agent central
         
-        # Patterns ultra-simples uniquement (mots seuls ou très courts)
-        ultra_simple_patterns = {
-            CommandType.HELP: ["aide", "help"],
-            CommandType.STATUS: ["statut", "état", "status"],
-            CommandType.TIME: ["heure", "time"],
-        }
-        
         # Correspondance exacte pour des mots très simples uniquement
-        for command_type, patterns in ultra_simple_patterns.items():
-            for pattern in patterns:
-                if normalized_input.strip() == pattern:
-                    return command_type, {"intent": "ultra_simple_match", "full_text": normalized_input}
+        command_type = _ULTRA_SIMPLE_COMMANDS.get(normalized_input.strip())
+        if command_type is not None:
+            return command_type, {"intent": "ultra_simple_match", "full_text": normalized_input}
         
         # Tout le reste va à l'agent central
         return None
     
     def _detect_polite_quit_intent(self, normalized_input: str) -> bool:
         """Détecte les intentions d'arrêt polies avec logique très stricte pour éviter les faux positifs."""
-        import re
-        
-        # EXCLUSIONS STRICTES : Si ces patterns sont présents, ce n'est JAMAIS un quit
-        exclusion_patterns = [
-            # Demandes d'aide explicites
-            r"(?:aide|help|aidez?[-\s]moi|assiste[-\s]moi)",
-            r"(?:explique|expliquer|comment|pourquoi|que fait|comment faire)",
-            r"(?:analyse|analyser|examine|examiner|regarde|vérifie)",
-            r"(?:optimise|optimiser|améliore|améliorer|suggère|suggérer)",
-            r"(?:peux[-\s]tu|pourrais[-\s]tu|tu peux).+(?:aide|expliquer|analyser|optimiser|faire)",
-            r"(?:dis[-\s]moi|montre[-\s]moi|raconte[-\s]moi)",
-            # Actions spécifiques demandées
-            r"(?:code|fichier|fonction|classe|variable|méthode|projet)",
-            r"(?:débug|debug|erreur|problème|bug)",
-            r"(?:créer|créé|modifier|modifie|ajouter|ajoute)",
-            # Phrases mixtes avec remerciement + demande
-            r"merci.+(?:aide|analyse|explique|optimise|montre|dis|fait|peux)"
-        ]
-        
-        # Si n'importe quel pattern d'exclusion correspond, ce n'est PAS un quit
-        for pattern in exclusion_patterns:
-            if re.search(pattern, normalized_input, re.IGNORECASE):
-                return False
+        # EXCLUSIONS STRICTES : si un de ces patterns est présent, ce n'est JAMAIS un quit
+        if _QUIT_EXCLUSION_RE.search(normalized_input):
+            return False
         
         # PATTERNS D'ARRÊT TRÈS SPÉCIFIQUES - seulement si aucune exclusion
-        strict_quit_patterns = [
-            # Remerciements de fin SANS demande d'action
-            r"^merci\s+(?:beaucoup|bien|pour\s+tout|c'est\s+parfait|c'est\s+bon)$",
-            r"^(?:c'est\s+parfait|c'est\s+bon|parfait|excellent)\s*(?:merci)?$",
-            r"^merci\s+(?:tu\s+peux\s+t'arrêter|pour\s+ton\s+aide)$",
-            
-            # Formules d'au revoir claires
-            r"^(?:au\s+revoir|à\s+bientôt|bye|goodbye|bonne\s+journée|bonne\s+soirée)$",
-            
-            # Demandes d'arrêt explicites
-            r"^(?:arrête|stop|tu\s+peux\s+arrêter|arrête[-\s]toi)(?:\s+maintenant|\s+stp|\s+merci)?$",
-            r"^(?:ça\s+suffit|c'est\s+tout|j'ai\s+fini)(?:\s+merci)?$",
-            
-            # Combinaisons très spécifiques de politesse + arrêt
-            r"merci\s+(?:tu\s+peux\s+(?:partir|te\s+reposer|t'en\s+aller)|pour\s+tout\s+au\s+revoir)",
-            r"(?:très\s+bien|excellent)\s+merci\s+(?:arrête|tu\s+peux\s+arrêter)"
-        ]
-        
-        # Vérifier les patterns d'arrêt très stricts uniquement
-        for pattern in strict_quit_patterns:
-            if re.search(pattern, normalized_input, re.IGNORECASE):
-                return True
+        if _STRICT_QUIT_RE.search(normalized_input):
+            return True
         
         # Logique supplémentaire pour "merci" seul avec satisfaction finale
         if "merci" in normalized_input:
-            # Mots qui indiquent une satisfaction/fin
-            satisfaction_words = ["exactement", "ce qu'il me fallait", "c'est tout", "pour tout", "beaucoup"]
-            # Mots qui indiquent clairement une demande continue
-            continuation_words = ["pour", "de", "explique", "analyse", "optimise", "comment", "peux-tu", "aide"]
-            
-            has_satisfaction = any(word in normalized_input for word in satisfaction_words)
-            has_continuation = any(word in normalized_input for word in continuation_words)
+            has_satisfaction = any(word in normalized_input for word in _SATISFACTION_WORDS)
+            has_continuation = any(word in normalized_input for word in _CONTINUATION_WORDS)
             
             # Si "merci" + satisfaction ET PAS de continuation, c'est probablement un quit
             if has_satisfaction and not has_continuation:
@@ -1138,23 +1244,8 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
     
     def _basic_speech_adaptation(self, message: str) -> str:
         """Adaptations de base pour la synthèse vocale."""
-        adaptations = {
-            "Peer": "Pire",
-            "CLI": "C L I",
-            "TUI": "T U I", 
-            "SUI": "S U I",
-            "API": "A P I",
-            "0.2.0": "version zéro point deux point zéro",
-            "ERROR": "Erreur",
-            "WARNING": "Attention",
-            "INFO": "Information",
-            "SUCCESS": "Succès",
-            "OK": "D'accord",
-            "NOK": "Pas bon"
-        }
-        
         adapted_message = message
-        for original, replacement in adaptations.items():
+        for original, replacement in _SPEECH_ADAPTATIONS:
             adapted_message = adapted_message.replace(original, replacement)
         
         return adapted_message
@@ -1171,14 +1262,12 @@ class IntelligentSUISpeechAdapter(InterfaceAdapter):
     def _make_detailed(self, message: str) -> str:
         """Enrichit le message avec plus de détails."""
         # Ajouter des informations contextuelles
-        detailed_message = message
-        
-        if "succès" in message.lower() or "success" in message.lower():
-            detailed_message += " Tout fonctionne parfaitement."
-        elif "erreur" in message.lower() or "error" in message.lower():
-            detailed_message += " Je peux vous aider à résoudre ce problème si vous le souhaitez."
-        
-        return detailed_message
+        lowered = message.lower()
+        if "succès" in lowered or "success" in lowered:
+            return message + _DETAILED_SUCCESS_SUFFIX
+        if "erreur" in lowered or "error" in lowered:
+            return message + _DETAILED_ERROR_SUFFIX
+        return message
     
     def _generate_proactive_suggestions(self, core_response: CoreResponse) -> List[str]:
         """Génère des suggestions proactives basées sur la réponse."""
@@ -1280,29 +1369,50 @@ class OmniscientSUI:
     """
     def __init__(self, daemon: Optional[PeerDaemon] = None):
         """Initialise l'interface vocale omnisciente."""
+        _enable_file_logging()
         self.logger = logging.getLogger("OmniscientSUI")
         self.logger.info("🚀 Initialisation de l'interface vocale omnisciente...")
         
-        # Initialisation du daemon et adaptateur
-        self.daemon = daemon or PeerDaemon()
-        self.adapter = IntelligentSUISpeechAdapter()
+        # Chargement en parallèle des sous-systèmes lourds, indépendants entre eux :
+        # daemon, adaptateur (moteur NLP / BERT), TTS et modèle Whisper. Les
+        # chargements de modèles se font surtout dans du code natif qui libère le GIL.
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="SUIInit") as pool:
+            daemon_future = pool.submit(PeerDaemon) if daemon is None else None
+            adapter_future = pool.submit(IntelligentSUISpeechAdapter)
+            tts_future = pool.submit(SimpleTTSAdapter)
+            speech_future = pool.submit(self._init_advanced_speech_recognition)
+            
+            # Initialisation du daemon et adaptateur
+            self.daemon = daemon or daemon_future.result()
+            self.adapter = adapter_future.result()
+            self.tts_adapter = tts_future.result()
+            speech_future.result()
         
         # Session et TTS
         self.session_id = self.daemon.create_session(InterfaceType.SUI)
-        self.tts_adapter = SimpleTTSAdapter()
         self.tts_lock = threading.Lock()
+        # Réponses à vocaliser par le thread dédié (voir _vocalize_async), bornée
+        # pour ne jamais accumuler de retard sur la conversation
+        self._vocalize_queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=4)
+        self._vocalize_lock = threading.Lock()
         
         # Variables d'état principal
         self.running = False
+        self._stop_event = threading.Event()  # Levé par stop() : réveille les boucles en attente
         self.listening = False
-        self.speaking = False
+        self._speech_idle = threading.Event()  # Levé quand l'assistant ne parle pas
+        self._speech_idle.set()
+        # Vocalisations en cours ou planifiées, protégé par _vocalize_lock : seule
+        # source de vérité de speaking, quel que soit le chemin de vocalisation
+        self._active_speech = 0
         self.paused = False
         
         # Variables audio avancées
         self.audio_stream = None
+        self._pyaudio = None  # Instance PortAudio partagée (voir _get_pyaudio)
         self.vad = None  # Voice Activity Detector
         self.vad_enabled = True
-        self.audio_buffer = deque(maxlen=32)  # Buffer circulaire pour l'audio
+        self._record_buffer: Optional[bytearray] = None  # Tampon d'enregistrement réutilisé (voir _record_single_speech_session)
         self.noise_threshold = 500  # Seuil de bruit adaptatif
         self.energy_threshold = 800  # Seuil d'énergie pour la détection vocale
         
@@ -1344,23 +1454,47 @@ class OmniscientSUI:
         self._await_confirmation = False
         self._confirmation_context = None
         
-        # Initialisation des composants
-        self._init_advanced_speech_recognition()
+        # Protections anti-récursion, initialisées ici pour être lues sans hasattr()
+        self._command_recursion_depth = 0
+        self._tts_recursion_depth = 0
+        self._processing_critical_command = False
+        
+        # Initialisation des composants (la reconnaissance vocale est déjà chargée)
         self._init_voice_activity_detection()
         self._init_audio_isolation()
         self._enable_advanced_features()
     
+    @property
+    def speaking(self) -> bool:
+        """Indique si l'assistant est en train de parler (ou a encore des réponses à lire)."""
+        return self._active_speech > 0
+    
+    def _begin_speech(self):
+        """Compte une vocalisation de plus : l'écoute s'interrompt aussitôt."""
+        with self._vocalize_lock:
+            self._active_speech += 1
+            self._speech_idle.clear()
+    
+    def _end_speech(self, count: int = 1):
+        """Décompte des vocalisations terminées ; l'écoute ne reprend qu'à la dernière."""
+        with self._vocalize_lock:
+            self._active_speech = max(0, self._active_speech - count)
+            if self._active_speech == 0:
+                # Réveille immédiatement les boucles d'écoute en attente de la fin de parole
+                self._speech_idle.set()
+    
     def _init_advanced_speech_recognition(self):
         """Initialise le moteur de reconnaissance vocale Whisper avec le meilleur modèle possible."""
         try:
             self.logger.info("🧠 Initialisation de Whisper avec modèle de qualité...")
+            import whisper
             
             # Utiliser le meilleur modèle Whisper possible pour la qualité
             available_memory = psutil.virtual_memory().available / (1024**3)  # GB
             
             # Cache pour les modèles déjà téléchargés
             cached_models = []
-            whisper_cache = os.path.expanduser("~/.cache/whisper")
+            whisper_cache = _WHISPER_CACHE_DIR
             if os.path.exists(whisper_cache):
                 cached_models = [d for d in os.listdir(whisper_cache) if os.path.isdir(os.path.join(whisper_cache, d))]
             
@@ -1384,7 +1518,7 @@ class OmniscientSUI:
                 model_size, 
                 device="cpu", 
                 in_memory=True,
-                download_root=os.path.expanduser("~/.cache/whisper")
+                download_root=_WHISPER_CACHE_DIR
             )
             self.speech_recognition_engine = "whisper"
             
@@ -1419,7 +1553,7 @@ class OmniscientSUI:
     def _init_audio_isolation(self):
         """Initialise l'isolation audio pour éviter l'auto-écoute."""
         try:
-            audio = pyaudio.PyAudio()
+            audio = self._get_pyaudio()
             
             # Lister les périphériques audio disponibles
             self._list_audio_devices(audio)
@@ -1427,13 +1561,33 @@ class OmniscientSUI:
             # Essayer de trouver des périphériques d'entrée et sortie différents
             self._setup_separate_audio_devices(audio)
             
-            audio.terminate()
             self.logger.info("🔇 Isolation audio configurée")
             
         except Exception as e:
             self.logger.warning(f"⚠️ Impossible de configurer l'isolation audio: {e}")
             self.audio_isolation_enabled = False
 
+    def _get_pyaudio(self):
+        """
+        Retourne l'instance PortAudio de l'interface, créée au premier appel.
+        
+        L'initialisation de PortAudio (énumération des périphériques) est coûteuse :
+        une seule instance sert à toute la session et n'est libérée qu'à l'arrêt.
+        """
+        if self._pyaudio is None:
+            self._pyaudio = pyaudio.PyAudio()
+        return self._pyaudio
+    
+    def _release_pyaudio(self):
+        """Libère l'instance PortAudio partagée."""
+        audio, self._pyaudio = self._pyaudio, None
+        if audio is not None:
+            try:
+                audio.terminate()
+                self.logger.debug("🔇 PyAudio terminé")
+            except Exception:
+                pass
+    
     def _list_audio_devices(self, audio):
         """Liste les périphériques audio disponibles."""
         self.logger.info("📱 Périphériques audio disponibles:")
@@ -1494,24 +1648,7 @@ class OmniscientSUI:
         text_lower = text.lower().strip()
         
         # Commandes directes
-        direct_commands = {
-            'aide': 'HELP',
-            'help': 'HELP', 
-            'version': 'VERSION',
-            'statut': 'STATUS',
-            'status': 'STATUS',
-            'temps': 'TIME',
-            'time': 'TIME',
-            'heure': 'TIME',
-            'date': 'DATE',
-            'arrêt': 'STOP',
-            'stop': 'STOP',
-            'pause': 'PAUSE',
-            'continuer': 'CONTINUE',
-            'continue': 'CONTINUE'
-        }
-        
-        for cmd_word, intent in direct_commands.items():
+        for cmd_word, intent in _DIRECT_COMMAND_INTENTS:
             if cmd_word in text_lower:
                 return intent
         
@@ -1571,7 +1708,7 @@ class OmniscientSUI:
                 except Exception as e:
                     self.logger.error(f"Erreur dans l'analyse contextuelle: {e}")
                 
-                time.sleep(5)  # Vérifier toutes les 5 secondes
+                self._stop_event.wait(5)  # Vérifier toutes les 5 secondes
         
         # self.last_context_analysis = time.time() # Déplacé vers __init__
         context_thread = threading.Thread(target=context_analysis_loop, daemon=True)
@@ -1628,21 +1765,12 @@ class OmniscientSUI:
         else:
             # Fallback si l'adaptateur n'a pas la méthode (ne devrait pas arriver)
             self.logger.warning("L'adaptateur n'a pas de méthode _load_user_preferences, utilisation des préférences par défaut")
-            return {
-                "response_style": "balanced",
-                "voice_speed": 1.0,
-                "voice_volume": 0.8,
-                "language_preference": "fr",
-                "proactive_assistance": True,
-                "context_awareness": True,
-                "learning_mode": True,
-                "notification_level": "normal"
-            }
+            return dict(_DEFAULT_PREFERENCES)
     
     def _save_user_preferences(self, preferences: Dict[str, Any]):
         """Sauvegarde les préférences utilisateur."""
         try:
-            preferences_path = Path.home() / '.peer' / 'sui_preferences.json'
+            preferences_path = _PREFERENCES_PATH
             preferences_path.parent.mkdir(exist_ok=True)
             with open(preferences_path, 'w', encoding='utf-8') as f:
                 json.dump(preferences, f, indent=2, ensure_ascii=False)
@@ -1668,7 +1796,7 @@ class OmniscientSUI:
         """Mesure le niveau de bruit ambiant pour ajuster les seuils."""
         try:
             # Enregistrer un échantillon court du bruit ambiant
-            audio = pyaudio.PyAudio()
+            audio = self._get_pyaudio()
             stream = audio.open(
                 format=self.audio_format,
                 channels=self.channels,
@@ -1686,7 +1814,6 @@ class OmniscientSUI:
                 time.sleep(0.1)
             
             stream.close()
-            audio.terminate()
             
             return np.mean(noise_samples)
             
@@ -1701,6 +1828,7 @@ class OmniscientSUI:
             return
         
         self.running = True
+        self._stop_event.clear()
         self.logger.info("🚀 Démarrage de l'interface vocale omnisciente avec mode talkie-walkie...")
         
         # Vérifier la disponibilité des moteurs
@@ -1711,19 +1839,24 @@ class OmniscientSUI:
         # Démarrer les threads principaux avec approche talkie-walkie
         self.listen_thread = threading.Thread(target=self._walkie_talkie_loop, daemon=True)
         self.command_thread = threading.Thread(target=self._intelligent_command_loop, daemon=True)
+        self.vocalize_thread = threading.Thread(target=self._vocalization_loop, daemon=True)
         
         self.listen_thread.start()
         self.command_thread.start()
+        self.vocalize_thread.start()
         
         # Message d'accueil personnalisé
         welcome_message = self._generate_personalized_greeting()
         self._safe_vocalize(welcome_message)
+        # Préchargement après l'accueil, qui ne doit pas attendre la synthèse des
+        # phrases récurrentes sur la file TTS (cache vide au premier lancement)
+        self.tts_adapter.preload(_COMMON_PHRASES)
         
         # Boucle principale avec surveillance
         try:
             while self.running:
                 self._monitor_system_health()
-                time.sleep(1.0)
+                self._stop_event.wait(1.0)
         except KeyboardInterrupt:
             self.logger.info("⌨️ Interruption clavier détectée")
             self.stop()
@@ -1735,6 +1868,7 @@ class OmniscientSUI:
         
         self.logger.info("🛑 Arrêt de l'interface vocale omnisciente...")
         self.running = False
+        self._stop_event.set()
         
         # Sauvegarder les préférences apprises
         if hasattr(self.adapter, 'user_preferences'):
@@ -1748,12 +1882,38 @@ class OmniscientSUI:
         if hasattr(self, 'session_id'):
             self.daemon.end_session(self.session_id)
         
+        # Abandonner les réponses encore en attente et arrêter le thread de vocalisation
+        self._discard_pending_vocalizations()
+        try:
+            self._vocalize_queue.put_nowait(None)
+        except queue.Full:
+            pass
+        
         # Message de fin personnalisé avec vocalisation sécurisée
         farewell_message = self._generate_personalized_farewell()
         self._safe_vocalize(farewell_message)
         
+        # Libérer le moteur de synthèse et PortAudio, gardés actifs pendant toute la session
+        self.tts_adapter.shutdown()
+        listen_thread = getattr(self, 'listen_thread', None)
+        if listen_thread is not None and listen_thread is not threading.current_thread():
+            listen_thread.join(timeout=2.0)
+        self._release_pyaudio()
+        
         self.logger.info("✅ Interface vocale arrêtée avec succès")
     
+    def wait_until_stopped(self, timeout: Optional[float] = None) -> bool:
+        """
+        Bloque jusqu'à l'arrêt de l'interface.
+        
+        Args:
+            timeout: Délai maximal d'attente en secondes (None pour attendre sans limite)
+            
+        Returns:
+            True si l'interface est arrêtée
+        """
+        return self._stop_event.wait(timeout)
+    
     def _walkie_talkie_loop(self):
         """Boucle talkie-walkie : écoute uniquement quand l'assistant ne parle pas."""
         self.logger.info("📻 Démarrage du mode talkie-walkie...")
@@ -1765,7 +1925,7 @@ class OmniscientSUI:
         
         try:
             # Configuration audio simplifiée (OMP_NUM_THREADS déjà défini au début du fichier)
-            audio = pyaudio.PyAudio()
+            audio = self._get_pyaudio()
             stream = audio.open(
                 format=self.audio_format,
                 channels=self.channels,
@@ -1780,15 +1940,20 @@ class OmniscientSUI:
             while self.running:
                 try:
                     # Mode talkie-walkie : N'écouter QUE si pas en train de parler
-                    if self.speaking or self.paused:
-                        time.sleep(0.1)
+                    if self.speaking:
+                        # Attente bloquante jusqu'à la fin de la vocalisation (pas de scrutation)
+                        self._speech_idle.wait(timeout=1.0)
+                        continue
+                    if self.paused:
+                        self._stop_event.wait(0.1)
                         continue
                     
                     # Respecter la période de silence après TTS pour éviter l'écho
                     if self.speech_end_time > 0:
                         time_since_speech = time.time() - self.speech_end_time
                         if time_since_speech < self.min_silence_after_speech:
-                            time.sleep(0.1)
+                            # Dormir exactement le temps restant plutôt que par tranches
+                            self._stop_event.wait(self.min_silence_after_speech - time_since_speech)
                             continue
                     
                     # Indiquer qu'on écoute
@@ -1803,17 +1968,17 @@ class OmniscientSUI:
                         self._process_speech_immediately(speech_audio)
                         
                         # Attendre que le traitement soit terminé avant de reprendre l'écoute
-                        time.sleep(0.5)
+                        self._stop_event.wait(0.5)
                     else:
                         # Courte pause si aucune parole détectée
-                        time.sleep(0.2)
+                        self._stop_event.wait(0.2)
                         
                 except KeyboardInterrupt:
                     self.logger.info("⌨️ Interruption clavier dans la boucle talkie-walkie")
                     break
                 except Exception as e:
                     self.logger.error(f"❌ Erreur dans la boucle talkie-walkie: {e}")
-                    time.sleep(1.0)  # Pause en cas d'erreur pour éviter la surcharge
+                    self._stop_event.wait(1.0)  # Pause en cas d'erreur pour éviter la surcharge
             
         except Exception as e:
             self.logger.error(f"❌ Erreur fatale dans la boucle d'écoute: {e}")
@@ -1826,12 +1991,6 @@ class OmniscientSUI:
                     self.logger.debug("🔇 Stream audio fermé")
                 except:
                     pass
-            if audio:
-                try:
-                    audio.terminate()
-                    self.logger.debug("🔇 PyAudio terminé")
-                except:
-                    pass
             self.listening = False
             self._update_visual_status("🔇 Écoute arrêtée")
             self.logger.info("👂 Boucle talkie-walkie terminée")
@@ -1849,7 +2008,7 @@ class OmniscientSUI:
             return True
         
         # Période de grâce après récursion TTS
-        if hasattr(self, '_tts_recursion_depth') and self._tts_recursion_depth > 0:
+        if self._tts_recursion_depth > 0:
             return True
         
         return False
@@ -1872,7 +2031,7 @@ class OmniscientSUI:
                 if time_since_speech < 1.0:  # 1 seconde de sécurité
                     vad_result.speech_detected = False
                     vad_result.speech_probability *= 0.2
-                    self.logger.debug(f"🛡️ Audio ignoré - trop proche de la fin TTS ({time_since_speech:.2f}s)")
+                    self.logger.debug("🛡️ Audio ignoré - trop proche de la fin TTS (%.2fs)", time_since_speech)
         
         return vad_result
     
@@ -2000,7 +2159,7 @@ class OmniscientSUI:
                 
                 # Alerter si la confiance est faible
                 if confidence < 0.4:
-                    self.logger.debug(f"⚠️ Confiance de reconnaissance faible: {confidence:.2f}")
+                    self.logger.debug("⚠️ Confiance de reconnaissance faible: %.2f", confidence)
                 
             # Mettre à jour d'autres métriques système
             self.performance_metrics["cpu_usage"] = psutil.cpu_percent(interval=0.1)
@@ -2013,11 +2172,11 @@ class OmniscientSUI:
                 if audio_quality < 0.5:
                     # Si la qualité audio est faible, ajuster les seuils
                     self.energy_threshold = min(1200, self.energy_threshold * 1.05)
-                    self.logger.debug(f"🔊 Augmentation du seuil d'énergie à {self.energy_threshold:.0f} (qualité audio faible)")
+                    self.logger.debug("🔊 Augmentation du seuil d'énergie à %.0f (qualité audio faible)", self.energy_threshold)
                 elif audio_quality > 0.8 and self.energy_threshold > 600:
                     # Si la qualité audio est bonne, réduire le seuil pour mieux capter les paroles douces
                     self.energy_threshold = max(500, self.energy_threshold * 0.95)
-                    self.logger.debug(f"🔉 Réduction du seuil d'énergie à {self.energy_threshold:.0f} (qualité audio bonne)")
+                    self.logger.debug("🔉 Réduction du seuil d'énergie à %.0f (qualité audio bonne)", self.energy_threshold)
         
         except Exception as e:
             self.logger.warning(f"⚠️ Erreur lors de la mise à jour des métriques: {e}")
@@ -2048,6 +2207,7 @@ class OmniscientSUI:
                             gc.collect()
                             
                             # Charger un modèle plus léger
+                            import whisper
                             new_model = "small" if current_model == "medium" else "base"
                             self.logger.info(f"⏳ Chargement du modèle Whisper {new_model}...")
                             self.whisper_model = whisper.load_model(new_model, device="cpu", in_memory=True)
@@ -2082,7 +2242,7 @@ class OmniscientSUI:
                 complete_audio = complete_audio[:960000]
             
             # Reconnaissance vocale avec protection contre les timeouts
-            self.logger.info(f"🎤 Traitement audio de {len(complete_audio)/16000:.1f}s...")
+            self.logger.info("🎤 Traitement audio de %.1fs...", len(complete_audio)/16000)
             start_time = time.time()
             
             # Utiliser un thread séparé avec timeout pour éviter les blocages
@@ -2114,7 +2274,7 @@ class OmniscientSUI:
                     if self.show_visual_indicators:
                         self._update_visual_status(f"💬 ({processing_time:.1f}s) [{recognition_result.text}]")
                     
-                    self.logger.info(f"🗣️ Parole reconnue ({processing_time:.2f}s): {recognition_result.text}")
+                    self.logger.info("🗣️ Parole reconnue (%.2fs): %s", processing_time, recognition_result.text)
                     
                     # Détecter si c'est une commande reconnue et afficher l'indicateur approprié
                     detected_command = self._detect_command_intent(recognition_result.text)
@@ -2196,11 +2356,9 @@ class OmniscientSUI:
                 self.logger.info(f"🛑 Interruption détectée: {text}")
                 self.interruption_count += 1
                 
-                # Arrêter immédiatement la synthèse vocale
-                if hasattr(self.tts_adapter, 'stop_speaking'):
-                    self.tts_adapter.stop_speaking()
-                
-                self.speaking = False
+                # Couper immédiatement la lecture en cours et abandonner les réponses en file
+                self.tts_adapter.stop_playback()
+                self._discard_pending_vocalizations()
                 
                 # Répondre à l'interruption
                 if "moins fort" in text or "baisse" in text or "doucement" in text:
@@ -2276,7 +2434,7 @@ class OmniscientSUI:
                 confidence = self._estimate_confidence(audio_np, text)
                 audio_quality = self._assess_audio_quality(audio_np)
                 
-                self.logger.debug(f"🔍 Reconnaissance en {processing_time:.2f}s (confiance: {confidence:.2f}, qualité: {audio_quality:.2f})")
+                self.logger.debug("🔍 Reconnaissance en %.2fs (confiance: %.2f, qualité: %.2f)", processing_time, confidence, audio_quality)
                 
                 return SpeechRecognitionResult(
                     text=text,
@@ -2329,7 +2487,7 @@ class OmniscientSUI:
             return min(1.0, max(0.2, confidence))
             
         except Exception as e:
-            self.logger.debug(f"Erreur estimation confiance: {e}")
+            self.logger.debug("Erreur estimation confiance: %s", e)
             return 0.7  # Confiance par défaut
     
     def _assess_audio_quality(self, audio_np: np.ndarray) -> float:
@@ -2371,7 +2529,7 @@ class OmniscientSUI:
             return min(1.0, max(0.2, quality))
             
         except Exception as e:
-            self.logger.debug(f"Erreur évaluation audio: {e}")
+            self.logger.debug("Erreur évaluation audio: %s", e)
             return 0.7  # Qualité par défaut
     
     def _intelligent_command_loop(self):
@@ -2392,18 +2550,15 @@ class OmniscientSUI:
 
     def _process_speech_command(self, speech_text: str):
         """Traite une commande vocale reconnue et transmet au daemon IA avec protection anti-récursion."""
-        self.logger.info(f"Traitement de la commande vocale: {speech_text}")
+        self.logger.info("Traitement de la commande vocale: %s", speech_text)
         start_time = time.time()
         
         # Protection anti-récursion au niveau des commandes
-        if hasattr(self, '_command_recursion_depth'):
-            self._command_recursion_depth += 1
-            if self._command_recursion_depth > 3:
-                self.logger.warning("🚫 Prévention de récursion de commande - abandon du traitement")
-                self._command_recursion_depth -= 1
-                return
-        else:
-            self._command_recursion_depth = 1
+        self._command_recursion_depth += 1
+        if self._command_recursion_depth > 3:
+            self.logger.warning("🚫 Prévention de récursion de commande - abandon du traitement")
+            self._command_recursion_depth -= 1
+            return
         
         try:
             # Vérifier les commandes de contrôle de l'interface d'abord
@@ -2427,12 +2582,12 @@ class OmniscientSUI:
                 return
 
             # Gestion spéciale des confirmations en attente
-            if hasattr(self, '_await_confirmation') and self._await_confirmation:
+            if self._await_confirmation:
                 self._process_confirmation_response(speech_text)
                 return
             
             # Vérifier si on n'est pas déjà en train de traiter une commande critique
-            if hasattr(self, '_processing_critical_command') and self._processing_critical_command:
+            if self._processing_critical_command:
                 self.logger.debug("🔄 Commande critique en cours, nouvelle commande mise en attente")
                 # Mettre la commande dans une queue de priorité basse
                 threading.Timer(2.0, lambda: self.command_queue.put(speech_text)).start()
@@ -2453,6 +2608,8 @@ class OmniscientSUI:
 
             # Gestion des actions d'interface (QUIT, CONFIRMATION, etc.)
             if adapted_response.get("interface_action") == "QUIT":
+                # Laisser finir les réponses en cours de lecture avant l'au revoir
+                self._wait_pending_vocalizations()
                 self._safe_vocalize(adapted_response.get("vocal_message", "Au revoir !"))
                 self.stop()
                 return
@@ -2465,16 +2622,17 @@ class OmniscientSUI:
                 self._handle_command_sequence(adapted_response)
                 return
 
-            # Vocaliser la réponse avec protection anti-récursion
+            # Vocaliser la réponse en arrière-plan : la commande suivante peut
+            # être traitée pendant la lecture
             if adapted_response.get("should_vocalize", True):
                 vocal_message = adapted_response.get("vocal_message", "Commande exécutée.")
-                self._safe_vocalize(vocal_message)
+                self._vocalize_async(vocal_message)
 
             # Suggestions proactives avec limitation
             suggestions = adapted_response.get("proactive_suggestions", [])
             if suggestions and len(suggestions) <= 2:  # Limiter le nombre de suggestions
                 for suggestion in suggestions:
-                    self._safe_vocalize(suggestion)
+                    self._vocalize_async(suggestion)
 
             # Mise à jour des métriques
             elapsed = time.time() - start_time
@@ -2488,10 +2646,8 @@ class OmniscientSUI:
             
         finally:
             # Nettoyer les flags de protection
-            if hasattr(self, '_processing_critical_command'):
-                self._processing_critical_command = False
-            if hasattr(self, '_command_recursion_depth'):
-                self._command_recursion_depth -= 1
+            self._processing_critical_command = False
+            self._command_recursion_depth -= 1
 
     def vocalize(self, text: str):
         """Synthétise et joue un texte avec gestion intelligente des interruptions et prévention des boucles."""
@@ -2499,18 +2655,15 @@ class OmniscientSUI:
             return
         
         # Vérifier si on n'est pas déjà dans une boucle TTS récursive
-        if hasattr(self, '_tts_recursion_depth'):
-            self._tts_recursion_depth += 1
-            if self._tts_recursion_depth > 2:
-                self.logger.warning("🚫 Prévention de récursion TTS - abandon de la vocalisation")
-                self._tts_recursion_depth -= 1
-                return
-        else:
-            self._tts_recursion_depth = 1
+        self._tts_recursion_depth += 1
+        if self._tts_recursion_depth > 2:
+            self.logger.warning("🚫 Prévention de récursion TTS - abandon de la vocalisation")
+            self._tts_recursion_depth -= 1
+            return
         
         with self.tts_lock:
             # Marquer le début de la vocalisation AVANT d'émettre le son
-            self.speaking = True
+            self._begin_speech()
             start_time = time.time()
             
             # Isolation préventive : bloquer l'écoute immédiatement
@@ -2521,7 +2674,7 @@ class OmniscientSUI:
                 if self.show_visual_indicators:
                     self._update_visual_status(f"🔊 {text[:50]}{'...' if len(text) > 50 else ''}")
                 
-                self.logger.info(f"Vocalisation: {text}")
+                self.logger.info("Vocalisation: %s", text)
                 
                 # Vocaliser avec timeout pour éviter les blocages
                 self._safe_tts_speak(text)
@@ -2536,14 +2689,13 @@ class OmniscientSUI:
                     
             finally:
                 # Marquer la fin de vocalisation avec délai de sécurité étendu
-                self.speaking = False
+                self._end_speech()
                 self.speech_end_time = time.time() + 0.5  # Buffer de 500ms supplémentaire
                 duration = self.speech_end_time - start_time
-                self.logger.debug(f"🔇 Fin de vocalisation marquée à {self.speech_end_time} (durée: {duration:.2f}s)")
+                self.logger.debug("🔇 Fin de vocalisation marquée à %s (durée: %.2fs)", self.speech_end_time, duration)
                 
                 # Réduire la profondeur de récursion
-                if hasattr(self, '_tts_recursion_depth'):
-                    self._tts_recursion_depth -= 1
+                self._tts_recursion_depth -= 1
                 
                 # Indicateur visuel de retour à l'écoute avec délai
                 if self.show_visual_indicators and not self.paused:
@@ -2560,37 +2712,14 @@ class OmniscientSUI:
         
         # Marquer le temps de fin estimé avec buffer
         self.speech_end_time = start_time + estimated_duration + safety_buffer
-        self.logger.debug(f"🛡️ Période de blocage TTS: {estimated_duration + safety_buffer:.2f}s")
+        self.logger.debug("🛡️ Période de blocage TTS: %.2fs", estimated_duration + safety_buffer)
     
     def _safe_tts_speak(self, text: str):
         """Vocalisation sécurisée avec timeout et gestion d'erreurs robuste."""
-        import threading
-        import time
-        
-        tts_completed = threading.Event()
-        tts_error = [None]  # Liste pour permettre la modification dans le thread
-        
-        def tts_thread():
-            try:
-                self.tts_adapter.speak(text)
-                tts_completed.set()
-            except Exception as e:
-                tts_error[0] = e
-                tts_completed.set()
-        
-        # Lancer la vocalisation dans un thread séparé avec timeout généreux
-        thread = threading.Thread(target=tts_thread, daemon=True)
-        thread.start()
-        
-        # Attendre avec timeout étendu de 120 secondes pour permettre de longs messages
-        # Le système central peut générer des messages de toute longueur
-        if not tts_completed.wait(timeout=120.0):
-            self.logger.error("⏰ Timeout TTS étendu - vocalisation abandonnée après 2 minutes")
-            return
-        
-        # Vérifier s'il y a eu une erreur
-        if tts_error[0]:
-            raise tts_error[0]
+        # L'adaptateur vocalise déjà dans son propre thread : on attend simplement
+        # la fin, avec un timeout étendu de 120 secondes pour permettre de longs
+        # messages (le système central peut générer des messages de toute longueur)
+        self.tts_adapter.speak(text, wait=True, timeout=120.0)
 
     def _safe_vocalize(self, text: str):
         """Vocalisation sécurisée avec protection anti-récursion améliorée."""
@@ -2598,14 +2727,13 @@ class OmniscientSUI:
             return
             
         # Protection stricte contre la récursion TTS
-        if hasattr(self, '_tts_recursion_depth'):
-            if self._tts_recursion_depth > 1:
-                self.logger.warning(f"🚫 Récursion TTS détectée (niveau {self._tts_recursion_depth}) - message ignoré: {text[:50]}...")
-                return
+        if self._tts_recursion_depth > 1:
+            self.logger.warning("🚫 Récursion TTS détectée (niveau %d) - message ignoré: %s...", self._tts_recursion_depth, text[:50])
+            return
         
+        # Marquer qu'on va parler AVANT de commencer
+        self._begin_speech()
         try:
-            # Marquer qu'on va parler AVANT de commencer
-            self.speaking = True
             start_time = time.time()
             
             # Vocaliser directement avec la méthode sécurisée pour éviter la récursion
@@ -2617,8 +2745,73 @@ class OmniscientSUI:
             if self.show_visual_indicators:
                 self._update_visual_status(f"❌ [Erreur TTS silencieuse] {text[:30]}...")
         finally:
-            # S'assurer que speaking est remis à False
-            self.speaking = False
+            # Ne décompte que cette vocalisation : celles du thread dédié continuent
+            # de bloquer l'écoute jusqu'à leur propre fin
+            self._end_speech()
+
+    def _vocalize_async(self, text: str):
+        """Planifie la vocalisation d'un texte sur le thread dédié sans bloquer l'appelant."""
+        if not text or not text.strip():
+            return
+        
+        # Marquer la parole dès la mise en file : l'écoute s'interrompt aussitôt
+        with self._vocalize_lock:
+            try:
+                self._vocalize_queue.put_nowait(text)
+            except queue.Full:
+                self.logger.warning("🚫 File de vocalisation pleine - message ignoré: %s...", text[:50])
+                return
+            self._active_speech += 1
+            self._speech_idle.clear()
+
+    def _vocalization_loop(self):
+        """Vocalise dans l'ordre les textes planifiés par _vocalize_async."""
+        while True:
+            text = self._vocalize_queue.get()
+            try:
+                if text is None:
+                    return
+                self._safe_tts_speak(text)
+            except Exception as e:
+                self.logger.error("❌ Erreur lors de la vocalisation en arrière-plan: %s", e)
+                if self.show_visual_indicators:
+                    self._update_visual_status(f"❌ [Erreur TTS silencieuse] {text[:30]}...")
+            finally:
+                if text is not None:
+                    self._end_speech()
+                self._vocalize_queue.task_done()
+
+    def _discard_pending_vocalizations(self):
+        """Vide la file des textes planifiés et pas encore vocalisés."""
+        discarded = 0
+        while True:
+            try:
+                text = self._vocalize_queue.get_nowait()
+            except queue.Empty:
+                break
+            if text is not None:
+                discarded += 1
+            self._vocalize_queue.task_done()
+        if discarded:
+            self._end_speech(discarded)
+
+    def _wait_pending_vocalizations(self, timeout: float = _VOCALIZE_DRAIN_TIMEOUT) -> bool:
+        """
+        Attend la fin des vocalisations en cours, sans jamais bloquer au-delà de timeout.
+        
+        Returns:
+            True si tout a été lu, False si le thread de vocalisation est arrêté ou trop lent
+        """
+        vocalize_thread = getattr(self, 'vocalize_thread', None)
+        if vocalize_thread is None or not vocalize_thread.is_alive():
+            # Plus personne ne lira ces textes : les abandonner plutôt que d'attendre
+            self._discard_pending_vocalizations()
+            return not self.speaking
+        if self._speech_idle.wait(timeout):
+            return True
+        self.logger.warning("⏱️ Vocalisations toujours en cours après %.0fs - abandon des réponses en attente", timeout)
+        self._discard_pending_vocalizations()
+        return False
 
     def _handle_command_error(self, error: Exception):
         """Gère les erreurs de commande sans risque de récursion TTS."""
@@ -2657,23 +2850,16 @@ class OmniscientSUI:
         self.logger.debug("Attente de confirmation utilisateur...")
         
         # Configurer une écoute spéciale pour la confirmation
-        if hasattr(self, '_await_confirmation'):
-            self._await_confirmation = True
-            self._confirmation_context = {
-                "original_text": original_text,
-                "quit_type": quit_type,
-                "detected_commands": detected_commands,
-                "confirmation_type": confirmation_type,
-                "reason": reason,
-                "phrase_part_questioned": phrase_part_questioned,
-                "timeout": time.time() + 30  # 30 secondes de timeout
-            }
-        else:
-            # Fallback: traiter comme une commande normale avec contexte
-            self.logger.warning("Système de confirmation non disponible - traitement direct")
-            if quit_type == "DIRECT_QUIT":
-                self._safe_vocalize("Au revoir !")
-                self.stop()
+        self._await_confirmation = True
+        self._confirmation_context = {
+            "original_text": original_text,
+            "quit_type": quit_type,
+            "detected_commands": detected_commands,
+            "confirmation_type": confirmation_type,
+            "reason": reason,
+            "phrase_part_questioned": phrase_part_questioned,
+            "timeout": time.time() + 30  # 30 secondes de timeout
+        }
 
     def _handle_command_sequence(self, adapted_response: dict):
         """Gère l'exécution de séquences de commandes détectées."""
@@ -2685,53 +2871,55 @@ class OmniscientSUI:
         # Vocaliser le message d'introduction de la séquence
         self._safe_vocalize(sequence_message)
         
+        # Invariants de la boucle : un seul contexte, réutilisé et mis à jour
+        # en place pour chaque commande (le démon ne le conserve pas)
+        total = len(commands)
+        interface_type = InterfaceType.SUI
+        create_request = CoreProtocol.create_request
+        sequence_context = {"source": "sequence", "sequence_position": 0, "sequence_total": total, "confidence": 0.0}
+        
         # Exécuter chaque commande de la séquence
-        for i, command_info in enumerate(commands):
+        for i, command_info in enumerate(commands, 1):
             try:
                 command_type = command_info.get("command")
                 command_text = command_info.get("text", "")
                 command_confidence = command_info.get("confidence", 0.0)
                 
-                self.logger.debug(f"Exécution commande {i+1}/{len(commands)}: {command_type} (confiance: {command_confidence:.2f})")
-                
-                # Créer une requête pour cette commande spécifique
-                from peer.core.api import CoreRequest, CommandType
+                self.logger.debug("Exécution commande %d/%d: %s (confiance: %.2f)", i, total, command_type, command_confidence)
                 
                 # Mapper le type de commande
-                core_command_type = getattr(CommandType, command_type.upper(), CommandType.PROMPT)
+                core_command_type = getattr(CommandType, str(command_type).upper(), CommandType.PROMPT)
                 
-                request = CoreRequest(
+                sequence_context["sequence_position"] = i
+                sequence_context["confidence"] = command_confidence
+                request = create_request(
                     command=core_command_type,
-                    text=command_text,
+                    parameters={"text": command_text},
+                    context=sequence_context,
                     session_id=self.session_id,
-                    metadata={
-                        "source": "sequence",
-                        "sequence_position": i + 1,
-                        "sequence_total": len(commands),
-                        "confidence": command_confidence
-                    }
+                    interface_type=interface_type
                 )
                 
                 # Exécuter la commande via le daemon
                 response = self.daemon.execute_command(request)
                 
                 # Traiter la réponse
-                if response and response.text:
+                if response and response.message:
                     # Vocaliser la réponse si approprié
                     if core_command_type != CommandType.QUIT:  # Éviter la vocalisation pour les quits
-                        self._safe_vocalize(response.text)
+                        self._safe_vocalize(response.message)
                 
                 # Pause courte entre les commandes
-                if i < len(commands) - 1:  # Pas de pause après la dernière commande
+                if i < total:  # Pas de pause après la dernière commande
                     time.sleep(0.5)
                     
             except Exception as e:
-                self.logger.error(f"Erreur lors de l'exécution de la commande {i+1}: {e}")
-                self._safe_vocalize(f"Erreur lors de l'exécution de la commande {i+1}")
+                self.logger.error("Erreur lors de l'exécution de la commande %d: %s", i, e)
+                self._safe_vocalize(f"Erreur lors de l'exécution de la commande {i}")
 
     def _process_confirmation_response(self, response_text: str):
         """Traite la réponse de l'utilisateur à une demande de confirmation."""
-        if not hasattr(self, '_confirmation_context'):
+        if self._confirmation_context is None:
             self.logger.warning("Réponse de confirmation reçue mais pas de contexte disponible")
             self._await_confirmation = False
             return
@@ -2744,7 +2932,7 @@ class OmniscientSUI:
             self.logger.info("Timeout de confirmation - annulation")
             self._safe_vocalize("Timeout de confirmation. Action annulée.")
             self._await_confirmation = False
-            delattr(self, '_confirmation_context')
+            self._confirmation_context = None
             return
         
         # Analyser la réponse de confirmation
@@ -2799,8 +2987,7 @@ class OmniscientSUI:
         
         # Nettoyer le contexte de confirmation
         self._await_confirmation = False
-        if hasattr(self, '_confirmation_context'):
-            delattr(self, '_confirmation_context')
+        self._confirmation_context = None
 
     def _record_single_speech_session(self, stream) -> Optional[bytes]:
         """Enregistre une session de parole unique jusqu'à détection complète."""
@@ -2808,9 +2995,17 @@ class OmniscientSUI:
             return None
             
         try:
-            audio_data = b''
             frames_recorded = 0
             max_frames = int(self.sample_rate * 10 / self.chunk_size)  # Max 10 secondes
+            
+            # Tampon contigu préalloué pour la durée maximale, réutilisé d'une session
+            # à l'autre : chaque chunk y est copié une seule fois, au lieu de recopier
+            # tout l'enregistrement à chaque concaténation de bytes
+            capacity = max_frames * self.chunk_size * self.channels * 2  # Échantillons 16 bits
+            if self._record_buffer is None or len(self._record_buffer) < capacity:
+                self._record_buffer = bytearray(capacity)
+            buffer = memoryview(self._record_buffer)
+            recorded_bytes = 0
             speech_detected = False
             silence_frames = 0
             max_silence_frames = int(self.sample_rate * 2 / self.chunk_size)  # 2 secondes de silence
@@ -2829,7 +3024,11 @@ class OmniscientSUI:
                     if not chunk:
                         break
                         
-                    audio_data += chunk
+                    chunk_end = recorded_bytes + len(chunk)
+                    if chunk_end > capacity:
+                        break
+                    buffer[recorded_bytes:chunk_end] = chunk
+                    recorded_bytes = chunk_end
                     frames_recorded += 1
                     
                     # Analyser le chunk pour détecter la parole
@@ -2861,9 +3060,9 @@ class OmniscientSUI:
                     break
             
             # Retourner les données audio si on a détecté de la parole
-            if speech_detected and len(audio_data) > 0:
-                self.logger.debug(f"✅ Session d'écoute terminée - {len(audio_data)} bytes enregistrés")
-                return audio_data
+            if speech_detected and recorded_bytes > 0:
+                self.logger.debug("✅ Session d'écoute terminée - %s bytes enregistrés", recorded_bytes)
+                return bytes(buffer[:recorded_bytes])
             else:
                 return None
                 
@@ -2888,7 +3087,7 @@ class OmniscientSUI:
                 speech_text = recognition_result.text.strip()
                 
                 if speech_text:
-                    self.logger.info(f"🎯 Parole reconnue: '{speech_text}'")
+                    self.logger.info("🎯 Parole reconnue: '%s'", speech_text)
                     
                     # Mettre en queue pour traitement
                     self.command_queue.put(speech_text)
@@ -2904,61 +3103,24 @@ class OmniscientSUI:
             self.logger.error(f"❌ Erreur lors du traitement immédiat: {e}")
     
     def _generate_personalized_greeting(self) -> str:
-        """Génère un message d'accueil personnalisé complet basé sur l'heure et l'historique."""
-        import datetime
-        
-        current_hour = datetime.datetime.now().hour
-        
-        # Message d'accueil personnalisé
-        if current_hour < 12:
-            time_greeting = "Bonjour"
-        elif current_hour < 18:
-            time_greeting = "Bon après-midi"
-        else:
-            time_greeting = "Bonsoir"
-        
-        # Message complet et informatif - le système central génère des messages de toute longueur
-        greeting_parts = [
-            f"{time_greeting} ! Peer activée et prête.",
-            "Je suis à votre service pour toute tâche ou question."
-        ]
-        
-        return " ".join(greeting_parts)
+        """Génère un message d'accueil personnalisé complet basé sur l'heure."""
+        return _GREETING_BY_HOUR[datetime.datetime.now().hour]
     
     def _generate_personalized_farewell(self) -> str:
         """Génère un message d'adieu personnalisé complet."""
-        import datetime
-        
-        current_hour = datetime.datetime.now().hour
+        farewell = _FAREWELL_BY_HOUR[datetime.datetime.now().hour]
         
-        # Message basé sur l'heure
-        if 6 <= current_hour < 18:
-            farewell = "Bonne journée"
-        elif 18 <= current_hour < 22:
-            farewell = "Bonne soirée"
-        else:
-            farewell = "Bonne nuit"
-        
-        # Ajouter des informations détaillées sur la session si disponible
-        session_info = ""
-        if hasattr(self, 'total_commands') and self.total_commands > 0:
-            session_info = f" Nous avons traité {self.total_commands} commandes ensemble durant cette session."
-        
-        # Message complet sans restriction de longueur
-        farewell_parts = [
-            "Interface vocale Peer omnisciente en cours d'arrêt. {farewell}",
-            session_info,
-        ]
-        
-        return " ".join(farewell_parts)
+        # Ajouter des informations sur la session si disponible
+        total_commands = getattr(self, 'total_commands', 0)
+        if total_commands > 0:
+            return farewell + " Nous avons traité %d commandes ensemble durant cette session." % total_commands
+        return farewell
 
     def _monitor_system_health(self):
         """Surveille l'état du système et les performances."""
         try:
            
             # Vérification basique de la santé du système
-            import psutil
-            
             # Monitorer l'utilisation CPU (si trop élevée, réduire la fréquence de traitement)
             cpu_percent = psutil.cpu_percent(interval=None)
             if cpu_percent > 80:
@@ -2977,7 +3139,7 @@ class OmniscientSUI:
                 self.logger.error("❌ Thread de commandes arrêté")
                 
         except Exception as e:
-            self.logger.debug(f"Erreur lors du monitoring: {e}")
+            self.logger.debug("Erreur lors du monitoring: %s", e)
 
 def main():
     """Point d'entrée principal de l'interface vocale omnisciente."""
@@ -2996,8 +3158,8 @@ def main():
 
         # Maintenir l'application en vie
         try:
-            while sui.running:
-                time.sleep(0.1)
+            if sui.running:
+                sui.wait_until_stopped()
         except KeyboardInterrupt:
             print("\n🛑 Arrêt demandé par l'utilisateur")
             sui.stop()
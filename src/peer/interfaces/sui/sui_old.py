@@ -447,7 +447,7 @@ class SUI:
             self.speaking = True
             try:
                 self.logger.info(f"Vocalisation: {text}")
-                self.tts_adapter.speak(text)
+                self.tts_adapter.speak(text, wait=True)
             except Exception as e:
                 self.logger.error(f"Erreur lors de la vocalisation: {e}")
                 print(f"[TTS Error] {text}")  # Fallback en mode texte
@@ -853,7 +853,7 @@ if __name__ == "__main__":
         with self.tts_lock:
             try:
                 self.speaking = True
-                self.tts_adapter.speak(text)
+                self.tts_adapter.speak(text, wait=True)
             except Exception as e:
                 self.logger.error(f"Erreur lors de la vocalisation: {e}")
                 print(f"TTS (erreur): {text}")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests des caches de réponses de l'API REST
+
+Vérifie :
+- l'expiration (TTL) et la taille bornée du cache des réponses sérialisées
+- le statut mutualisé pendant _STATUS_CACHE_TTL seulement
+- l'aide et les capacités recalculées quand le registre des capacités change
+"""
+
+import sys
+import os
+import types
+from contextlib import contextmanager
+from unittest import mock
+
+import pytest
+
+# Ajouter le chemin src au PYTHONPATH
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# FastAPI n'est installé qu'avec l'extra "api"
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")  # Requis par TestClient
+
+from fastapi.testclient import TestClient
+
+from peer.core import CommandType
+from peer.core.api import CommandCapability
+from peer.interfaces.api import api
+
+
+@contextmanager
+def _frozen_clock(start: float = 1000.0):
+    """Remplace l'horloge du module API par une horloge avancée à la main."""
+    clock = types.SimpleNamespace(now=start)
+    with mock.patch.object(api, "time", types.SimpleNamespace(monotonic=lambda: clock.now)):
+        api._response_cache.clear()
+        try:
+            yield clock
+        finally:
+            api._response_cache.clear()
+
+
+@contextmanager
+def _counted_client():
+    """Client de test dont les commandes exécutées par le daemon sont comptées."""
+    with TestClient(api.app) as client:
+        daemon = client.app.state.daemon
+        with mock.patch.object(daemon, "execute_command", wraps=daemon.execute_command) as execute:
+            yield client, daemon, execute
+
+
+def _calls(execute, command: CommandType) -> int:
+    """Nombre de requêtes du type donné reçues par le daemon."""
+    return sum(1 for call in execute.call_args_list if call.args[0].command == command)
+
+
+def test_response_cache_ttl():
+    """Une entrée est servie jusqu'à son expiration, puis ignorée"""
+    print("=== Test de l'expiration du cache de réponses ===")
+    with _frozen_clock() as clock:
+        api.cache_response("cle", {"valeur": 1}, ttl=1.0)
+
+        clock.now += 0.5
+        cached = api.get_cached_response("cle")
+        assert cached is not None
+        assert cached.body == api._dumps({"valeur": 1})
+
+        clock.now += 1.0
+        assert api.get_cached_response("cle") is None
+    print("✓ Expiration vérifiée\n")
+
+
+def test_response_cache_bounded():
+    """Le cache ne dépasse jamais _RESPONSE_CACHE_MAX_ENTRIES entrées"""
+    print("=== Test de la taille du cache de réponses ===")
+    with _frozen_clock():
+        for index in range(api._RESPONSE_CACHE_MAX_ENTRIES + 1):
+            api.cache_response(("aide", index), {"index": index})
+            assert len(api._response_cache) <= api._RESPONSE_CACHE_MAX_ENTRIES
+        assert api.get_cached_response(("aide", api._RESPONSE_CACHE_MAX_ENTRIES)) is not None
+    print("✓ Taille bornée vérifiée\n")
+
+
+def test_status_cached_briefly():
+    """Le statut n'est redemandé au daemon qu'après _STATUS_CACHE_TTL"""
+    print("=== Test du cache du statut ===")
+    with _frozen_clock() as clock, _counted_client() as (client, daemon, execute):
+        first = client.get("/status")
+        second = client.get("/status")
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert _calls(execute, CommandType.STATUS) == 1
+
+        clock.now += api._STATUS_CACHE_TTL + 0.1
+        assert client.get("/status").status_code == 200
+        assert _calls(execute, CommandType.STATUS) == 2
+    print("✓ Cache du statut vérifié\n")
+
+
+def test_help_and_capabilities_follow_registry():
+    """Enregistrer une capacité invalide l'aide et les capacités en cache"""
+    print("=== Test de l'invalidation par le registre des capacités ===")
+    with _frozen_clock(), _counted_client() as (client, daemon, execute):
+        client.get("/help")
+        client.get("/help")
+        assert _calls(execute, CommandType.HELP) == 1
+
+        client.get("/capabilities")
+        capabilities_calls = _calls(execute, CommandType.CAPABILITIES)
+
+        daemon.register_capability("test_cache", CommandCapability(
+            command=CommandType.HELP,
+            description="Capacité ajoutée par le test"
+        ))
+        try:
+            client.get("/help")
+            assert _calls(execute, CommandType.HELP) == 2
+
+            client.get("/capabilities")
+            client.get("/capabilities")
+            assert _calls(execute, CommandType.CAPABILITIES) == capabilities_calls + 1
+        finally:
+            daemon.capabilities.pop("test_cache", None)
+    print("✓ Invalidation par le registre vérifiée\n")
+
+
+def main():
+    """Fonction principale de test"""
+    print("=== Tests des caches de l'API REST ===\n")
+
+    try:
+        test_response_cache_ttl()
+        test_response_cache_bounded()
+        test_status_cached_briefly()
+        test_help_and_capabilities_follow_registry()
+
+        print("=== Tous les tests sont réussis! ===")
+
+    except Exception as e:
+        print(f"❌ Erreur lors des tests: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Tests des caches du moteur NLP hybride
+
+Vérifie, sans aucun modèle chargé (background_loading=False) :
+- le cache LRU des intentions (copie à la lecture, éviction, vidage)
+- l'invalidation des analyses commencées avant un vidage du cache
+- le préchargement des énoncés suivants après un vidage
+- la persistance de la matrice d'exemples sémantiques et son invalidation
+- la marge exigée des prototypes BERT et l'exclusion des intentions d'arrêt
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Ajouter le chemin src au PYTHONPATH
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from peer.core import CommandType
+from peer.interfaces.sui import nlp_engine
+from peer.interfaces.sui.nlp_engine import HybridNLPEngine
+
+
+def _new_engine() -> HybridNLPEngine:
+    """Moteur sans préchargement, pour que seuls les appels du test remplissent le cache."""
+    engine = HybridNLPEngine(background_loading=False)
+    engine.update_config({"enable_prefetch": False})
+    return engine
+
+
+def test_intent_cache_copy_on_hit():
+    """Un résultat lu dans le cache est une copie : le modifier ne touche pas le cache"""
+    print("=== Test de la copie à la lecture du cache d'intentions ===")
+    engine = _new_engine()
+
+    first = engine.extract_intent("aide moi")
+    first.parameters["marqueur"] = True
+    second = engine.extract_intent("aide moi")
+
+    assert engine._intent_cache_hits == 1
+    assert second.command_type == first.command_type
+    assert "marqueur" not in second.parameters
+    assert "marqueur" not in engine._intent_result_cache["aide moi"].parameters
+    print("✓ Copie à la lecture vérifiée\n")
+
+
+def test_intent_cache_eviction():
+    """Au-delà de max_cache_size, l'entrée la moins récemment utilisée est évincée"""
+    print("=== Test de l'éviction LRU du cache d'intentions ===")
+    engine = _new_engine()
+    engine.update_config({"max_cache_size": 2})
+
+    engine.extract_intent("aide moi")
+    engine.extract_intent("quel est le statut")
+    engine.extract_intent("aide moi")  # Devient l'entrée la plus récente
+    engine.extract_intent("quelle heure est-il")
+
+    assert list(engine._intent_result_cache) == ["aide moi", "quelle heure est-il"]
+    print("✓ Éviction LRU vérifiée\n")
+
+
+def test_update_config_clears_cache():
+    """Modifier la configuration vide le cache : les seuils changent les résultats"""
+    print("=== Test du vidage du cache par update_config ===")
+    engine = _new_engine()
+
+    engine.extract_intent("aide moi")
+    assert engine._intent_result_cache
+    engine.update_config({"confidence_threshold": 0.5})
+    assert not engine._intent_result_cache
+    print("✓ Vidage par update_config vérifié\n")
+
+
+def test_stale_analysis_not_cached():
+    """Une analyse commencée avant un vidage du cache n'y est pas stockée"""
+    print("=== Test de la génération du cache d'intentions ===")
+    engine = _new_engine()
+
+    generation = engine._intent_cache_generation
+    result = engine.extract_intent("aide moi")
+    engine._clear_intent_cache()  # Par exemple : fin du chargement des modèles
+    engine._store_cached_intent("aide moi", result, generation)
+    assert "aide moi" not in engine._intent_result_cache
+
+    engine._store_cached_intent("aide moi", result, engine._intent_cache_generation)
+    assert "aide moi" in engine._intent_result_cache
+    print("✓ Résultats obsolètes écartés\n")
+
+
+def test_prefetch_after_cache_clear():
+    """Après un vidage, le successeur habituel est réanalysé d'avance et lu depuis le cache"""
+    print("=== Test du préchargement des énoncés suivants ===")
+    engine = HybridNLPEngine(background_loading=False)
+
+    for text in ("aide moi", "quel est le statut", "aide moi", "quel est le statut"):
+        engine.extract_intent(text)
+    fastpath_hits = engine._fastpath_hits
+
+    engine.update_config({"confidence_threshold": 0.7})
+    engine.extract_intent("aide moi")
+    engine._prefetch_executor.submit(lambda: None).result()  # Attendre la fin du lot
+
+    assert engine._prefetched == 1
+    # Les analyses de préchargement ne comptent pas dans les statistiques
+    assert engine._fastpath_hits == fastpath_hits
+    hits = engine._intent_cache_hits
+    engine.extract_intent("quel est le statut")
+    assert engine._intent_cache_hits == hits + 1
+    print("✓ Préchargement vérifié\n")
+
+
+class _FakeSentenceModel:
+    """Encodeur déterministe qui compte ses appels."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, texts, **kwargs):
+        self.calls += 1
+        rng = np.random.default_rng(len(texts))
+        vectors = rng.normal(size=(len(texts), 8))
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class _OtherBackendModel(_FakeSentenceModel):
+    """Même encodeur sous un autre nom de classe (autre backend)."""
+
+
+def test_example_matrix_persistence():
+    """La matrice d'exemples est relue du disque, et recalculée si le modèle, le backend ou les exemples changent"""
+    print("=== Test de la persistance de la matrice d'exemples ===")
+    engine = _new_engine()
+
+    with tempfile.TemporaryDirectory() as cache_dir, \
+            mock.patch.object(nlp_engine, "_EXAMPLE_MATRIX_CACHE_DIR", Path(cache_dir)):
+        model = _FakeSentenceModel()
+        engine.sentence_model = model
+        engine.sentence_model_name = "modele-a"
+
+        engine._build_semantic_index()
+        assert model.calls == 1
+        assert engine._example_matrix.dtype == np.float16
+        assert len(os.listdir(cache_dir)) == 1
+
+        # Même modèle, même backend, mêmes exemples : lecture du disque
+        engine._build_semantic_index()
+        assert model.calls == 1
+        assert isinstance(engine._example_matrix, np.memmap)
+
+        # Autre modèle
+        engine.sentence_model_name = "modele-b"
+        engine._build_semantic_index()
+        assert model.calls == 2
+
+        # Autre backend
+        engine.sentence_model = _OtherBackendModel()
+        engine._build_semantic_index()
+        assert engine.sentence_model.calls == 1
+
+        # Autres exemples
+        engine.intent_patterns[CommandType.HELP]["semantic_examples"].append("montre-moi le mode d'emploi")
+        engine._build_semantic_index()
+        assert engine.sentence_model.calls == 2
+        assert len(os.listdir(cache_dir)) == 4
+    print("✓ Persistance et invalidation vérifiées\n")
+
+
+def _install_fake_bert(engine: HybridNLPEngine, noise: float):
+    """Remplace l'encodeur BERT par des vecteurs groupés autour d'un centre par intention."""
+    rng = np.random.default_rng(0)
+    centers = {command_type: rng.normal(size=32) for command_type in engine.intent_patterns}
+    owners = {
+        example: command_type
+        for command_type, patterns in engine.intent_patterns.items()
+        for example in patterns.get("semantic_examples", [])
+    }
+
+    def encode(texts):
+        vectors = np.array([
+            centers[owners[text]] + noise * rng.normal(size=32) if text in owners else rng.normal(size=32)
+            for text in texts
+        ])
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    engine._bert_encode = encode
+    engine.bert_enabled = True
+    engine._build_bert_prototypes()
+
+
+def test_bert_margin_and_quit_exclusion():
+    """BERT seul ne propose jamais d'arrêt et exige une avance sur le deuxième prototype"""
+    print("=== Test des seuils BERT ===")
+    engine = _new_engine()
+    _install_fake_bert(engine, noise=0.3)
+
+    assert engine._bert_heldout["enabled"]
+    assert engine._bert_heldout["precision"] >= nlp_engine._BERT_MIN_HELDOUT_PRECISION
+
+    help_example = engine.intent_patterns[CommandType.HELP]["semantic_examples"][0]
+    detections = engine._analyze_with_bert_multi(help_example, {})
+    assert [command_type for command_type, _, _ in detections] == [CommandType.HELP]
+
+    quit_example = engine.intent_patterns[CommandType.DIRECT_QUIT]["semantic_examples"][0]
+    assert engine._analyze_with_bert_multi(quit_example, {}) == []
+
+    # Deux prototypes à égalité : aucune intention n'est retenue
+    scores = np.array([0.9, 0.9, 0.5], dtype=np.float32)
+    assert engine._select_bert_prototype(scores) is None
+    assert engine._select_bert_prototype(np.array([0.95, 0.9, 0.5], dtype=np.float32)) == 0
+    print("✓ Marge et exclusion des arrêts vérifiées\n")
+
+
+def test_bert_disabled_on_poor_heldout_precision():
+    """Des prototypes indiscernables sur les exemples tenus à l'écart désactivent BERT"""
+    print("=== Test du contrôle BERT sur exemples tenus à l'écart ===")
+    engine = _new_engine()
+    _install_fake_bert(engine, noise=50.0)
+    engine.update_config({"bert_similarity_threshold": -1.0, "bert_margin": 0.0})
+
+    assert not engine._bert_heldout["enabled"]
+    help_example = engine.intent_patterns[CommandType.HELP]["semantic_examples"][0]
+    assert engine._analyze_with_bert_multi(help_example, {}) == []
+    print("✓ Désactivation de BERT vérifiée\n")
+
+
+def main():
+    """Fonction principale de test"""
+    print("=== Tests des caches du moteur NLP ===\n")
+
+    try:
+        test_intent_cache_copy_on_hit()
+        test_intent_cache_eviction()
+        test_update_config_clears_cache()
+        test_stale_analysis_not_cached()
+        test_prefetch_after_cache_clear()
+        test_example_matrix_persistence()
+        test_bert_margin_and_quit_exclusion()
+        test_bert_disabled_on_poor_heldout_precision()
+
+        print("=== Tous les tests sont réussis! ===")
+
+    except Exception as e:
+        print(f"❌ Erreur lors des tests: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
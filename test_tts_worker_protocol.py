@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tests du protocole du processus de vocalisation persistant
+
+Vérifie, sans pyttsx3 :
+- les réponses "OK" / "ERR <message>" de _tts_worker.serve pour chaque requête JSON
+- l'interprétation de ces réponses par SimpleTTSAdapter._worker_call, à travers
+  un vrai processus qui sert le protocole avec un moteur factice
+- l'abandon sans nouvel envoi d'une requête qui dépasse le délai imparti
+"""
+
+import io
+import sys
+import os
+import subprocess
+import textwrap
+import time
+from unittest import mock
+
+# Ajouter le chemin src au PYTHONPATH
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from peer.infrastructure.adapters import _tts_worker
+from peer.infrastructure.adapters.simple_tts_adapter import SimpleTTSAdapter, _PACKAGE_ROOT
+
+
+class _FakeEngine:
+    """Moteur pyttsx3 factice : enregistre les appels, échoue sur "boom", reste bloqué sur "bloque"."""
+
+    def __init__(self):
+        self.properties = {}
+        self.spoken = []
+        self.saved = []
+
+    def setProperty(self, name, value):
+        self.properties[name] = value
+
+    def say(self, text):
+        if text == "boom":
+            raise RuntimeError("synthèse impossible")
+        if text == "bloque":
+            time.sleep(60)
+        self.spoken.append(text)
+
+    def save_to_file(self, text, out):
+        self.saved.append((text, out))
+
+    def runAndWait(self):
+        pass
+
+
+def _serve(lines):
+    """Sert les lignes données et retourne les réponses du processus."""
+    engine = _FakeEngine()
+    replies = []
+    with mock.patch.object(sys, "stdin", io.StringIO("\n".join(lines) + "\n")):
+        _tts_worker.serve(engine, replies.append)
+    return engine, replies
+
+
+def test_serve_replies():
+    """Une réponse par requête non vide : OK en cas de succès, ERR avec le message sinon"""
+    print("=== Test des réponses du processus de vocalisation ===")
+    engine, replies = _serve([
+        '{"text": "bonjour", "rate": 180, "volume": 0.5}',
+        '',
+        '{"text": "fichier", "out": "/tmp/peer_test.wav"}',
+        '{"batch": [{"text": "un", "out": "/tmp/1.wav"}, {"text": "deux", "out": "/tmp/2.wav"}]}',
+        '{"text": "boom"}',
+        'pas du json',
+        '{"rate": 150}',
+    ])
+
+    assert replies[:3] == ["OK", "OK", "OK"]
+    assert replies[3] == "ERR synthèse impossible"
+    assert replies[4].startswith("ERR ")
+    assert replies[5].startswith("ERR ")
+    assert len(replies) == 6
+
+    assert engine.spoken == ["bonjour"]
+    assert engine.saved == [("fichier", "/tmp/peer_test.wav"), ("un", "/tmp/1.wav"), ("deux", "/tmp/2.wav")]
+    # Les paramètres de voix sont appliqués à chaque requête, avec leurs valeurs par défaut
+    assert engine.properties == {"rate": 150, "volume": 1.0}
+    print("✓ Réponses OK/ERR vérifiées\n")
+
+
+# Processus servant le protocole avec le moteur factice de ce module
+_FAKE_WORKER = textwrap.dedent("""
+    import sys
+    sys.path[:0] = [{root!r}, {here!r}]
+    from peer.infrastructure.adapters import _tts_worker
+    from test_tts_worker_protocol import _FakeEngine
+
+    def reply(status):
+        sys.stdout.write(status + "\\n")
+        sys.stdout.flush()
+
+    _tts_worker.serve(_FakeEngine(), reply)
+""").format(root=_PACKAGE_ROOT, here=os.path.dirname(os.path.abspath(__file__)))
+
+
+def _fake_worker_starter(adapter, starts):
+    """Remplace le lancement du processus par celui du processus factice, en comptant les lancements."""
+    def start_fake_worker():
+        starts.append(True)
+        adapter._worker = subprocess.Popen(
+            [sys.executable, "-u", "-c", _FAKE_WORKER],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8"
+        )
+    return mock.patch.object(adapter, "_start_worker", start_fake_worker)
+
+
+def test_adapter_worker_call():
+    """L'adaptateur traduit OK en True et ERR en False, et relance un processus terminé"""
+    print("=== Test des requêtes de l'adaptateur au processus ===")
+    adapter = SimpleTTSAdapter()
+    starts = []
+
+    try:
+        with _fake_worker_starter(adapter, starts):
+            assert adapter._worker_request("bonjour") is True
+            assert adapter._worker_request("boom") is False
+            assert adapter._worker_call({"batch": [{"text": "un", "out": "/tmp/1.wav"}]}) is True
+            assert len(starts) == 1
+
+            # Processus terminé entre deux requêtes : relancé une fois
+            adapter._worker.kill()
+            adapter._worker.wait()
+            assert adapter._worker_request("encore") is True
+            assert len(starts) == 2
+    finally:
+        adapter._stop_worker()
+        adapter.shutdown()
+    print("✓ Requêtes de l'adaptateur vérifiées\n")
+
+
+def test_adapter_worker_timeout():
+    """Une requête sans réponse dans le délai est abandonnée, jamais renvoyée"""
+    print("=== Test du délai des requêtes au processus ===")
+    adapter = SimpleTTSAdapter()
+    starts = []
+
+    try:
+        with _fake_worker_starter(adapter, starts):
+            assert adapter._worker_request("bonjour") is True
+            hung_worker = adapter._worker
+
+            started = time.monotonic()
+            assert adapter._worker_call({"text": "bloque"}, timeout=0.5) is False
+            elapsed = time.monotonic() - started
+            assert elapsed < 1.0, f"requête renvoyée après le délai ({elapsed:.2f}s)"
+            assert len(starts) == 1
+            assert hung_worker.wait(timeout=2) is not None
+
+            # Le processus tué est relancé à la requête suivante
+            assert adapter._worker_request("encore") is True
+            assert len(starts) == 2
+    finally:
+        adapter._stop_worker()
+        adapter.shutdown()
+    print("✓ Abandon sur délai vérifié\n")
+
+
+def main():
+    """Fonction principale de test"""
+    print("=== Tests du protocole de vocalisation ===\n")
+
+    try:
+        test_serve_replies()
+        test_adapter_worker_call()
+        test_adapter_worker_timeout()
+
+        print("=== Tous les tests sont réussis! ===")
+
+    except Exception as e:
+        print(f"❌ Erreur lors des tests: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())